@@ -1,17 +1,19 @@
 import pdfplumber
 import docx
 import re
-import spacy
 from typing import List, Dict, Optional
 import json
+from ml.model_registry import nlp_model_name, registry
+from ml.utils.role_matrix import RoleSkillMatrix
+from ml.utils.skill_matcher import SkillMatcher
 
-# Load spaCy model
+# Load spaCy model; only named entities are needed (for the candidate name)
 try:
-    nlp = spacy.load("en_core_web_sm")
-except:
+    nlp = registry.get(nlp_model_name("ner_only"))
+except OSError:
     import subprocess
     subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
+    nlp = registry.get(nlp_model_name("ner_only"))
 
 # Common skills dataset
 SKILLS_DATASET = {
@@ -44,6 +46,9 @@ SKILLS_DATASET = {
     ]
 }
 
+# Compiled once so each resume is scanned in a single pass
+SKILL_MATCHER = SkillMatcher(SKILLS_DATASET)
+
 # Job role mapping based on skills
 JOB_ROLES = {
     "Frontend Developer": {
@@ -72,6 +77,9 @@ JOB_ROLES = {
     }
 }
 
+# Required skills weigh 1, preferred skills 0.5
+ROLE_MATRIX = RoleSkillMatrix(JOB_ROLES, required_weight=1.0, preferred_weight=0.5)
+
 class ResumeParser:
     @staticmethod
     def extract_text_from_pdf(file_path: str) -> str:
@@ -123,50 +131,25 @@ class ResumeParser:
     @staticmethod
     def extract_skills(text: str) -> Dict[str, List[str]]:
         """Extract skills from text"""
-        text = text.lower()
         found_skills = {category: [] for category in SKILLS_DATASET.keys()}
         
-        for category, skills in SKILLS_DATASET.items():
-            for skill in skills:
-                if re.search(r'\b' + re.escape(skill) + r'\b', text):
-                    found_skills[category].append(skill)
+        for skill, category in SKILL_MATCHER.find_skills(text):
+            found_skills[category].append(skill)
         
         return found_skills
 
     @staticmethod
-    def suggest_job_roles(skills: Dict[str, List[str]]) -> List[Dict[str, float]]:
+    def suggest_job_roles(skills: Dict[str, List[str]], top_k: Optional[int] = None) -> List[Dict[str, float]]:
         """Suggest job roles based on extracted skills"""
         # Flatten skills list
-        all_skills = [skill.lower() for sublist in skills.values() for skill in sublist]
-        
-        role_scores = []
-        for role, requirements in JOB_ROLES.items():
-            score = 0
-            total_required = len(requirements["required_skills"])
-            total_preferred = len(requirements["preferred_skills"])
-            
-            # Check required skills
-            for skill in requirements["required_skills"]:
-                if skill in all_skills:
-                    score += 1
-            
-            # Check preferred skills
-            for skill in requirements["preferred_skills"]:
-                if skill in all_skills:
-                    score += 0.5
-            
-            # Calculate percentage match
-            max_score = total_required + (total_preferred * 0.5)
-            percentage_match = (score / max_score) * 100 if max_score > 0 else 0
-            
-            if percentage_match >= 30:  # Only include roles with at least 30% match
-                role_scores.append({
-                    "role": role,
-                    "match_percentage": round(percentage_match, 2)
-                })
+        all_skills = [skill for sublist in skills.values() for skill in sublist]
         
-        # Sort by match percentage
-        return sorted(role_scores, key=lambda x: x["match_percentage"], reverse=True)
+        # Score every role in one sparse product; only include roles with
+        # at least 30% match, sorted by match percentage
+        return [
+            {"role": role, "match_percentage": round(percentage, 2)}
+            for role, percentage in ROLE_MATRIX.top_k(all_skills, k=top_k, min_percentage=30)
+        ]
 
     def parse_resume(self, file_path: str, file_type: str) -> Dict:
         """Main method to parse resume and extract information"""
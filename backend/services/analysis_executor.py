@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+
+class AnalysisOverloadedError(RuntimeError):
+    """Raised when the submission queue is full"""
+
+
+class AnalysisTimeoutError(TimeoutError):
+    """Raised when an analysis does not finish within the request timeout"""
+
+
+# Per-process service used by the pool workers
+_worker_service = None
+# Barrier shared by all workers; start() holds every worker on it at once
+_start_barrier = None
+
+
+def _init_worker(warmup: bool, start_barrier):
+    """Build the analysis service once per worker process"""
+    global _worker_service, _start_barrier
+    from backend.services.resume_analyzer_service import ResumeAnalyzerService
+
+    _start_barrier = start_barrier
+    _worker_service = ResumeAnalyzerService()
+    if warmup:
+        _worker_service.warmup()
+
+
+def _run_analysis(resume_text: str) -> Dict:
+    return _worker_service._analyze_text(resume_text)
+
+
+def _ping(timeout: float) -> int:
+    """
+    Wait until every worker has reached this call, then report the pid
+
+    A worker blocked here cannot take another ping, so one ping per worker
+    forces the pool to start and initialize all of them.
+    """
+    _start_barrier.wait(timeout)
+    return os.getpid()
+
+
+class AnalysisExecutor:
+    """
+    Runs the CPU-bound resume analysis pipeline in worker processes.
+
+    Each worker loads the models once, so a single service instance uses
+    every core instead of serializing behind the GIL. Submissions beyond
+    max_pending are refused immediately with AnalysisOverloadedError rather
+    than queued without bound, and each request waits at most timeout
+    seconds. A request that times out keeps its slot until its worker
+    finishes, so the pending count always reflects real load.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 timeout: float = 30.0, warmup: bool = True, start_timeout: float = 600.0):
+        """
+        Args:
+            workers: Worker processes, defaults to the CPU count
+            max_pending: Analyses queued or running at once, defaults to
+                twice the number of workers
+            timeout: Seconds a request waits for its analysis
+            warmup: Load the models when each worker starts
+            start_timeout: Seconds start() waits for all workers to be ready
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.pending = 0
+        # Workers are spawned rather than forked so they never inherit
+        # threads or model state from the serving process
+        context = multiprocessing.get_context('spawn')
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(warmup, context.Barrier(self.workers))
+        )
+
+    async def start(self):
+        """
+        Start every worker and wait until its models are loaded
+
+        Each ping blocks on a barrier until all workers hold one, so every
+        worker gets exactly one and none is left cold for the first request.
+        """
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*[
+            loop.run_in_executor(self._pool, _ping, self.start_timeout)
+            for _ in range(self.workers)
+        ])
+        return sorted(pids)
+
+    async def run(self, resume_text: str) -> Dict:
+        """
+        Analyze resume text in a worker process
+        """
+        if self.pending >= self.max_pending:
+            raise AnalysisOverloadedError(
+                f"Analysis queue is full ({self.max_pending} pending), try again later"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = self._pool.submit(_run_analysis, resume_text)
+        self.pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise AnalysisTimeoutError(
+                f"Analysis did not finish within {self.timeout} seconds"
+            )
+
+    def _release(self):
+        self.pending -= 1
+
+    def stats(self) -> Dict:
+        """
+        Current load of the executor
+        """
+        return {
+            'workers': self.workers,
+            'pending': self.pending,
+            'max_pending': self.max_pending
+        }
+
+    def close(self):
+        """
+        Shut down the worker processes
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
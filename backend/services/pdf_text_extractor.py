@@ -0,0 +1,153 @@
+import asyncio
+import io
+import multiprocessing
+import os
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+import PyPDF2
+
+
+class PdfTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured byte cap"""
+
+
+# Document most recently parsed by a page worker, as (path, reader)
+_worker_document = None
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> str:
+    """
+    Extract the text of pages [start, stop) from a PDF file
+
+    Paths are unique per extraction, so a worker given several page ranges
+    of one document reads and parses the file only once.
+    """
+    global _worker_document
+    if _worker_document is None or _worker_document[0] != path:
+        _worker_document = None
+        with open(path, 'rb') as handle:
+            _worker_document = (path, PyPDF2.PdfReader(io.BytesIO(handle.read())))
+    pdf_reader = _worker_document[1]
+    return ''.join(pdf_reader.pages[index].extract_text() for index in range(start, stop))
+
+
+def _write_document(content: bytes) -> str:
+    """Write PDF bytes to a uniquely named temporary file"""
+    path = os.path.join(tempfile.gettempdir(), f'pdf-extract-{uuid.uuid4().hex}.pdf')
+    with open(path, 'wb') as handle:
+        handle.write(content)
+    return path
+
+
+def _remove_document(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _extract_if_short(content: bytes, max_pages: int, parallel_min_pages: int) -> Tuple[Optional[str], int]:
+    """
+    Extract a short PDF in one go; for long ones only report the page count
+    """
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+    page_count = min(len(pdf_reader.pages), max_pages)
+    if page_count >= parallel_min_pages:
+        return None, page_count
+    return ''.join(pdf_reader.pages[index].extract_text() for index in range(page_count)), page_count
+
+
+class PdfTextExtractor:
+    """
+    Extracts PDF text off the event loop.
+
+    Decoding runs in a bounded thread pool so a large upload never blocks
+    other requests. Documents with many pages are split into page ranges
+    that are decoded in parallel worker processes, since PyPDF2 is pure
+    Python and would otherwise serialize behind the GIL. Those workers are
+    spawned rather than forked from the serving process, and the document
+    reaches them once, as a temporary file, instead of with every page
+    range. Uploads over
+    max_bytes are rejected and only the first max_pages pages are read.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32,
+                 max_bytes: int = 10 * 1024 * 1024, max_pages: int = 50,
+                 parallel_min_pages: int = 16, pages_per_chunk: int = 8,
+                 page_workers: int = 2):
+        """
+        Args:
+            max_workers: Threads decoding PDFs
+            max_pending: Extractions admitted at once; further requests wait
+            max_bytes: Largest accepted upload
+            max_pages: Pages read per document, the rest are ignored
+            parallel_min_pages: Page count from which extraction is page-parallel
+            pages_per_chunk: Pages decoded per worker task in parallel mode
+            page_workers: Processes used for page-parallel extraction
+        """
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.parallel_min_pages = parallel_min_pages
+        self.pages_per_chunk = pages_per_chunk
+        self.max_pending = max_pending
+        self.page_workers = page_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pdf-extract')
+        self._page_executor = None
+        self._semaphore = None
+
+    @property
+    def version(self) -> str:
+        """
+        Settings that decide which text is extracted from an upload
+        """
+        return f'pdf:max_pages={self.max_pages}:max_bytes={self.max_bytes}'
+
+    async def extract(self, content: bytes) -> str:
+        """
+        Extract the text of all (up to max_pages) pages of a PDF
+        """
+        if len(content) > self.max_bytes:
+            raise PdfTooLargeError(
+                f"PDF is {len(content)} bytes, the limit is {self.max_bytes} bytes"
+            )
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            text, page_count = await loop.run_in_executor(
+                self._executor, _extract_if_short,
+                content, self.max_pages, self.parallel_min_pages
+            )
+            if text is not None:
+                return text
+
+            if self._page_executor is None:
+                self._page_executor = ProcessPoolExecutor(
+                    max_workers=self.page_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+
+            path = await loop.run_in_executor(self._executor, _write_document, content)
+            try:
+                chunks = await asyncio.gather(*[
+                    loop.run_in_executor(
+                        self._page_executor, _extract_page_range,
+                        path, start, min(start + self.pages_per_chunk, page_count)
+                    )
+                    for start in range(0, page_count, self.pages_per_chunk)
+                ])
+            finally:
+                _remove_document(path)
+            return ''.join(chunks)
+
+    def close(self):
+        """
+        Shut down the worker pools
+        """
+        self._executor.shutdown(wait=False)
+        if self._page_executor is not None:
+            self._page_executor.shutdown(wait=False)
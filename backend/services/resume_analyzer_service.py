@@ -1,145 +1,255 @@
 from fastapi import UploadFile, HTTPException
-import PyPDF2
-import io
-from typing import Dict, List
+import copy
+from datetime import datetime
+import hashlib
+from functools import cached_property
+from typing import Dict, List, Tuple
 import json
 from ml.resume_analyzer import ResumeAnalyzer
 from ml.job_analyzer import JobAnalyzer
 from ml.skill_analyzer import SkillAnalyzer
+from ml.model_registry import (
+    SKILL_EMBEDDINGS_PATH, ZERO_SHOT_MODEL, file_digest, nlp_model_name, registry
+)
+from ml.nlp_pipeline import DEFAULT_MODEL
+from ml.utils.cache import LRUCache
+from backend.services.pdf_text_extractor import PdfTextExtractor, PdfTooLargeError
+from backend.services.analysis_executor import (
+    AnalysisExecutor, AnalysisOverloadedError, AnalysisTimeoutError
+)
 
 class ResumeAnalyzerService:
-    def __init__(self):
+    def __init__(self, cache=None, pdf_extractor: PdfTextExtractor = None,
+                 executor: AnalysisExecutor = None):
+        """
+        Args:
+            cache: Analysis result cache with get/put, such as ml.utils.cache
+                LRUCache or DiskCache; defaults to an in-memory LRU cache
+            pdf_extractor: Off-loop PDF text extractor with its page and
+                byte caps; defaults to PdfTextExtractor()
+            executor: Process pool that runs the analysis pipeline; without
+                one the pipeline runs inline in this process
+        """
         self.resume_analyzer = ResumeAnalyzer()
         self.job_analyzer = JobAnalyzer()
         self.skill_analyzer = SkillAnalyzer()
+        self.cache = cache if cache is not None else LRUCache(
+            maxsize=1024, max_bytes=64 * 1024 * 1024
+        )
+        self.pdf_extractor = pdf_extractor or PdfTextExtractor()
+        self.executor = executor
         
+    @property
+    def analysis_version(self) -> str:
+        """
+        Version of everything that shapes an analysis result
+        """
+        return '|'.join([
+            DEFAULT_MODEL,
+            self.resume_analyzer.pipeline_profile,
+            ZERO_SHOT_MODEL,
+            self.resume_analyzer.taxonomy_version,
+            self.embeddings_version,
+            self.job_analyzer.data_version,
+            self.pdf_extractor.version
+        ])
+
+    @cached_property
+    def embeddings_version(self) -> str:
+        """
+        Digest of the skill embeddings artifact, hashed once since the
+        registry keeps the embeddings it loaded for the process lifetime
+        """
+        return file_digest(SKILL_EMBEDDINGS_PATH)
+
+    def _cache_key(self, content: bytes) -> str:
+        """
+        Content-addressed cache key: uploaded bytes plus analysis version
+        """
+        digest = hashlib.sha256(content)
+        digest.update(self.analysis_version.encode('utf-8'))
+        return digest.hexdigest()
+
+    def cache_stats(self) -> Dict:
+        """
+        Hit/miss counters and size of the analysis cache
+        """
+        return self.cache.stats()
+
+    def warmup(self) -> Dict:
+        """
+        Load the models used by resume analysis before serving traffic
+        """
+        return registry.warmup([
+            nlp_model_name(self.resume_analyzer.pipeline_profile),
+            'zero_shot_classifier'
+        ])
+
     async def analyze_resume(self, file: UploadFile) -> Dict:
         """
         Analyze uploaded resume and provide comprehensive analysis
         """
         try:
-            # Read PDF content
-            content = await file.read()
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            
-            # Extract text from all pages
-            resume_text = ""
-            for page in pdf_reader.pages:
-                resume_text += page.extract_text()
+            # Read PDF content, never more than the byte cap allows
+            content = await self._read_upload(file)
             
-            # Analyze resume using ML components
-            resume_analysis = self.resume_analyzer.analyze_resume(resume_text)
+            # Repeat uploads of the same bytes are served from the cache
+            cache_key = self._cache_key(content)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
             
-            # Get skills from resume with confidence scores
-            extracted_skills = resume_analysis['skills']
+            # Decode the PDF without blocking the event loop
+            resume_text = await self.pdf_extractor.extract(content)
+            if self.executor is not None:
+                result = await self.executor.run(resume_text)
+            else:
+                result = self._analyze_text(resume_text)
             
-            # Analyze technical skills
-            technical_skills = {
-                skill['name']: skill['confidence']
-                for skill in extracted_skills['technical']
-            }
-            
-            # Get relevant job titles based on skills
-            potential_jobs = self.job_analyzer.get_relevant_jobs(technical_skills)
-            
-            # Get job market data for relevant jobs
-            job_matches = []
-            for job_title in potential_jobs:
-                market_analysis = self.job_analyzer.analyze_job_market(job_title)
-                if 'error' not in market_analysis:
-                    # Calculate match score based on required skills and experience
-                    required_skills = set(market_analysis['required_skills'])
-                    user_skills = set(technical_skills.keys())
-                    skill_match = len(required_skills.intersection(user_skills)) / len(required_skills)
-                    
-                    # Weight experience more heavily for senior positions
-                    experience_weight = 0.4 if 'senior' in job_title.lower() else 0.3
-                    skill_weight = 1 - experience_weight
-                    
-                    # Calculate weighted score
-                    match_score = (skill_match * skill_weight + 
-                                 (resume_analysis['experience_years'] / market_analysis['required_experience']) * 
-                                 experience_weight) * 100
-                    
-                    if match_score > 60:  # Only include jobs with >60% match
-                        job_matches.append({
-                            'title': job_title.replace('_', ' ').title(),
-                            'matchScore': round(match_score, 1),
-                            'requiredSkills': list(required_skills),
-                            'salary': market_analysis['salary_range'],
-                            'experienceRequired': market_analysis['required_experience']
-                        })
-            
-            # Sort job matches by score
-            job_matches.sort(key=lambda x: x['matchScore'], reverse=True)
-            
-            # Calculate missing critical skills based on job requirements
-            missing_skills = []
-            seen_skills = set()
-            
-            for job in job_matches[:3]:  # Consider top 3 matching jobs
-                for skill in job['requiredSkills']:
-                    if skill not in technical_skills and skill not in seen_skills:
-                        skill_relevance = self.skill_analyzer.analyze_skill_relevance(
-                            skill, job['title']
-                        )
-                        if skill_relevance['is_relevant']:
-                            missing_skills.append({
-                                'skill': skill,
-                                'priority': 'High' if skill_relevance['relevance_score'] > 0.8 else 'Medium',
-                                'relevance': round(skill_relevance['relevance_score'] * 100)
-                            })
-                            seen_skills.add(skill)
-            
-            # Sort missing skills by relevance
-            missing_skills.sort(key=lambda x: x['relevance'], reverse=True)
-            
-            # Calculate scores based on actual resume content
-            skill_match_score = self._calculate_skill_match_score(technical_skills, job_matches)
-            experience_score = self._calculate_experience_score(resume_analysis['experience'])
-            education_score = self._calculate_education_score(resume_analysis['education'])
-            
-            # Weight the scores based on job level
-            weights = self._determine_score_weights(job_matches)
-            overall_score = (
-                skill_match_score * weights['skills'] +
-                experience_score * weights['experience'] +
-                education_score * weights['education']
-            )
-            
-            return {
-                'overallScore': round(overall_score),
-                'skillsMatch': round(skill_match_score),
-                'experience': round(experience_score),
-                'education': round(education_score),
-                'missingSkills': missing_skills[:5],  # Top 5 missing skills
-                'recommendedJobs': job_matches[:5],  # Top 5 job matches
-                'skillGaps': {
-                    'technical': [
-                        {
-                            'category': skill,
-                            'gap': round((1 - technical_skills.get(skill, 0)) * 100)
-                        }
-                        for skill in self._get_relevant_skill_categories(job_matches)
-                        if skill not in technical_skills or technical_skills[skill] < 0.8
-                    ],
-                    'soft': [
-                        {
-                            'category': skill['name'],
-                            'gap': round((1 - skill['confidence']) * 100)
-                        }
-                        for skill in extracted_skills['soft']
-                        if skill['confidence'] < 0.8
-                    ]
-                }
-            }
+            self.cache.put(cache_key, copy.deepcopy(result))
+            return result
             
+        except PdfTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except AnalysisOverloadedError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        except AnalysisTimeoutError as e:
+            raise HTTPException(status_code=504, detail=str(e))
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Error analyzing resume: {str(e)}"
             )
 
+    async def _read_upload(self, file: UploadFile) -> bytes:
+        """
+        Read an upload, rejecting it as soon as it exceeds the byte cap
+
+        At most max_bytes + 1 bytes are ever held in memory, and an
+        oversized upload is refused before it is hashed or decoded.
+        """
+        max_bytes = self.pdf_extractor.max_bytes
+        content = await file.read(max_bytes + 1)
+        if len(content) > max_bytes:
+            raise PdfTooLargeError(f"PDF is larger than the limit of {max_bytes} bytes")
+        return content
+
+    def _analyze_text(self, resume_text: str) -> Dict:
+        """
+        Run the analysis pipeline over extracted resume text
+        """
+        # Analyze resume using ML components
+        resume_analysis = self.resume_analyzer.analyze_resume(resume_text)
+        
+        # Get skills from resume with confidence scores
+        extracted_skills = resume_analysis['skills']
+        
+        # Analyze technical skills
+        technical_skills = {
+            skill['name']: skill['confidence']
+            for skill in extracted_skills['technical']
+        }
+        
+        # Match postings sharing skills with the resume, scored in bulk
+        experience_years = self._calculate_experience_years(resume_analysis['experience'])
+        potential_jobs = self.job_analyzer.get_relevant_jobs(
+            technical_skills,
+            experience_years=experience_years,
+            top_k=10,
+            min_score=60  # Only include jobs with >60% match
+        )
+        
+        job_matches = [
+            {
+                'title': job['title'],
+                'matchScore': round(job['match_score'], 1),
+                'requiredSkills': list(job['required_skills']),
+                'salary': job.get('salary_range'),
+                'experienceRequired': job['required_experience']
+            }
+            for job in potential_jobs
+        ]
+        
+        # Calculate missing critical skills based on job requirements
+        missing_skills = []
+        seen_skills = set()
+        
+        # Score every candidate (skill, job) pair in one batch
+        candidate_pairs = [
+            (skill, job['title'])
+            for job in job_matches[:3]  # Consider top 3 matching jobs
+            for skill in job['requiredSkills']
+            if skill not in technical_skills
+        ]
+        relevance = {
+            (result['skill'], result['job_role']): result
+            for result in self.skill_analyzer.analyze_skill_relevance_batch(
+                candidate_pairs
+            )
+        }
+        
+        for job in job_matches[:3]:
+            for skill in job['requiredSkills']:
+                if skill not in technical_skills and skill not in seen_skills:
+                    skill_relevance = relevance[(skill, job['title'])]
+                    if skill_relevance['is_relevant']:
+                        missing_skills.append({
+                            'skill': skill,
+                            'priority': 'High' if skill_relevance['relevance_score'] > 0.8 else 'Medium',
+                            'relevance': round(skill_relevance['relevance_score'] * 100)
+                        })
+                        seen_skills.add(skill)
+        
+        # Sort missing skills by relevance
+        missing_skills.sort(key=lambda x: x['relevance'], reverse=True)
+        
+        # Best confidence among the resume's skills in each category
+        category_confidence = {}
+        for skill in extracted_skills['technical']:
+            category_confidence[skill['category']] = max(
+                category_confidence.get(skill['category'], 0), skill['confidence']
+            )
+        
+        # Calculate scores based on actual resume content
+        skill_match_score = self._calculate_skill_match_score(technical_skills, job_matches)
+        experience_score = self._calculate_experience_score(resume_analysis['experience'])
+        education_score = self._calculate_education_score(resume_analysis['education'])
+        
+        # Weight the scores based on job level
+        weights = self._determine_score_weights(job_matches)
+        overall_score = (
+            skill_match_score * weights['skills'] +
+            experience_score * weights['experience'] +
+            education_score * weights['education']
+        )
+        
+        return {
+            'overallScore': round(overall_score),
+            'skillsMatch': round(skill_match_score),
+            'experience': round(experience_score),
+            'education': round(education_score),
+            'missingSkills': missing_skills[:5],  # Top 5 missing skills
+            'recommendedJobs': job_matches[:5],  # Top 5 job matches
+            'skillGaps': {
+                'technical': [
+                    {
+                        'category': category,
+                        'gap': round((1 - category_confidence.get(category, 0)) * 100)
+                    }
+                    for category in self._get_relevant_skill_categories(job_matches)
+                    if category_confidence.get(category, 0) < 0.8
+                ],
+                'soft': [
+                    {
+                        'category': skill['name'],
+                        'gap': round((1 - skill['confidence']) * 100)
+                    }
+                    for skill in extracted_skills['soft']
+                    if skill['confidence'] < 0.8
+                ]
+            }
+        }
+
     def _calculate_skill_match_score(self, technical_skills: Dict, job_matches: List) -> float:
         """Calculate skill match score based on job requirements"""
         if not job_matches:
@@ -173,10 +283,31 @@ class ResumeAnalyzerService:
         categories = set()
         for job in job_matches:
             for skill in job['requiredSkills']:
-                category = self.skill_analyzer.get_skill_category(skill)
+                category = self.resume_analyzer.get_skill_category(skill)
                 if category:
                     categories.add(category)
-        return list(categories)
+        return sorted(categories)
+
+    def _experience_periods(self, experience_list: List[Dict]) -> List[Tuple[Dict, int]]:
+        """
+        Each extracted experience entry with its length in years
+
+        Open-ended ("present") periods run to the current year, and reversed
+        periods count as zero years.
+        """
+        current_year = datetime.now().year
+        periods = []
+        for exp in experience_list:
+            period = exp['period']
+            if isinstance(period, tuple) and len(period) == 2:
+                start, end = period
+                end = current_year if end.lower() == 'present' else int(end)
+                periods.append((exp, max(end - int(start), 0)))
+        return periods
+
+    def _calculate_experience_years(self, experience_list: List[Dict]) -> float:
+        """Total years of experience across the extracted periods"""
+        return sum(years for _, years in self._experience_periods(experience_list))
 
     def _calculate_experience_score(self, experience_list: List[Dict]) -> float:
         """Calculate experience score based on extracted experience"""
@@ -186,19 +317,12 @@ class ResumeAnalyzerService:
         total_years = 0
         relevant_experience = 0
         
-        for exp in experience_list:
-            # Calculate years from period
-            period = exp['period']
-            if isinstance(period, tuple) and len(period) == 2:
-                start, end = period
-                if end.lower() == 'present':
-                    end = '2024'  # Current year
-                years = int(end) - int(start)
-                total_years += years
-                
-                # Check if experience is relevant based on skills mentioned
-                if exp['skills_mentioned']:
-                    relevant_experience += years
+        for exp, years in self._experience_periods(experience_list):
+            total_years += years
+            
+            # Check if experience is relevant based on skills mentioned
+            if exp['skills_mentioned']:
+                relevant_experience += years
         
         # Score based on years of experience and relevance
         years_score = min(total_years / 10, 1)  # Cap at 10 years
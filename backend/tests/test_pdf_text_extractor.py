@@ -0,0 +1,43 @@
+import asyncio
+import glob
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip('PyPDF2')
+
+from backend.services.pdf_text_extractor import PdfTextExtractor, PdfTooLargeError
+
+
+PAGES = [f'Page {number} Python and Docker' for number in range(10)]
+
+
+def extract(extractor, content):
+    try:
+        return asyncio.run(extractor.extract(content))
+    finally:
+        extractor.close()
+
+
+def test_page_parallel_extraction_matches_single_pass(make_pdf):
+    content = make_pdf(PAGES)
+    expected = extract(PdfTextExtractor(parallel_min_pages=100), content)
+    leftovers = set(glob.glob(os.path.join(tempfile.gettempdir(), 'pdf-extract-*.pdf')))
+
+    parallel = extract(PdfTextExtractor(parallel_min_pages=4, pages_per_chunk=3, page_workers=2), content)
+
+    assert all(text in expected for text in PAGES)
+    assert parallel == expected
+    assert set(glob.glob(os.path.join(tempfile.gettempdir(), 'pdf-extract-*.pdf'))) == leftovers
+
+
+def test_page_cap_applies_in_parallel_mode(make_pdf):
+    extractor = PdfTextExtractor(max_pages=5, parallel_min_pages=4, pages_per_chunk=2)
+    text = extract(extractor, make_pdf(PAGES))
+    assert 'Page 4 ' in text and 'Page 5 ' not in text
+
+
+def test_byte_cap(make_pdf):
+    with pytest.raises(PdfTooLargeError):
+        extract(PdfTextExtractor(max_bytes=100), make_pdf(PAGES))
@@ -0,0 +1,119 @@
+import asyncio
+import io
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('PyPDF2')
+spacy = pytest.importorskip('spacy')
+
+import numpy as np
+from fastapi import HTTPException, UploadFile
+
+from backend.services.pdf_text_extractor import PdfTextExtractor
+from backend.services.resume_analyzer_service import ResumeAnalyzerService
+from ml.job_analyzer import JobAnalyzer
+from ml.model_registry import nlp_model_name, registry
+from ml.utils.embedding_index import SkillEmbeddingIndex
+
+RESUME_LINES = [
+    'Python, Docker, Kubernetes and AWS.',
+    'Acme Corp 2019 - present. Built TensorFlow models with Python.',
+    'Bachelor of Science, 2015'
+]
+RESUME = '\n'.join(RESUME_LINES)
+
+
+def blank_pipeline():
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+
+def embedding_index():
+    """Deterministic embeddings for every posting skill and title."""
+    postings = JobAnalyzer().job_postings
+    names = sorted(
+        {skill for posting in postings for skill in posting['required_skills']}
+        | {posting['title'] for posting in postings}
+    )
+    rng = np.random.default_rng(0)
+    return SkillEmbeddingIndex({name: rng.normal(size=16) for name in names})
+
+
+@pytest.fixture(scope='module', autouse=True)
+def models():
+    replaced = {
+        nlp_model_name('sentences_only'): blank_pipeline,
+        'skill_embedding_index': embedding_index
+    }
+    originals = {name: registry.loader(name) for name in replaced}
+    for name, loader in replaced.items():
+        registry.register(name, loader)
+    yield
+    for name, loader in originals.items():
+        registry.register(name, loader)
+
+
+def service(**extractor_options):
+    return ResumeAnalyzerService(pdf_extractor=PdfTextExtractor(**extractor_options))
+
+
+@pytest.mark.parametrize('options', [{'max_pages': 5}, {'max_bytes': 1024}])
+def test_cache_key_covers_extractor_caps(options):
+    content = b'%PDF-1.4 resume'
+    assert service()._cache_key(content) == service()._cache_key(content)
+    assert service(**options)._cache_key(content) != service()._cache_key(content)
+
+
+def test_analyze_text_end_to_end():
+    analyzer = service()
+    result = analyzer._analyze_text(RESUME)
+
+    titles = {posting['title'] for posting in analyzer.job_analyzer.job_postings}
+    assert result['recommendedJobs']
+    assert {job['title'] for job in result['recommendedJobs']} <= titles
+    assert 'DevOps Engineer' in {job['title'] for job in result['recommendedJobs']}
+
+    categories = set(analyzer.resume_analyzer.skill_database['technical_skills'])
+    gaps = result['skillGaps']['technical']
+    assert gaps and {gap['category'] for gap in gaps} <= categories
+    assert all(0 <= gap['gap'] <= 100 for gap in gaps)
+    assert 0 <= result['overallScore'] <= 100
+
+
+def test_present_periods_run_to_current_year():
+    analyzer = service()
+    experience = [
+        {'period': ('2019', 'present'), 'skills_mentioned': ['Python']},
+        {'period': ('2015', '2017'), 'skills_mentioned': []},
+        {'period': ('2020', '2018'), 'skills_mentioned': []}
+    ]
+    years = datetime.now().year - 2019 + 2
+
+    assert analyzer._calculate_experience_years(experience) == years
+    expected_score = (min(years / 10, 1) * 0.6 + (years - 2) / years * 0.4) * 100
+    assert analyzer._calculate_experience_score(experience) == pytest.approx(expected_score)
+
+
+def test_upload_analysis_is_cached(make_pdf):
+    analyzer = service()
+    content = make_pdf(RESUME_LINES)
+
+    async def analyze():
+        first = await analyzer.analyze_resume(UploadFile(io.BytesIO(content)))
+        second = await analyzer.analyze_resume(UploadFile(io.BytesIO(content)))
+        return first, second
+
+    first, second = asyncio.run(analyze())
+    assert first == second
+    assert first['recommendedJobs']
+    assert analyzer.cache_stats()['hits'] == 1
+
+
+def test_oversized_upload_rejected(make_pdf):
+    analyzer = service(max_bytes=100)
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(analyzer.analyze_resume(UploadFile(io.BytesIO(make_pdf(RESUME_LINES)))))
+    assert error.value.status_code == 413
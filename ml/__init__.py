@@ -2,12 +2,39 @@
 ML Package for Skill Companion
 This package contains all the machine learning components for skill analysis,
 job market predictions, and course recommendations.
-"""
 
-from .skill_analyzer import SkillAnalyzer
-from .job_analyzer import JobAnalyzer
-from .course_recommender import CourseRecommender
-from .resume_analyzer import ResumeAnalyzer
+Analyzers are imported on first attribute access, so `import ml` stays cheap
+and only the submodules (and heavy dependencies) actually used get loaded.
+"""
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = '1.0.0'
-__all__ = ['SkillAnalyzer', 'JobAnalyzer', 'CourseRecommender', 'ResumeAnalyzer'] 
\ No newline at end of file
+__all__ = ['SkillAnalyzer', 'JobAnalyzer', 'CourseRecommender', 'ResumeAnalyzer']
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    'SkillAnalyzer': '.skill_analyzer',
+    'JobAnalyzer': '.job_analyzer',
+    'CourseRecommender': '.course_recommender',
+    'ResumeAnalyzer': '.resume_analyzer'
+}
+
+if TYPE_CHECKING:
+    from .skill_analyzer import SkillAnalyzer
+    from .job_analyzer import JobAnalyzer
+    from .course_recommender import CourseRecommender
+    from .resume_analyzer import ResumeAnalyzer
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+"""
+Benchmarks for the ML components.
+Each module can be run with `python -m ml.benchmarks.<name>`.
+"""
@@ -0,0 +1,146 @@
+"""
+Cohort course recommendation: batch API against a loop over recommend_courses.
+
+Generates random current/target skill levels for a cohort, runs both paths
+and checks that the batch results are identical to the loop and, for the
+first --check-users users, to the scalar reference scorer
+(_calculate_course_relevance run over the whole catalog). "score s" is the time the
+batch path spends scoring, the rest of "batch s" is building result dicts.
+--courses grows the catalog with synthetic courses:
+
+    python -m ml.benchmarks.course_batch --users 1000 10000 100000 --courses 200
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from ml.course_recommender import CourseRecommender
+from ml.utils.course_catalog import CourseCatalog
+
+PREFERENCES = {'max_duration': 50, 'max_price': 150, 'preferred_platforms': ['Coursera']}
+
+
+def extend_catalog(recommender, n_courses, seed):
+    """Add synthetic courses over the existing skills until n_courses exist."""
+    rng = random.Random(seed)
+    catalog = dict(recommender.courses)
+    courses = [course for category in catalog.values() for course in category]
+    skills = sorted(recommender.catalog.skill_names.tolist())
+    synthetic = [
+        {
+            **rng.choice(courses),
+            'id': f'SYN{index:05d}',
+            'skills': rng.sample(skills, rng.randint(1, 4)),
+            'duration': f'{rng.randint(5, 120)} hours',
+            'price': round(rng.uniform(10, 400), 2)
+        }
+        for index in range(n_courses - len(courses))
+    ]
+    catalog['synthetic'] = synthetic
+    recommender.catalog = CourseCatalog.from_courses(catalog)
+
+
+def time_scoring(recommender, users, targets, skill_names):
+    """Time only the vectorized scoring of the batch path."""
+    columns = {skill: column for column, skill in enumerate(skill_names)}
+    slots, weights = recommender._course_skill_slots(columns, PREFERENCES)
+    multipliers = recommender._preference_multipliers(PREFERENCES)
+    block_size = max(1, (1 << 18) // len(recommender.catalog))
+    start = time.perf_counter()
+    for block in range(0, len(users), block_size):
+        block_users = users[block:block + block_size]
+        block_targets = targets[block:block + block_size]
+        gaps = np.zeros((len(block_users), len(columns) + 1))
+        np.subtract(block_targets, block_users, out=gaps[:, :-1], where=block_users < block_targets)
+        scores = recommender._score_courses_batch(gaps, slots, weights, multipliers)
+        np.argsort(-scores, axis=1, kind='stable')[:, :5]
+    return time.perf_counter() - start
+
+
+def build_cohort(skill_names, n_users, seed):
+    """Current levels for every skill and targets for about a third of them."""
+    rng = np.random.default_rng(seed)
+    shape = (n_users, len(skill_names))
+    users = rng.integers(0, 100, shape).astype(np.float64)
+    targets = rng.integers(50, 101, shape) * (rng.random(shape) < 0.35)
+    return users, targets.astype(np.float64)
+
+
+def run_scalar(recommender, users, targets, skill_names):
+    return [
+        recommender.recommend_courses(
+            dict(zip(skill_names, user.tolist())),
+            dict(zip(skill_names, target.tolist())),
+            PREFERENCES
+        )
+        for user, target in zip(users, targets)
+    ]
+
+
+def run_reference(recommender, users, targets, skill_names, preferences=PREFERENCES, top_k=5):
+    """Recommendations ranked by the scalar reference scorer over every course."""
+    courses = [recommender.catalog.course(row) for row in range(len(recommender.catalog))]
+    recommendations = []
+    for user, target in zip(users, targets):
+        skill_gaps = recommender._calculate_skill_gaps(
+            dict(zip(skill_names, user.tolist())),
+            dict(zip(skill_names, target.tolist()))
+        )
+        scored = [
+            (recommender._calculate_course_relevance(
+                course, skill_gaps, preferences,
+                duration_hours=recommender.catalog.duration_hours[row]
+            ), row)
+            for row, course in enumerate(courses)
+        ]
+        ranked = sorted((entry for entry in scored if entry[0] > 0.5), key=lambda entry: -entry[0])
+        recommendations.append([
+            {
+                **courses[row],
+                'relevance_score': float(relevance_score),
+                'skills_covered': recommender._get_skills_covered(courses[row], skill_gaps)
+            }
+            for relevance_score, row in ranked[:top_k]
+        ])
+    return recommendations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--courses', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check-users', type=int, default=1000,
+                        help='users compared against the scalar reference')
+    args = parser.parse_args()
+
+    recommender = CourseRecommender()
+    if args.courses > len(recommender.catalog):
+        extend_catalog(recommender, args.courses, args.seed)
+    skill_names = sorted(recommender.catalog.skill_names.tolist())
+
+    print(f"{'users':>8}{'courses':>9}{'loop s':>10}{'batch s':>10}{'score s':>10}"
+          f"{'speedup':>9}  same results  matches reference")
+    for n_users in args.users:
+        users, targets = build_cohort(skill_names, n_users, args.seed)
+
+        start = time.perf_counter()
+        scalar = run_scalar(recommender, users, targets, skill_names)
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = recommender.recommend_courses_batch(users, targets, skill_names, PREFERENCES)
+        batch_seconds = time.perf_counter() - start
+        score_seconds = time_scoring(recommender, users, targets, skill_names)
+        checked = min(n_users, args.check_users)
+        reference = run_reference(recommender, users[:checked], targets[:checked], skill_names)
+
+        print(f"{n_users:>8}{len(recommender.catalog):>9}{loop_seconds:>10.3f}"
+              f"{batch_seconds:>10.3f}{score_seconds:>10.3f}"
+              f"{loop_seconds / batch_seconds:>8.1f}x  {str(scalar == batch):<12}  {reference == batch[:checked]}")
+
+
+if __name__ == '__main__':
+    main()
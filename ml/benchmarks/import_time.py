@@ -0,0 +1,103 @@
+"""
+Import-time budget check for the ml package.
+
+Imports the package, then each public name, in a fresh interpreter and
+fails if an import is over budget or drags in heavy dependencies it does
+not need. The same budgets run under pytest in ml/tests/test_import_time.py:
+
+    python -m ml.benchmarks.import_time
+
+On slow or shared machines scale the time budgets with --scale or the
+IMPORT_BUDGET_SCALE environment variable; a scale of 0 checks only which
+modules are imported.
+
+numpy is imported before the clock starts. It is a hard dependency of most
+modules and its own import (about 0.075 s here) would otherwise dominate
+and make the budgets track machine speed rather than this package.
+Each statement is timed several times and the fastest run counts.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ['torch', 'transformers', 'spacy', 'sklearn', 'scipy', 'pandas', 'requests', 'bs4']
+PRELOADED_MODULES = ['numpy']
+REPEATS = 3
+SCALE_VARIABLE = 'IMPORT_BUDGET_SCALE'
+
+# Statement to time -> (budget in seconds, heavy modules it may load).
+# Measured at 0.0003 s for 'import ml', 0.002 s for the numpy-based
+# analyzers and 0.007-0.01 s for ResumeAnalyzer.
+IMPORT_BUDGETS = {
+    'import ml': (0.02, []),
+    'from ml import CourseRecommender': (0.03, []),
+    'from ml import JobAnalyzer': (0.03, []),
+    'from ml import SkillAnalyzer': (0.03, []),
+    'from ml import ResumeAnalyzer': (0.05, [])
+}
+
+_PROBE = """
+import json, sys, time
+for name in {preloaded!r}:
+    __import__(name)
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'loaded': [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(statement, repeats=REPEATS):
+    """Time one import statement in fresh interpreters, keeping the fastest run."""
+    probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES, preloaded=PRELOADED_MODULES)
+    results = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, '-c', probe],
+            capture_output=True, text=True, check=True, cwd=_REPO_ROOT
+        )
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return min(results, key=lambda result: result['seconds'])
+
+
+def budget_scale():
+    """Budget multiplier from the environment, 1 if unset."""
+    return float(os.environ.get(SCALE_VARIABLE) or 1.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=float, default=budget_scale(),
+                        help=f'multiply every budget, e.g. on slow CI machines; '
+                             f'0 skips the time check (default: ${SCALE_VARIABLE} or 1)')
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'statement':<36}{'seconds':>10}{'budget':>10}  heavy modules loaded")
+    for statement, (budget, allowed) in IMPORT_BUDGETS.items():
+        result = measure(statement)
+        budget *= args.scale
+        unexpected = sorted(set(result['loaded']) - set(allowed))
+
+        print(f"{statement:<36}{result['seconds']:>10.3f}{budget:>10.3f}  "
+              f"{', '.join(result['loaded']) or '-'}")
+
+        if args.scale and result['seconds'] > budget:
+            failures.append(f"{statement}: {result['seconds']:.3f}s over {budget:.3f}s budget")
+        if unexpected:
+            failures.append(f"{statement}: unexpectedly imported {', '.join(unexpected)}")
+
+    if failures:
+        print('\n'.join(['', 'Import budget exceeded:'] + failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
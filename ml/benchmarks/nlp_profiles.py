@@ -0,0 +1,107 @@
+"""
+Per-document latency and memory of each spaCy pipeline profile.
+
+Every profile is measured in a fresh interpreter so that resident memory
+reflects only that profile's model weights:
+
+    python -m ml.benchmarks.nlp_profiles --docs 200
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from ml.model_registry import current_rss_mb
+from ml.nlp_pipeline import DEFAULT_MODEL, PIPELINE_PROFILES, load_pipeline
+
+SAMPLE_RESUME = """
+Jane Smith
+Senior Software Engineer | jane.smith@example.com | 555-123-4567
+
+Summary
+Backend engineer with eight years of experience building Python and Java
+services on AWS. Strong Communication and Leadership skills.
+
+Experience
+Acme Corp, Senior Software Engineer, 2019 - present. Designed Django and
+Flask APIs backed by PostgreSQL and Redis, deployed with Docker and
+Kubernetes. Mentored four engineers.
+Globex, Software Engineer, 2015 - 2019. Built React and Node.js dashboards
+and data pipelines with TensorFlow and Scikit-learn.
+
+Education
+Master of Science in Computer Science, State University, 2015.
+Bachelor of Engineering, City College, 2013.
+
+Certifications
+AWS Certified Solutions Architect, PMP.
+"""
+
+
+def measure_profile(profile, model, n_docs, repeat):
+    """Load one profile and time it over a synthetic resume corpus."""
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    nlp = load_pipeline(profile, model)
+    load_seconds = time.perf_counter() - start
+    rss_loaded = current_rss_mb()
+
+    text = SAMPLE_RESUME * repeat
+
+    # Warm up caches before timing
+    nlp(text)
+
+    latencies = []
+    for _ in range(n_docs):
+        start = time.perf_counter()
+        doc = nlp(text)
+        # Sentence iteration is part of what the analyzers pay for
+        if doc.has_annotation('SENT_START'):
+            sum(1 for _ in doc.sents)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        'profile': profile,
+        'components': nlp.pipe_names,
+        'load_seconds': round(load_seconds, 3),
+        'mean_ms_per_doc': round(statistics.mean(latencies), 3),
+        'p95_ms_per_doc': round(latencies[int(len(latencies) * 0.95) - 1], 3),
+        'model_rss_mb': round(rss_loaded - rss_before, 1),
+        'total_rss_mb': round(current_rss_mb(), 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--model', default=DEFAULT_MODEL)
+    parser.add_argument('--docs', type=int, default=100, help='documents per profile')
+    parser.add_argument('--repeat', type=int, default=3, help='resume copies per document')
+    parser.add_argument('--profile', help='measure a single profile in this process')
+    args = parser.parse_args()
+
+    if args.profile:
+        result = measure_profile(args.profile, args.model, args.docs, args.repeat)
+        print(json.dumps(result))
+        return
+
+    print(f"{'profile':<16}{'load s':>8}{'mean ms':>10}{'p95 ms':>10}"
+          f"{'model MB':>10}{'RSS MB':>10}  components")
+    for profile in PIPELINE_PROFILES:
+        completed = subprocess.run(
+            [sys.executable, '-m', 'ml.benchmarks.nlp_profiles',
+             '--profile', profile, '--model', args.model,
+             '--docs', str(args.docs), '--repeat', str(args.repeat)],
+            capture_output=True, text=True, check=True
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(f"{result['profile']:<16}{result['load_seconds']:>8}"
+              f"{result['mean_ms_per_doc']:>10}{result['p95_ms_per_doc']:>10}"
+              f"{result['model_rss_mb']:>10}{result['total_rss_mb']:>10}  "
+              f"{', '.join(result['components'])}")
+
+
+if __name__ == '__main__':
+    main()
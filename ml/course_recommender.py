@@ -1,14 +1,58 @@
+from functools import cached_property
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from datetime import datetime
-import json
+from .utils.course_catalog import CourseCatalog
 
 class CourseRecommender:
-    def __init__(self):
-        """Initialize the Course Recommender with course data and models."""
-        self.courses = self._load_course_data()
+    def __init__(self, catalog_path=None):
+        """
+        Initialize the Course Recommender with course data and models.
+        
+        Args:
+            catalog_path (str, optional): Directory of a saved CourseCatalog,
+                memory-mapped instead of building the built-in catalog
+        """
+        if catalog_path:
+            self.catalog = CourseCatalog.load(catalog_path)
+        else:
+            self.catalog = CourseCatalog.from_courses(self._load_course_data())
         self.learning_paths = self._load_learning_paths()
 
+    @property
+    def catalog(self):
+        """Columnar course catalog all recommendations are drawn from."""
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, catalog):
+        self._catalog = catalog
+        # Views built from the previous catalog are rebuilt on next access
+        self.__dict__.pop('planner', None)
+        self.__dict__.pop('courses', None)
+
+    @cached_property
+    def planner(self):
+        """Learning path planner using the skill prerequisite relation."""
+        from .model_registry import registry
+        from .utils.path_planner import LearningPathPlanner
+        graph = registry.get('skill_prerequisite_graph')
+        # Edges added to the graph later bump its version and refresh the planner
+        return LearningPathPlanner(
+            self.catalog, graph.direct_prerequisites, version=lambda: graph.version
+        )
+
+    @cached_property
+    def courses(self):
+        """
+        Course dicts grouped by category, built once from the catalog.
+        
+        Shared between callers, so treat it as read-only; assigning a new
+        catalog rebuilds it.
+        """
+        courses = {name: [] for name in self.catalog.category_names}
+        for row in range(len(self.catalog)):
+            courses[self.catalog.category(row)].append(self.catalog.course(row))
+        return courses
+
     def _load_course_data(self):
         """Load course database."""
         # In a real implementation, this would load from a database
@@ -91,52 +135,208 @@ class CourseRecommender:
             }
         }
 
-    def recommend_courses(self, user_skills, target_skills, preferences=None):
+    def recommend_courses(self, user_skills, target_skills, preferences=None, top_k=5):
         """
         Recommend courses based on skill gaps and user preferences.
         
+        Only courses that teach at least one gap skill are scored, so the
+        work follows the number of relevant courses, not the catalog size.
+        
         Args:
             user_skills (dict): Current skill levels of the user
             target_skills (dict): Target skill levels to achieve
             preferences (dict, optional): User preferences for courses
+            top_k (int): Number of recommendations to return
         
         Returns:
             list: Recommended courses with relevance scores
         """
         skill_gaps = self._calculate_skill_gaps(user_skills, target_skills)
+        
+        # Only courses teaching a gap skill can be relevant
+        candidates = [self.catalog.courses_with_skill(skill) for skill in skill_gaps]
+        if not candidates:
+            return []
+        rows = np.unique(np.concatenate(candidates))
+        
+        # Score the candidates in bulk as a one-user batch
+        columns = {skill: column for column, skill in enumerate(skill_gaps)}
+        gaps = np.array([[gap['gap'] for gap in skill_gaps.values()] + [0]], dtype=np.float64)
+        slots, weights = self._course_skill_slots(columns, preferences, rows)
+        multipliers = self._preference_multipliers(preferences, rows)
+        scores = self._score_courses_batch(gaps, slots, weights, multipliers)[0]
+        
+        # Top courses by relevance score, ties in catalog order
+        relevant = np.flatnonzero(scores > 0.5)  # Minimum relevance threshold
+        ranked = relevant[np.argsort(-scores[relevant], kind='stable')][:top_k]
+        
         recommendations = []
+        for position in ranked:
+            course = self.catalog.course(rows[position])
+            recommendations.append({
+                **course,
+                'relevance_score': float(scores[position]),
+                'skills_covered': self._get_skills_covered(course, skill_gaps)
+            })
+        return recommendations
+
+    def recommend_courses_batch(self, user_matrix, target_matrix, skill_names,
+                                preferences=None, top_k=5, block_size=None):
+        """
+        Recommend courses for many users at once.
+        
+        Row i of the matrices holds user i's current and target level for
+        each skill in skill_names. Gaps are computed as one array and every
+        user is scored against every course in bulk, with the preference
+        multipliers applied as per-course masks. Results are identical to
+        calling recommend_courses for each user with the same levels.
+        
+        Args:
+            user_matrix (array-like): Current levels, users x skills
+            target_matrix (array-like): Target levels, users x skills
+            skill_names (list): Skill name of each matrix column
+            preferences (dict, optional): User preferences shared by all users
+            top_k (int): Number of recommendations per user
+            block_size (int, optional): Users scored together; bounds the
+                size of the users x courses score arrays
+        
+        Returns:
+            list: One list of recommended courses per user
+        """
+        user_matrix = np.asarray(user_matrix, dtype=np.float64)
+        target_matrix = np.asarray(target_matrix, dtype=np.float64)
+        columns = {skill: column for column, skill in enumerate(skill_names)}
+        slots, weights = self._course_skill_slots(columns, preferences)
+        multipliers = self._preference_multipliers(preferences)
         
-        for category, courses in self.courses.items():
-            for course in courses:
-                relevance_score = self._calculate_course_relevance(
-                    course, skill_gaps, preferences
-                )
-                if relevance_score > 0.5:  # Minimum relevance threshold
-                    recommendations.append({
-                        **course,
-                        'relevance_score': relevance_score,
-                        'skills_covered': self._get_skills_covered(course, skill_gaps)
-                    })
-        
-        # Sort by relevance score
-        recommendations.sort(key=lambda x: x['relevance_score'], reverse=True)
-        return recommendations[:5]  # Return top 5 recommendations
+        # Keep each users x courses score array around 2 MB
+        block_size = block_size or max(1, (1 << 18) // max(len(self.catalog), 1))
+        
+        recommendations = []
+        for start in range(0, len(user_matrix), block_size):
+            users = user_matrix[start:start + block_size]
+            targets = target_matrix[start:start + block_size]
+            
+            # Gaps with an extra all-zero column for unknown skills and padding
+            gaps = np.zeros((len(users), len(columns) + 1))
+            np.subtract(targets, users, out=gaps[:, :-1], where=users < targets)
+            
+            scores = self._score_courses_batch(gaps, slots, weights, multipliers)
+            ranked = np.argsort(-scores, axis=1, kind='stable')[:, :top_k]
+            ranked_scores = np.take_along_axis(scores, ranked, axis=1)
+            
+            # Result dicts are built only for the returned courses
+            rows = zip(ranked.tolist(), ranked_scores.tolist(), (gaps > 0).tolist())
+            for positions, relevance_scores, has_gap in rows:
+                recommendations.append([
+                    self._batch_recommendation(position, relevance_score, has_gap, columns)
+                    for position, relevance_score in zip(positions, relevance_scores)
+                    if relevance_score > 0.5  # Minimum relevance threshold
+                ])
+        return recommendations
 
-    def _calculate_skill_gaps(self, user_skills, target_skills):
-        """Calculate the gap between current and target skills."""
-        gaps = {}
-        for skill, target_level in target_skills.items():
-            current_level = user_skills.get(skill, 0)
-            if current_level < target_level:
-                gaps[skill] = {
-                    'current': current_level,
-                    'target': target_level,
-                    'gap': target_level - current_level
-                }
-        return gaps
+    def _course_skill_slots(self, columns, preferences, rows=None):
+        """
+        Column of each course skill in the gap matrix, with its weight.
+        
+        Args:
+            columns (dict): Skill name to gap matrix column
+            preferences (dict, optional): User preferences for courses
+            rows (np.ndarray, optional): Catalog rows to include, all if None
+        
+        Returns:
+            tuple: (courses x max skills) column and weight arrays, padded
+                with the all-zero column
+        """
+        catalog = self.catalog
+        padding = len(columns)
+        
+        skill_columns = np.full(len(catalog.skill_names), padding, dtype=np.intp)
+        for skill, column in columns.items():
+            skill_id = catalog.skill_id(skill)
+            if skill_id is not None:
+                skill_columns[skill_id] = column
+        
+        skill_weights = np.ones(len(catalog.skill_names))
+        if preferences and 'priority_skills' in preferences:
+            for skill in preferences['priority_skills']:
+                skill_id = catalog.skill_id(skill)
+                if skill_id is not None:
+                    skill_weights[skill_id] = 2.0
+        
+        # Scatter the CSR skill lists of the rows into fixed-width rows
+        if rows is None:
+            rows = np.arange(len(catalog))
+        starts = catalog.skill_indptr[rows]
+        counts = catalog.skill_indptr[rows + 1] - starts
+        entry_rows = np.repeat(np.arange(len(rows)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        skill_ids = catalog.skill_indices[np.repeat(starts, counts) + offsets]
+        
+        width = int(counts.max(initial=0))
+        slots = np.full((len(rows), width), padding, dtype=np.intp)
+        weights = np.ones((len(rows), width))
+        slots[entry_rows, offsets] = skill_columns[skill_ids]
+        weights[entry_rows, offsets] = skill_weights[skill_ids]
+        return slots, weights
 
-    def _calculate_course_relevance(self, course, skill_gaps, preferences=None):
-        """Calculate how relevant a course is based on skill gaps and preferences."""
+    def _preference_multipliers(self, preferences, rows=None):
+        """Per-course relevance multipliers in the order they are applied."""
+        multipliers = []
+        if not preferences:
+            return multipliers
+        
+        catalog = self.catalog
+        selected = slice(None) if rows is None else rows
+        
+        if 'max_duration' in preferences:
+            multipliers.append((catalog.duration_hours[selected] > preferences['max_duration'], 0.8))
+        
+        if 'max_price' in preferences:
+            multipliers.append((catalog.price[selected] > preferences['max_price'], 0.7))
+        
+        if 'preferred_platforms' in preferences:
+            multipliers.append((catalog.platform_mask(preferences['preferred_platforms'], rows), 1.2))
+        return multipliers
+
+    def _score_courses_batch(self, gaps, slots, weights, multipliers):
+        """
+        Relevance of every course for every user in a block.
+        
+        For each course, gap skill terms (gap / 100) * weight are summed in
+        the course's skill order, the preference multipliers applied, and
+        the sum divided by the total weight of its gap skills. Summing slot
+        by slot keeps that order, so results do not depend on batch shape
+        and equal _calculate_course_relevance exactly. The arrays are skill-major so that each gather copies whole rows.
+        
+        Returns:
+            np.ndarray: Relevance scores, users x courses
+        """
+        gaps = np.ascontiguousarray(gaps.T)
+        scaled_gaps = gaps / 100
+        has_gap = (gaps > 0).astype(np.float64)
+        
+        scores = np.zeros((len(slots), gaps.shape[1]))
+        total_weight = np.zeros_like(scores)
+        for slot in range(slots.shape[1]):
+            weight = weights[:, slot, None]
+            scores += scaled_gaps[slots[:, slot]] * weight
+            total_weight += has_gap[slots[:, slot]] * weight
+        
+        for mask, multiplier in multipliers:
+            scores[mask] *= multiplier
+        
+        relevance = np.zeros_like(scores)
+        np.divide(scores, total_weight, out=relevance, where=total_weight > 0)
+        return relevance.T
+
+    def _calculate_course_relevance(self, course, skill_gaps, preferences=None, duration_hours=None):
+        """
+        Calculate how relevant a course is based on skill gaps and preferences.
+        
+        Scalar reference for _score_courses_batch, which must reproduce
+        these scores exactly; the recommendation paths do not call it.
+        """
         relevance_score = 0
         total_weight = 0
         
@@ -154,7 +354,8 @@ class CourseRecommender:
         # Adjust for preferences if provided
         if preferences:
             if 'max_duration' in preferences:
-                duration_hours = float(course['duration'].split()[0])
+                if duration_hours is None:
+                    duration_hours = float(course['duration'].split()[0])
                 if duration_hours > preferences['max_duration']:
                     relevance_score *= 0.8
             
@@ -168,6 +369,31 @@ class CourseRecommender:
         
         return relevance_score / total_weight if total_weight > 0 else 0
 
+    def _batch_recommendation(self, position, relevance_score, has_gap, columns):
+        """Result entry of one course for one user of a batch."""
+        course = self.catalog.course(position)
+        return {
+            **course,
+            'relevance_score': relevance_score,
+            'skills_covered': [
+                skill for skill in course['skills']
+                if skill in columns and has_gap[columns[skill]]
+            ]
+        }
+
+    def _calculate_skill_gaps(self, user_skills, target_skills):
+        """Calculate the gap between current and target skills."""
+        gaps = {}
+        for skill, target_level in target_skills.items():
+            current_level = user_skills.get(skill, 0)
+            if current_level < target_level:
+                gaps[skill] = {
+                    'current': current_level,
+                    'target': target_level,
+                    'gap': target_level - current_level
+                }
+        return gaps
+
     def _get_skills_covered(self, course, skill_gaps):
         """Get the list of gap skills covered by the course."""
         return [skill for skill in course['skills'] if skill in skill_gaps]
@@ -206,6 +432,41 @@ class CourseRecommender:
             ]
         }
 
+    def plan_learning_path(self, career_goal=None, target_skills=None, current_skills=None):
+        """
+        Plan a course sequence for a career goal or a set of target skills.
+        
+        Unlike suggest_learning_path, the plan is built from the whole
+        catalog: targets are expanded with their prerequisites, a small set
+        of courses covering them is chosen, and the courses are ordered so
+        prerequisites come first.
+        
+        Args:
+            career_goal (str, optional): Learning path whose skills are the targets
+            target_skills (list, optional): Skills to reach, used without a goal
+            current_skills (dict, optional): Current skill levels; skills at
+                mastery level are not planned for
+        
+        Returns:
+            dict: Planned courses in study order with the skills each covers
+        """
+        if career_goal is not None:
+            if career_goal not in self.learning_paths:
+                return {
+                    'error': 'Career path not found',
+                    'available_paths': list(self.learning_paths.keys())
+                }
+            target_skills = self.learning_paths[career_goal]['skills']
+        
+        mastered = [
+            skill for skill, level in (current_skills or {}).items()
+            if level >= 80  # Assuming 80% is mastery
+        ]
+        plan = self.planner.plan(target_skills or [], mastered)
+        if career_goal is not None:
+            plan['path_name'] = self.learning_paths[career_goal]['name']
+        return plan
+
     def _customize_learning_path(self, path, current_skills):
         """Customize learning path based on current skills."""
         customized_path = path.copy()
@@ -235,8 +496,4 @@ class CourseRecommender:
 
     def _get_course_by_id(self, course_id):
         """Retrieve course details by ID."""
-        for category in self.courses.values():
-            for course in category:
-                if course['id'] == course_id:
-                    return course
-        return None 
\ No newline at end of file
+        return self.catalog.get(course_id) 
\ No newline at end of file
@@ -1,31 +1,180 @@
-import pandas as pd
-import numpy as np
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.cluster import KMeans
-from datetime import datetime, timedelta
-import requests
-from bs4 import BeautifulSoup
+import hashlib
 import json
+import os
+from functools import cached_property
+import numpy as np
+from .utils.market_store import MarketDataStore
+from .utils.trigram_index import TrigramIndex
+
+MARKET_ROLES_PATH = os.path.join(os.path.dirname(__file__), 'data', 'market_roles.csv')
+# Columnar export of the CSV, served when present; regenerate it after
+# editing the CSV with MarketDataStore.from_csv(...).save(...)
+MARKET_STORE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'market_roles.npz')
 
 class JobAnalyzer:
-    def __init__(self):
-        """Initialize the Job Analyzer with necessary components."""
-        self.scaler = MinMaxScaler()
-        self.job_clusters = KMeans(n_clusters=5)
-        self.market_data = self._load_market_data()
+    def __init__(self, market_data_path=None):
+        """
+        Initialize the Job Analyzer with necessary components.
+        
+        Args:
+            market_data_path (str, optional): Role market metrics, either a
+                MarketDataStore .npz export or a CSV; defaults to the
+                columnar export if it exists, and to the CSV otherwise
+        """
+        self.market = self._load_market_data(market_data_path)
+        self._market_version = self._digest({
+            'roles': self.market.roles,
+            **{column: getattr(self.market, column).tolist()
+               for column in ('demand', 'growth', 'salary_min', 'salary_max')}
+        })
+        self.role_index = TrigramIndex(self.market.roles)
+        self.index_jobs(self._load_job_postings())
+
+    @property
+    def data_version(self):
+        """Digest of the market data and the indexed job postings."""
+        return f'{self._market_version}-{self._postings_version}'
+
+    @staticmethod
+    def _digest(data):
+        payload = json.dumps(data, sort_keys=True, default=list)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
 
-    def _load_market_data(self):
+    @cached_property
+    def scaler(self):
+        """Scaler for market features, built on first use."""
+        from sklearn.preprocessing import MinMaxScaler
+        return MinMaxScaler()
+
+    @cached_property
+    def job_clusters(self):
+        """Job clustering model, built on first use."""
+        from sklearn.cluster import KMeans
+        return KMeans(n_clusters=5)
+
+    def _load_market_data(self, path=None):
         """Load and prepare market data for analysis."""
-        # In a real implementation, this would load from a database
-        return {
-            'tech_roles': {
-                'Full Stack Developer': {'demand': 85, 'growth': 12, 'salary_range': (80000, 150000)},
-                'Data Scientist': {'demand': 90, 'growth': 15, 'salary_range': (90000, 160000)},
-                'DevOps Engineer': {'demand': 88, 'growth': 14, 'salary_range': (95000, 165000)},
-                'ML Engineer': {'demand': 92, 'growth': 18, 'salary_range': (100000, 180000)},
-                'Cloud Architect': {'demand': 87, 'growth': 13, 'salary_range': (110000, 190000)}
+        # In a real implementation, this would load from a database export
+        if path is None:
+            path = MARKET_STORE_PATH if os.path.exists(MARKET_STORE_PATH) else MARKET_ROLES_PATH
+        if path.endswith('.npz'):
+            return MarketDataStore.load(path)
+        return MarketDataStore.from_csv(path)
+
+    def _load_job_postings(self):
+        """Load the job postings used for resume matching."""
+        # In a real implementation, this would load from the job board feed
+        requirements = {
+            'Full Stack Developer': (['JavaScript', 'React', 'Node.js', 'HTML', 'CSS', 'MongoDB'], 3),
+            'Data Scientist': (['Python', 'Scikit-learn', 'TensorFlow', 'PostgreSQL'], 2),
+            'DevOps Engineer': (['Docker', 'Kubernetes', 'AWS', 'Python'], 3),
+            'ML Engineer': (['Python', 'TensorFlow', 'PyTorch', 'Docker'], 3),
+            'Cloud Architect': (['AWS', 'Azure', 'Google Cloud', 'Kubernetes'], 5)
+        }
+        return [
+            {
+                'title': title,
+                'required_skills': skills,
+                'required_experience': experience,
+                'salary_range': self.market.salary_range(self.market.row(title))
             }
+            for title, (skills, experience) in requirements.items()
+        ]
+
+    def index_jobs(self, postings):
+        """
+        Build the skill -> job inverted index over a posting catalog.
+        
+        Args:
+            postings (list): Dicts with 'title', 'required_skills',
+                'required_experience' (years) and optionally 'salary_range'
+        """
+        self.job_postings = list(postings)
+        self._postings_version = self._digest(self.job_postings)
+        
+        skill_jobs = {}
+        required_counts = []
+        for job_id, posting in enumerate(self.job_postings):
+            skills = {skill.lower() for skill in posting['required_skills']}
+            for skill in skills:
+                skill_jobs.setdefault(skill, []).append(job_id)
+            required_counts.append(len(skills))
+        
+        # Posting lists as arrays so candidates are gathered without Python loops
+        self._skill_jobs = {
+            skill: np.array(job_ids, dtype=np.int32)
+            for skill, job_ids in skill_jobs.items()
         }
+        self._required_counts = np.array(required_counts, dtype=np.float64)
+        self._required_experience = np.array(
+            [posting.get('required_experience', 0) for posting in self.job_postings],
+            dtype=np.float64
+        )
+        # Experience weighs more for senior positions
+        self._experience_weights = np.array(
+            [0.4 if 'senior' in posting['title'].lower() else 0.3 for posting in self.job_postings],
+            dtype=np.float64
+        )
+
+    def get_relevant_jobs(self, skills, experience_years=0, top_k=10, min_score=0):
+        """
+        Find the postings that best match a candidate's skills and experience.
+        
+        Only postings sharing at least one skill with the candidate are
+        scored, all at once from the inverted index, so the cost follows
+        the number of matching postings rather than catalog size.
+        
+        Args:
+            skills (iterable): Candidate skill names (a dict's keys are used)
+            experience_years (float): Candidate's years of experience
+            top_k (int): Maximum number of matches returned
+            min_score (float): Matches scoring at or below this are left out
+        
+        Returns:
+            list: Match dicts, best first, with the posting's 'title',
+                'required_skills', 'required_experience', 'salary_range',
+                plus 'matched_skills', 'skill_match' and 'match_score'
+        """
+        user_skills = {skill.lower() for skill in skills}
+        posting_lists = [self._skill_jobs[skill] for skill in user_skills if skill in self._skill_jobs]
+        if not posting_lists or top_k <= 0:
+            return []
+        
+        # Sorting the gathered postings keeps the work off the rest of the catalog
+        candidates, overlap = np.unique(np.concatenate(posting_lists), return_counts=True)
+        
+        skill_match = overlap / self._required_counts[candidates]
+        required_experience = self._required_experience[candidates]
+        experience_match = np.ones(len(candidates))
+        has_requirement = required_experience > 0
+        experience_match[has_requirement] = np.minimum(
+            experience_years / required_experience[has_requirement], 1.0
+        )
+        experience_weight = self._experience_weights[candidates]
+        scores = (skill_match * (1 - experience_weight) + experience_match * experience_weight) * 100
+        
+        keep = scores > min_score
+        candidates, scores, skill_match = candidates[keep], scores[keep], skill_match[keep]
+        if top_k < len(candidates):
+            # Keep every posting tied with the k-th best so ties keep catalog order
+            threshold = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            keep = scores >= threshold
+            candidates, scores, skill_match = candidates[keep], scores[keep], skill_match[keep]
+        order = np.lexsort((candidates, -scores))[:top_k]
+        
+        matches = []
+        for position in order:
+            posting = self.job_postings[candidates[position]]
+            matches.append({
+                **posting,
+                'matched_skills': [
+                    skill for skill in posting['required_skills']
+                    if skill.lower() in user_skills
+                ],
+                'skill_match': float(skill_match[position]),
+                'match_score': float(scores[position])
+            })
+        return matches
 
     def analyze_job_market(self, job_title):
         """
@@ -37,81 +186,70 @@ class JobAnalyzer:
         Returns:
             dict: Market analysis results
         """
-        if job_title not in self.market_data['tech_roles']:
+        role = self._resolve_role(job_title)
+        if role is None:
             return {
                 'error': 'Job title not found in database',
                 'similar_roles': self._find_similar_roles(job_title)
             }
 
-        role_data = self.market_data['tech_roles'][job_title]
-        
-        return {
-            'job_title': job_title,
-            'market_demand': role_data['demand'],
-            'growth_rate': role_data['growth'],
-            'salary_range': role_data['salary_range'],
-            'market_health': self._calculate_market_health(role_data),
-            'future_outlook': self._predict_future_outlook(role_data)
-        }
+        return self._market_analysis(self.market.row(role))
 
-    def _calculate_market_health(self, role_data):
-        """Calculate overall market health score."""
-        demand_weight = 0.4
-        growth_weight = 0.3
-        salary_weight = 0.3
+    def analyze_job_market_batch(self, job_titles=None):
+        """
+        Analyze market conditions for many roles at once.
         
-        demand_score = role_data['demand'] / 100
-        growth_score = role_data['growth'] / 20  # Normalize assuming 20% is max growth
-        salary_score = (role_data['salary_range'][1] - 80000) / 120000  # Normalize salary range
+        Health scores, statuses and projections of all roles come from the
+        market store's table, computed in one vectorized pass.
         
-        health_score = (demand_score * demand_weight +
-                       growth_score * growth_weight +
-                       salary_score * salary_weight)
+        Args:
+            job_titles (list, optional): Job titles to analyze, all known
+                roles if None
         
+        Returns:
+            list: Market analysis results, in the format of analyze_job_market
+        """
+        if job_titles is None:
+            return [self._market_analysis(row) for row in range(len(self.market))]
+        return [self.analyze_job_market(job_title) for job_title in job_titles]
+
+    def _market_analysis(self, row):
+        """Market analysis of the role in a market store row."""
+        metrics = self.market.metrics(row)
         return {
-            'score': round(health_score * 100, 2),
-            'status': self._get_health_status(health_score)
+            'job_title': self.market.roles[row],
+            'market_demand': metrics['demand'],
+            'growth_rate': metrics['growth'],
+            'salary_range': metrics['salary_range'],
+            'market_health': self.market.health(row),
+            'future_outlook': self._predict_future_outlook(row)
         }
 
-    def _get_health_status(self, score):
-        """Convert health score to status."""
-        if score >= 0.8:
-            return 'Excellent'
-        elif score >= 0.6:
-            return 'Good'
-        elif score >= 0.4:
-            return 'Moderate'
-        else:
-            return 'Challenging'
-
-    def _predict_future_outlook(self, role_data):
+    def _predict_future_outlook(self, row):
         """Predict future market conditions."""
-        current_demand = role_data['demand']
-        growth_rate = role_data['growth']
-        
-        # Simple linear projection
-        six_month_demand = current_demand * (1 + (growth_rate/100/2))
-        one_year_demand = current_demand * (1 + (growth_rate/100))
+        # Simple linear projection, precomputed for all roles
+        six_month_demand, one_year_demand = self.market.projections(row)
         
         return {
             'six_month_outlook': {
-                'projected_demand': round(six_month_demand, 2),
+                'projected_demand': six_month_demand,
                 'confidence': 0.85
             },
             'one_year_outlook': {
-                'projected_demand': round(one_year_demand, 2),
+                'projected_demand': one_year_demand,
                 'confidence': 0.75
             }
         }
 
-    def _find_similar_roles(self, job_title):
-        """Find similar job titles in the database."""
-        # In a real implementation, this would use NLP similarity
-        similar_roles = []
-        for role in self.market_data['tech_roles'].keys():
-            if any(word.lower() in role.lower() for word in job_title.split()):
-                similar_roles.append(role)
-        return similar_roles
+    def _resolve_role(self, job_title):
+        """Role key for a title, matching exactly or after normalization."""
+        if job_title in self.market:
+            return job_title
+        return self.role_index.lookup(job_title)
+
+    def _find_similar_roles(self, job_title, limit=5):
+        """Find similar job titles in the database, most similar first."""
+        return [role for role, _ in self.role_index.search(job_title, limit=limit)]
 
     def get_industry_distribution(self):
         """Get distribution of jobs across industries."""
@@ -145,10 +283,11 @@ class JobAnalyzer:
         Returns:
             dict: Salary trend analysis
         """
-        if job_title not in self.market_data['tech_roles']:
+        role = self._resolve_role(job_title)
+        if role is None:
             return {'error': 'Job title not found'}
             
-        base_salary_range = self.market_data['tech_roles'][job_title]['salary_range']
+        base_salary_range = self.market.salary_range(self.market.row(role))
         
         # Apply location adjustment if provided
         if location:
@@ -168,7 +307,7 @@ class JobAnalyzer:
                 '50th': sum(adjusted_range) / 2,
                 '75th': adjusted_range[1]
             },
-            'factors': self._get_salary_factors(job_title)
+            'factors': self._get_salary_factors(role)
         }
 
     def _get_location_multiplier(self, location):
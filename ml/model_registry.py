@@ -0,0 +1,231 @@
+import functools
+import hashlib
+import os
+import resource
+import sys
+import threading
+import time
+
+from .nlp_pipeline import DEFAULT_MODEL, PIPELINE_PROFILES
+
+ZERO_SHOT_MODEL = 'facebook/bart-large-mnli'
+SKILL_EMBEDDINGS_PATH = os.path.join(os.path.dirname(__file__), 'models', 'skill_embeddings.joblib')
+SKILL_TRENDS_DIR = os.path.join(os.path.dirname(__file__), 'data')
+SKILL_PREREQUISITES_PATH = os.path.join(os.path.dirname(__file__), 'data', 'skill_prerequisites.json')
+SKILL_TREND_FORECASTER_FILE = 'skill_trend_forecaster.npz'
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB."""
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        # ru_maxrss is in KB on Linux and bytes on macOS; peak is close enough
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def cache_dir():
+    """
+    Writable directory for artifacts fitted at runtime.
+
+    SKILL_BRIDGE_CACHE_DIR if set, otherwise skill-bridge under the user
+    cache directory (XDG_CACHE_HOME or ~/.cache). Never the package
+    directory, which may be read-only.
+    """
+    directory = os.environ.get('SKILL_BRIDGE_CACHE_DIR')
+    if not directory:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        directory = os.path.join(base, 'skill-bridge')
+    return directory
+
+
+def file_digest(path):
+    """
+    Short content digest of a model artifact or data file.
+
+    Returns:
+        str: Hex digest of the file's bytes, or 'missing' if it does not exist
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as handle:
+            for block in iter(lambda: handle.read(1 << 20), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return 'missing'
+    return digest.hexdigest()[:16]
+
+
+def nlp_model_name(profile):
+    """Registry name of the spaCy pipeline for a profile."""
+    return f'spacy:{profile}'
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of heavy models.
+
+    Models are registered as loader callables and loaded the first time
+    they are requested, then shared by every analyzer in the process.
+    Loading is thread-safe and happens at most once per model.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._models = {}
+        self._stats = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader):
+        """
+        Register a model loader.
+
+        Args:
+            name (str): Registry name of the model
+            loader (callable): Zero-argument function returning the model
+        """
+        with self._lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._models.pop(name, None)
+            self._stats.pop(name, None)
+
+    def get(self, name):
+        """
+        Return a model, loading it on first use.
+
+        Args:
+            name (str): Registry name of the model
+
+        Returns:
+            object: The loaded model
+        """
+        if name in self._models:
+            return self._models[name]
+
+        if name not in self._loaders:
+            raise KeyError(
+                f"Model '{name}' is not registered. "
+                f"Available models: {', '.join(self._loaders)}"
+            )
+
+        with self._locks[name]:
+            if name not in self._models:
+                rss_before = current_rss_mb()
+                start = time.perf_counter()
+                model = self._loaders[name]()
+                self._stats[name] = {
+                    'load_seconds': round(time.perf_counter() - start, 3),
+                    'rss_mb': round(current_rss_mb() - rss_before, 1)
+                }
+                self._models[name] = model
+        return self._models[name]
+
+    def loader(self, name):
+        """
+        Return the loader registered for a model.
+
+        Args:
+            name (str): Registry name of the model
+
+        Returns:
+            callable: The registered loader
+        """
+        with self._lock:
+            return self._loaders[name]
+
+    def is_loaded(self, name):
+        """Check whether a model has already been loaded."""
+        return name in self._models
+
+    def unload(self, name):
+        """Drop a loaded model so that the next access reloads it."""
+        with self._lock:
+            self._models.pop(name, None)
+            self._stats.pop(name, None)
+
+    def warmup(self, names=None):
+        """
+        Load models ahead of the first request.
+
+        Args:
+            names (list, optional): Models to load, defaults to all registered
+
+        Returns:
+            dict: Load statistics of the requested models
+        """
+        names = list(self._loaders) if names is None else names
+        for name in names:
+            self.get(name)
+        return {name: self._stats[name] for name in names}
+
+    def stats(self):
+        """
+        Report load time and memory of every registered model.
+
+        Memory is the growth in process RSS while the model loaded, which
+        is an approximation when other threads allocate at the same time.
+
+        Returns:
+            dict: Per-model load status, load time and RSS growth
+        """
+        return {
+            name: {'loaded': name in self._models, **self._stats.get(name, {})}
+            for name in self._loaders
+        }
+
+
+def _load_nlp(profile):
+    from .nlp_pipeline import load_pipeline
+    return load_pipeline(profile, DEFAULT_MODEL)
+
+
+def _nlp_loader(profile):
+    # A partial of a module-level function pickles, so worker processes can
+    # be handed the loader
+    return functools.partial(_load_nlp, profile)
+
+
+def _load_zero_shot_classifier():
+    from transformers import pipeline
+    return pipeline('zero-shot-classification', model=ZERO_SHOT_MODEL)
+
+
+def _load_skill_embeddings():
+    import joblib
+    try:
+        return joblib.load(SKILL_EMBEDDINGS_PATH)
+    except Exception:
+        # Return empty embeddings if file doesn't exist
+        return {}
+
+
+def _load_skill_embedding_index():
+    from .utils.embedding_index import SkillEmbeddingIndex
+    return SkillEmbeddingIndex.from_artifact(registry.get('skill_embeddings'))
+
+
+def _load_skill_trend_forecaster():
+    from .utils.trend_forecaster import SkillTrendForecaster
+    cache_path = os.path.join(cache_dir(), SKILL_TREND_FORECASTER_FILE)
+    return SkillTrendForecaster.from_directory(SKILL_TRENDS_DIR, cache_path)
+
+
+def _load_skill_prerequisite_graph():
+    from .utils.skill_graph import PrerequisiteGraph
+    return PrerequisiteGraph.from_file(SKILL_PREREQUISITES_PATH)
+
+
+registry = ModelRegistry()
+
+for _profile in PIPELINE_PROFILES:
+    registry.register(nlp_model_name(_profile), _nlp_loader(_profile))
+registry.register('zero_shot_classifier', _load_zero_shot_classifier)
+registry.register('skill_embeddings', _load_skill_embeddings)
+registry.register('skill_embedding_index', _load_skill_embedding_index)
+registry.register('skill_trend_forecaster', _load_skill_trend_forecaster)
+registry.register('skill_prerequisite_graph', _load_skill_prerequisite_graph)
@@ -0,0 +1,59 @@
+DEFAULT_MODEL = 'en_core_web_sm'
+
+# Components of the trained English pipelines that a profile may drop
+TRAINED_COMPONENTS = [
+    'tok2vec', 'tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer', 'ner'
+]
+
+# Pipeline profiles: which components to exclude and whether to add a
+# rule-based sentencizer in place of the dependency parser
+PIPELINE_PROFILES = {
+    'full': {
+        'exclude': [],
+        'sentencizer': False
+    },
+    'sentences_only': {
+        'exclude': TRAINED_COMPONENTS,
+        'sentencizer': True
+    },
+    'ner_only': {
+        'exclude': ['tagger', 'parser', 'senter', 'attribute_ruler', 'lemmatizer'],
+        'sentencizer': False
+    },
+    'tokens_only': {
+        'exclude': TRAINED_COMPONENTS,
+        'sentencizer': False
+    }
+}
+
+
+def load_pipeline(profile='full', model=DEFAULT_MODEL):
+    """
+    Load a spaCy pipeline trimmed to a named profile.
+    
+    Excluded components are never loaded, so they cost neither load time
+    nor memory. Profiles that only need sentence boundaries get the
+    rule-based sentencizer instead of the dependency parser.
+    
+    Args:
+        profile (str): One of the keys of PIPELINE_PROFILES
+        model (str): Name or path of the spaCy model package
+    
+    Returns:
+        spacy.language.Language: The loaded pipeline
+    """
+    if profile not in PIPELINE_PROFILES:
+        raise ValueError(
+            f"Unknown pipeline profile '{profile}'. "
+            f"Available profiles: {', '.join(PIPELINE_PROFILES)}"
+        )
+
+    import spacy
+
+    settings = PIPELINE_PROFILES[profile]
+    nlp = spacy.load(model, exclude=settings['exclude'])
+
+    if settings['sentencizer'] and 'sentencizer' not in nlp.pipe_names:
+        nlp.add_pipe('sentencizer')
+
+    return nlp
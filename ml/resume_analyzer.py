@@ -1,17 +1,54 @@
-import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import cached_property
+from itertools import islice
+import copy
+import hashlib
+import os
 import re
 import json
+from .model_registry import nlp_model_name, registry
+from .utils.cache import LRUCache
+from .utils.skill_matcher import SkillMatcher, SkillMentionIndex
+
+# Blank lines separate the blocks used for incremental re-analysis
+BLOCK_SEPARATOR = re.compile(r'\n[ \t\r\f\v]*\n\s*')
+
+# Date ranges and education keywords, matched together in one pass
+SECTION_PATTERN = re.compile(
+    r'(?P<date>(\d{4})\s*-\s*(\d{4}|present))'
+    r'|(?P<education>bachelor|master|phd|degree|university|college|school)',
+    re.IGNORECASE
+)
+
+# Per-process analyzer of the analyze_resumes worker pool
+_worker_analyzer = None
+
+
+def _init_batch_worker(analyzer_class, pipeline_profile, nlp_loader):
+    """Build one analyzer per worker with the parent's spaCy pipeline loader."""
+    global _worker_analyzer
+    registry.register(nlp_model_name(pipeline_profile), nlp_loader)
+    _worker_analyzer = analyzer_class(pipeline_profile)
+
+
+def _analyze_batch(resume_texts, target_role, batch_size):
+    return list(_worker_analyzer.analyze_resumes(resume_texts, target_role, batch_size))
+
 
 class ResumeAnalyzer:
-    def __init__(self):
-        """Initialize the Resume Analyzer with NLP models and skill database."""
-        # Load spaCy model for NLP tasks
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, pipeline_profile='sentences_only', block_cache_size=10000):
+        """
+        Initialize the Resume Analyzer with NLP models and skill database.
         
-        # Initialize TF-IDF vectorizer for text analysis
-        self.tfidf = TfidfVectorizer(stop_words='english')
+        Args:
+            pipeline_profile (str): spaCy pipeline profile; analysis only
+                needs tokens and sentence boundaries
+            block_cache_size (int): Text blocks whose extraction results are
+                kept for incremental re-analysis
+        """
+        # spaCy model is shared process-wide and loaded on first use
+        self.pipeline_profile = pipeline_profile
         
         # Load skill database
         self.skill_database = self._load_skill_database()
@@ -19,6 +56,59 @@ class ResumeAnalyzer:
         # Load job role requirements
         self.job_requirements = self._load_job_requirements()
 
+        # Compile every skill list into a single matcher
+        self.skill_matcher = self._build_skill_matcher()
+        
+        # Per-block extraction results keyed by block content hash
+        self.block_cache = LRUCache(block_cache_size)
+
+    @property
+    def nlp(self):
+        """spaCy pipeline for the configured profile."""
+        return registry.get(nlp_model_name(self.pipeline_profile))
+
+    @cached_property
+    def tfidf(self):
+        """TF-IDF vectorizer for text analysis."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(stop_words='english')
+
+    @cached_property
+    def role_matrix(self):
+        """Sparse role x skill matrix over the job requirements."""
+        from .utils.role_matrix import RoleSkillMatrix
+        return RoleSkillMatrix(self.job_requirements)
+
+    @cached_property
+    def taxonomy_version(self):
+        """Digest of the skill database and role requirements."""
+        taxonomy = json.dumps(
+            {'skills': self.skill_database, 'roles': self.job_requirements},
+            sort_keys=True
+        )
+        return hashlib.sha256(taxonomy.encode('utf-8')).hexdigest()[:16]
+
+    @cached_property
+    def _skill_categories(self):
+        """Lowercased technical skill name to its category."""
+        return {
+            skill.lower(): category
+            for category, skills in self.skill_database['technical_skills'].items()
+            for skill in skills
+        }
+
+    def get_skill_category(self, skill_name):
+        """
+        Category of a technical skill in the skill database.
+        
+        Args:
+            skill_name (str): Name of the skill, matched case-insensitively
+        
+        Returns:
+            str: The category, or None if the skill is not a known technical skill
+        """
+        return self._skill_categories.get(skill_name.lower())
+
     def _load_skill_database(self):
         """Load comprehensive skill database."""
         return {
@@ -55,6 +145,19 @@ class ResumeAnalyzer:
             ]
         }
 
+    def _build_skill_matcher(self):
+        """Build one matcher over technical skills, soft skills and certifications."""
+        taxonomy = dict(self.skill_database['technical_skills'])
+        taxonomy['soft_skills'] = self.skill_database['soft_skills']
+        taxonomy['certifications'] = self.skill_database['certifications']
+        return SkillMatcher(taxonomy)
+
+    def _mention_index(self, doc):
+        """Scan the document once and cache its skill mention index."""
+        if 'skill_index' not in doc.user_data:
+            doc.user_data['skill_index'] = self.skill_matcher.index(doc.text)
+        return doc.user_data['skill_index']
+
     def _load_job_requirements(self):
         """Load job role requirements and expected skills."""
         return {
@@ -109,14 +212,230 @@ class ResumeAnalyzer:
         # Process resume text with spaCy
         doc = self.nlp(resume_text)
         
+        return self._analyze_doc(doc, target_role)
+
+    def analyze_resumes(self, resume_texts, target_role=None, batch_size=64, n_process=1):
+        """
+        Analyze a stream of resumes in batches.
+        
+        Texts are streamed through nlp.pipe, so memory stays bounded by the
+        batch size rather than the number of resumes, and results are
+        identical to calling analyze_resume on each text. With several
+        processes, batches of texts go to a pool of spawned workers that
+        each own an analyzer, so parsing and every extractor run in
+        parallel; at most two batches per worker are in flight.
+        
+        Args:
+            resume_texts (iterable): Resume texts, consumed lazily
+            target_role (str, optional): Specific job role to analyze against
+            batch_size (int): Number of texts per spaCy batch and per worker task
+            n_process (int): Worker processes, -1 for all cores
+        
+        Yields:
+            dict: Analysis results in the same order as the input texts
+        """
+        if n_process == -1:
+            n_process = os.cpu_count() or 1
+        if n_process > 1:
+            yield from self._analyze_in_workers(resume_texts, target_role, batch_size, n_process)
+            return
+        
+        for doc in self.nlp.pipe(resume_texts, batch_size=batch_size):
+            yield self._analyze_doc(doc, target_role)
+
+    def _analyze_in_workers(self, resume_texts, target_role, batch_size, n_process):
+        """Run analyze_resumes over batches of texts in a spawned process pool."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Spawned workers inherit no threads or model state from this
+        # process; they load the pipeline with the loader registered here
+        nlp_loader = registry.loader(nlp_model_name(self.pipeline_profile))
+        with ProcessPoolExecutor(
+            max_workers=n_process,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_batch_worker,
+            initargs=(type(self), self.pipeline_profile, nlp_loader)
+        ) as pool:
+            texts = iter(resume_texts)
+            pending = deque()
+            while True:
+                batch = list(islice(texts, batch_size))
+                if batch:
+                    pending.append(pool.submit(_analyze_batch, batch, target_role, batch_size))
+                if not pending:
+                    break
+                if not batch or len(pending) > 2 * n_process:
+                    yield from pending.popleft().result()
+
+    def analyze_resume_incremental(self, resume_text, target_role=None):
+        """
+        Analyze a resume, reusing results for unchanged parts of the text.
+        
+        The text is split into blocks at blank lines. Extraction results
+        are cached per block by content hash, so when a user edits one
+        bullet point only the edited block is parsed again and the cost of
+        re-analysis follows the size of the edit. The output has the same
+        shape as analyze_resume; sentences are segmented within blocks.
+        
+        Args:
+            resume_text (str): The text content of the resume
+            target_role (str, optional): Specific job role to analyze against
+        
+        Returns:
+            dict: Analysis results including skills, experience, and recommendations
+        """
+        blocks = []
+        position = 0
+        for separator in BLOCK_SEPARATOR.finditer(resume_text):
+            blocks.append((resume_text[position:separator.start()], position))
+            position = separator.end()
+        blocks.append((resume_text[position:], position))
+        blocks = [(text, offset) for text, offset in blocks if text.strip()]
+        
+        keys = [self._block_key(text) for text, _ in blocks]
+        results = {key: self.block_cache.get(key) for key in keys}
+        
+        # Parse only the blocks that have not been seen before
+        changed = [
+            (key, text) for key, (text, _) in zip(keys, blocks)
+            if results[key] is None
+        ]
+        changed = list(dict(changed).items())
+        docs = self.nlp.pipe(text for _, text in changed)
+        for (key, _), doc in zip(changed, docs):
+            results[key] = self._extract_block(doc)
+            self.block_cache.put(key, results[key])
+        
+        return self._merge_blocks(
+            [(results[key], offset) for key, (_, offset) in zip(keys, blocks)],
+            target_role
+        )
+
+    def analyze_resume_chunked(self, resume_text, target_role=None, max_chunk_chars=100000):
+        """
+        Analyze a very long document in bounded-size chunks.
+        
+        The text is cut into chunks of at most max_chunk_chars characters,
+        preferably at blank lines, then line ends, then sentence ends, and
+        the chunks are parsed one at a time, so peak memory follows the
+        chunk size rather than the document size and spaCy's max_length is
+        never reached. Chunks are produced lazily and each one's experience
+        and education entries are appended as soon as it is parsed, so only
+        one chunk's Doc is alive at a time. Skill mentions are indexed in one
+        scan of the whole text rather than per chunk, so a multi-word skill
+        cut by a chunk boundary is still found and skill counts and
+        confidences match analyze_resume exactly; the chunks reuse that
+        index instead of scanning again. A chunk cut at a word boundary
+        (only when a line is longer than max_chunk_chars) can split the
+        sentence around it. A text that fits in one chunk gives exactly the
+        result of analyze_resume.
+        
+        Args:
+            resume_text (str): The text content of the resume
+            target_role (str, optional): Specific job role to analyze against
+            max_chunk_chars (int): Largest chunk passed to spaCy at once
+        
+        Returns:
+            dict: Analysis results including skills, experience, and recommendations
+        """
+        index = self.skill_matcher.index(resume_text)
+        extracted_info = {
+            'skills': self._extract_skills(index),
+            'experience': [],
+            'education': [],
+            'certifications': self._extract_certifications(index)
+        }
+        for text, offset in self._iter_chunks(resume_text, max_chunk_chars):
+            sections = self._extract_sections(self.nlp(text), index, offset)
+            extracted_info['experience'].extend(sections['experience'])
+            extracted_info['education'].extend(sections['education'])
+        
+        return self._finalize_analysis(extracted_info, target_role)
+
+    def _iter_chunks(self, text, max_chars):
+        """
+        Split text into consecutive chunks of at most max_chars characters.
+        
+        Yields:
+            tuple: (chunk text, character offset of the chunk)
+        """
+        position = 0
+        while len(text) - position > max_chars:
+            window = text[position:position + max_chars]
+            # Cut after the last section, line, sentence or word boundary
+            for boundary in ('\n\n', '\n', '. ', ' '):
+                cut = window.rfind(boundary)
+                if cut > 0:
+                    cut += len(boundary)
+                    break
+            else:
+                cut = max_chars
+            yield text[position:position + cut], position
+            position += cut
+        yield text[position:], position
+
+    def _block_key(self, text):
+        """Cache key of a text block: its content and the taxonomy version."""
+        digest = hashlib.sha256(text.encode('utf-8'))
+        digest.update(self.taxonomy_version.encode('utf-8'))
+        digest.update(self.pipeline_profile.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _extract_block(self, doc):
+        """Extract the position-independent results of one block of text."""
+        index = self._mention_index(doc)
+        sections = self._extract_sections(doc, index)
+        return {
+            'index': index,
+            'experience': sections['experience'],
+            'education': sections['education']
+        }
+
+    def _merge_blocks(self, blocks, target_role=None):
+        """
+        Merge per-block results into a full analysis.
+        
+        Args:
+            blocks (list): (block result, character offset) tuples in order
+            target_role (str, optional): Specific job role to analyze against
+        """
+        index = SkillMentionIndex.merge(
+            self.skill_matcher.patterns,
+            [(block['index'], offset) for block, offset in blocks]
+        )
+        
+        extracted_info = {
+            'skills': self._extract_skills(index),
+            'experience': [
+                entry for block, _ in blocks
+                for entry in copy.deepcopy(block['experience'])
+            ],
+            'education': [
+                entry for block, _ in blocks
+                for entry in copy.deepcopy(block['education'])
+            ],
+            'certifications': self._extract_certifications(index)
+        }
+        
+        return self._finalize_analysis(extracted_info, target_role)
+
+    def _analyze_doc(self, doc, target_role=None):
+        """Run all extractors over a parsed resume."""
+        # Index every skill mention once for all extractors
+        index = self._mention_index(doc)
+        
         # Extract information
         extracted_info = {
-            'skills': self._extract_skills(doc),
-            'experience': self._extract_experience(doc),
-            'education': self._extract_education(doc),
-            'certifications': self._extract_certifications(doc)
+            'skills': self._extract_skills(index),
+            **self._extract_sections(doc, index),
+            'certifications': self._extract_certifications(index)
         }
         
+        return self._finalize_analysis(extracted_info, target_role)
+
+    def _finalize_analysis(self, extracted_info, target_role=None):
+        """Add role match and recommendations to extracted information."""
         # If target role specified, analyze match
         if target_role:
             extracted_info['role_match'] = self._analyze_role_match(
@@ -132,43 +451,35 @@ class ResumeAnalyzer:
         
         return extracted_info
 
-    def _extract_skills(self, doc):
-        """Extract skills from resume text using NLP."""
+    def _extract_skills(self, index):
+        """Extract skills from a resume's skill mention index."""
         skills = {
             'technical': [],
             'soft': [],
             'other': []
         }
         
-        # Extract skills using pattern matching and NLP
-        text = doc.text.lower()
-        
-        # Check technical skills
-        for category, skill_list in self.skill_database['technical_skills'].items():
-            for skill in skill_list:
-                if skill.lower() in text:
-                    skills['technical'].append({
-                        'name': skill,
-                        'category': category,
-                        'confidence': self._calculate_skill_confidence(doc, skill)
-                    })
-        
-        # Check soft skills
-        for skill in self.skill_database['soft_skills']:
-            if skill.lower() in text:
+        # Extract skills with a single pass of the skill matcher
+        technical_categories = self.skill_database['technical_skills']
+        for skill, category in index.skills():
+            if category in technical_categories:
+                skills['technical'].append({
+                    'name': skill,
+                    'category': category,
+                    'confidence': self._calculate_skill_confidence(index, skill)
+                })
+            elif category == 'soft_skills':
                 skills['soft'].append({
                     'name': skill,
-                    'confidence': self._calculate_skill_confidence(doc, skill)
+                    'confidence': self._calculate_skill_confidence(index, skill)
                 })
         
         return skills
 
-    def _calculate_skill_confidence(self, doc, skill):
+    def _calculate_skill_confidence(self, index, skill):
         """Calculate confidence score for extracted skill."""
-        # This would use more sophisticated methods in production
-        # Here's a simple implementation
-        skill_lower = skill.lower()
-        mentions = len([token for token in doc if token.text.lower() == skill_lower])
+        # Mentions come from the per-document index, multi-token skills included
+        mentions = index.count(skill)
         context_score = 0.7  # Base confidence
         
         if mentions > 1:
@@ -176,45 +487,68 @@ class ResumeAnalyzer:
         
         return min(0.95, context_score)  # Cap at 95% confidence
 
-    def _extract_experience(self, doc):
-        """Extract work experience information."""
-        experience = []
-        
-        # Simple regex pattern for date ranges
-        date_pattern = r'(\d{4})\s*-\s*(\d{4}|present)'
-        
-        # Find paragraphs that might contain experience
-        for para in doc.sents:
-            text = para.text
-            dates = re.findall(date_pattern, text, re.IGNORECASE)
-            
-            if dates:
-                experience.append({
-                    'period': dates[0],
-                    'description': text,
-                    'skills_mentioned': self._extract_skills_from_text(text)
-                })
+    def _extract_sections(self, doc, skill_index, offset=0):
+        """
+        Extract experience and education in one sweep.
         
-        return experience
-
-    def _extract_education(self, doc):
-        """Extract education information."""
-        education = []
+        Date ranges and education keywords are found by a single
+        precompiled pattern over the whole text, and each match is mapped
+        back to its sentence by offset. A match that straddles a sentence
+        boundary would not exist sentence by sentence, so the sentences it
+        touches are rescanned on their own.
         
-        # Keywords for education detection
-        edu_keywords = [
-            'bachelor', 'master', 'phd', 'degree',
-            'university', 'college', 'school'
+        Args:
+            doc (Doc): Parsed text
+            skill_index (SkillMentionIndex): Skill mentions of the text
+            offset (int): Position of the Doc's text in the indexed text
+        """
+        sentences = list(doc.sents)
+        sentence_starts = [sent.start_char for sent in sentences]
+        periods = {}
+        education_sentences = set()
+        rescan = set()
+        
+        for match in SECTION_PATTERN.finditer(doc.text):
+            index = bisect_right(sentence_starts, match.start()) - 1
+            if index < 0:
+                continue
+            if match.end() > sentences[index].end_char:
+                rescan.update(range(index, bisect_left(sentence_starts, match.end())))
+            elif match.group('date'):
+                periods.setdefault(index, match.group(2, 3))
+            else:
+                education_sentences.add(index)
+        
+        for index in rescan:
+            periods.pop(index, None)
+            education_sentences.discard(index)
+            for match in SECTION_PATTERN.finditer(sentences[index].text):
+                if match.group('date'):
+                    periods.setdefault(index, match.group(2, 3))
+                else:
+                    education_sentences.add(index)
+        
+        experience = [
+            {
+                'period': periods[index],
+                'description': sentences[index].text,
+                'skills_mentioned': self._technical_skills_in_span(skill_index, sentences[index], offset)
+            }
+            for index in sorted(periods)
         ]
         
-        for sent in doc.sents:
-            if any(keyword in sent.text.lower() for keyword in edu_keywords):
-                education.append({
-                    'description': sent.text,
-                    'level': self._determine_education_level(sent.text)
-                })
+        education = [
+            {
+                'description': sentences[index].text,
+                'level': self._determine_education_level(sentences[index].text)
+            }
+            for index in sorted(education_sentences)
+        ]
         
-        return education
+        return {
+            'experience': experience,
+            'education': education
+        }
 
     def _determine_education_level(self, text):
         """Determine the level of education from text."""
@@ -228,12 +562,12 @@ class ResumeAnalyzer:
         else:
             return 'Other'
 
-    def _extract_certifications(self, doc):
+    def _extract_certifications(self, index):
         """Extract certification information."""
         certifications = []
         
-        for cert in self.skill_database['certifications']:
-            if cert.lower() in doc.text.lower():
+        for cert, category in index.skills():
+            if category == 'certifications':
                 certifications.append({
                     'name': cert,
                     'verified': False  # Would need external verification
@@ -252,21 +586,16 @@ class ResumeAnalyzer:
         requirements = self.job_requirements[target_role]
         
         # Extract all technical skills
-        technical_skills = [
+        technical_skills = {
             skill['name'].lower()
             for skill in extracted_info['skills']['technical']
-        ]
-        
-        # Calculate match percentages
-        required_match = sum(
-            1 for skill in requirements['required_skills']
-            if skill.lower() in technical_skills
-        ) / len(requirements['required_skills'])
+        }
         
-        preferred_match = sum(
-            1 for skill in requirements['preferred_skills']
-            if skill.lower() in technical_skills
-        ) / len(requirements['preferred_skills'])
+        # Calculate match percentages for every role in one product
+        required, preferred = self.role_matrix.coverage(technical_skills)
+        row = self.role_matrix.role_index(target_role)
+        required_match = float(required[row])
+        preferred_match = float(preferred[row])
         
         return {
             'overall_match': (required_match * 0.7 + preferred_match * 0.3) * 100,
@@ -319,15 +648,13 @@ class ResumeAnalyzer:
         
         return recommendations
 
-    def _extract_skills_from_text(self, text):
-        """Extract skills mentioned in a specific text segment."""
-        skills = []
-        text_lower = text.lower()
+    def _technical_skills_in_span(self, skill_index, span, offset=0):
+        """Look up technical skills mentioned inside a span of the document."""
+        technical_categories = self.skill_database['technical_skills']
         
-        # Check all skills in database
-        for category, skill_list in self.skill_database['technical_skills'].items():
-            for skill in skill_list:
-                if skill.lower() in text_lower:
-                    skills.append(skill)
-        
-        return skills 
\ No newline at end of file
+        return [
+            skill for skill, category in skill_index.skills_between(
+                offset + span.start_char, offset + span.end_char
+            )
+            if category in technical_categories
+        ]
@@ -1,34 +1,145 @@
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from transformers import pipeline
-import spacy
-import joblib
-import os
+from functools import cached_property
+from .model_registry import ZERO_SHOT_MODEL, nlp_model_name, registry
+from .utils.cache import LRUCache
+
+# Hypothesis used by the zero-shot pipeline for each candidate label
+RELEVANCE_HYPOTHESIS = 'This example is {}.'
+
+# Priority of each code in batch gap results; code 0 means no gap
+PRIORITY_LEVELS = [None, 'Low', 'Medium', 'High', 'Critical']
+
+# Smallest gap of the Medium, High and Critical priorities
+PRIORITY_THRESHOLDS = (15, 30, 50)
+
+class SkillGapBatch:
+    """
+    Skill gaps of many users against many roles, as compact arrays.
+    
+    gaps[u, r, s] is how far user u is below role r's level in skill s,
+    priorities[u, r, s] the priority code (index into PRIORITY_LEVELS) and
+    total_gap_scores[u, r] the sum over skills. to_dict expands one
+    (user, role) cell into the analyze_skill_gap format on demand.
+    """
+
+    def __init__(self, analyzer, skill_names, user_levels, role_levels, gaps,
+                 priorities, total_gap_scores):
+        self.analyzer = analyzer
+        self.skill_names = list(skill_names)
+        self.user_levels = user_levels
+        self.role_levels = role_levels
+        self.gaps = gaps
+        self.priorities = priorities
+        self.total_gap_scores = total_gap_scores
+
+    @property
+    def shape(self):
+        """(users, roles) covered by the batch."""
+        return self.total_gap_scores.shape
+
+    def priority_counts(self):
+        """
+        Number of gaps per priority for every (user, role).
+        
+        Returns:
+            np.ndarray: users x roles x len(PRIORITY_LEVELS) counts; column
+                0 counts skills without a gap
+        """
+        return np.stack(
+            [(self.priorities == code).sum(axis=2) for code in range(len(PRIORITY_LEVELS))],
+            axis=2
+        )
+
+    def to_dict(self, user, role):
+        """
+        Gap analysis of one user against one role.
+        
+        Args:
+            user (int): Row of the user in the user level matrix
+            role (int): Row of the role in the role level matrix
+        
+        Returns:
+            dict: Same result as analyze_skill_gap for these levels
+        """
+        gaps = {}
+        for column in np.flatnonzero(self.gaps[user, role]).tolist():
+            gap = self.gaps[user, role, column].item()
+            gaps[self.skill_names[column]] = {
+                'current_level': self.user_levels[user, column].item(),
+                'required_level': self.role_levels[role, column].item(),
+                'gap': gap,
+                'priority': PRIORITY_LEVELS[self.priorities[user, role, column]]
+            }
+        
+        return {
+            'gaps': gaps,
+            'total_gap_score': self.total_gap_scores[user, role].item(),
+            'recommendations': self.analyzer._generate_recommendations(gaps)
+        }
+
+    def iter_dicts(self):
+        """Yield (user, role, analysis dict) for every cell, built lazily."""
+        users, roles = self.shape
+        for user in range(users):
+            for role in range(roles):
+                yield user, role, self.to_dict(user, role)
 
 class SkillAnalyzer:
-    def __init__(self):
-        """Initialize the Skill Analyzer with necessary models and tools."""
-        # Load spaCy model for NLP tasks
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, pipeline_profile='full', relevance_cache_size=50000,
+                 relevance_cache_path=None):
+        """
+        Initialize the Skill Analyzer with necessary models and tools.
         
-        # Initialize BERT-based skill classifier
-        self.skill_classifier = pipeline("zero-shot-classification")
+        Models are shared process-wide through the model registry and are
+        only loaded when an analysis first needs them.
         
-        # Load pre-trained skill embeddings (would be trained separately)
-        self.skill_embeddings = self._load_skill_embeddings()
+        Args:
+            pipeline_profile (str): spaCy pipeline profile used if the NLP
+                pipeline is ever requested
+            relevance_cache_size (int): Maximum cached (skill, role) scores
+            relevance_cache_path (str, optional): File the relevance cache is
+                loaded from and saved to
+        """
+        self.pipeline_profile = pipeline_profile
         
-        # Initialize TF-IDF vectorizer for skill description analysis
-        self.tfidf = TfidfVectorizer(stop_words='english')
+        # Relevance scores keyed by (skill, role, model version)
+        self.relevance_cache = LRUCache(relevance_cache_size, relevance_cache_path)
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded lazily."""
+        return registry.get(nlp_model_name(self.pipeline_profile))
+
+    @property
+    def skill_classifier(self):
+        """BERT-based zero-shot skill classifier."""
+        return registry.get('zero_shot_classifier')
+
+    @property
+    def skill_embeddings(self):
+        """Pre-trained skill embeddings (would be trained separately)."""
+        return registry.get('skill_embeddings')
+
+    @property
+    def embedding_index(self):
+        """Vectorized relevance engine built from the skill embeddings."""
+        return registry.get('skill_embedding_index')
+
+    @property
+    def growth_forecaster(self):
+        """Skill demand forecaster fitted on the trend data."""
+        return registry.get('skill_trend_forecaster')
 
-    def _load_skill_embeddings(self):
-        """Load pre-trained skill embeddings from file."""
-        model_path = os.path.join(os.path.dirname(__file__), 'models', 'skill_embeddings.joblib')
-        try:
-            return joblib.load(model_path)
-        except:
-            # Return empty embeddings if file doesn't exist
-            return {}
+    @property
+    def prerequisite_graph(self):
+        """Skill prerequisite graph loaded from the taxonomy data."""
+        return registry.get('skill_prerequisite_graph')
+
+    @cached_property
+    def tfidf(self):
+        """TF-IDF vectorizer for skill description analysis."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(stop_words='english')
 
     def analyze_skill_gap(self, user_skills, required_skills):
         """
@@ -60,6 +171,48 @@ class SkillAnalyzer:
             'recommendations': self._generate_recommendations(gaps)
         }
 
+    def analyze_skill_gap_batch(self, user_levels, role_levels, skill_names):
+        """
+        Analyze the gaps of every user against every role at once.
+        
+        Levels are given as matrices over the same skill columns; a user
+        without a skill has level 0 and a role not requiring one has level 0.
+        Gaps, priority codes and total gap scores are computed with array
+        broadcasting, and each (user, role) cell matches analyze_skill_gap
+        for the same levels.
+        
+        Args:
+            user_levels (array-like): users x skills current levels
+            role_levels (array-like): roles x skills required levels
+            skill_names (list): Skill name of each column
+        
+        Returns:
+            SkillGapBatch: Gap arrays with lazy expansion into dicts
+        """
+        user_levels = np.asarray(user_levels)
+        role_levels = np.asarray(role_levels)
+        # Unsigned levels would wrap around when the user is above the role
+        dtype = np.promote_types(np.result_type(user_levels, role_levels), np.int8)
+        
+        # users x roles x skills, computed in place to avoid temporaries
+        gaps = np.empty((len(user_levels), len(role_levels), len(skill_names)), dtype=dtype)
+        np.subtract(role_levels[np.newaxis, :, :], user_levels[:, np.newaxis, :], out=gaps, dtype=dtype)
+        np.maximum(gaps, 0, out=gaps)
+        
+        priorities = (gaps > 0).astype(np.int8)
+        for threshold in PRIORITY_THRESHOLDS:
+            priorities += gaps >= threshold
+        
+        # Summed skill by skill, in column order, like the scalar path
+        total_dtype = np.int64 if np.issubdtype(dtype, np.integer) else dtype
+        total_gap_scores = np.zeros(gaps.shape[:2], dtype=total_dtype)
+        for column in range(gaps.shape[2]):
+            total_gap_scores += gaps[:, :, column]
+        
+        return SkillGapBatch(
+            self, skill_names, user_levels, role_levels, gaps, priorities, total_gap_scores
+        )
+
     def _calculate_priority(self, gap, required_level):
         """Calculate priority level for a skill gap."""
         if gap >= 50:
@@ -99,17 +252,35 @@ class SkillAnalyzer:
         Returns:
             dict: Predicted growth metrics
         """
-        # In a real implementation, this would use time series analysis
-        # and market trend data to make predictions
-        base_growth = np.random.normal(10, 2)  # Mock growth rate
-        confidence = np.random.uniform(0.7, 0.9)  # Mock confidence score
+        return self.predict_skill_growth_batch([skill_name], timeframe_months)[0]
+
+    def predict_skill_growth_batch(self, skill_names, timeframe_months=6):
+        """
+        Predict the growth of many skills at once.
         
-        return {
-            'skill': skill_name,
-            'predicted_growth': base_growth,
-            'confidence': confidence,
-            'timeframe': timeframe_months
-        }
+        Growth is the demand change forecast by the skill's fitted damped
+        trend model, in percent of its current demand. Skills without trend
+        data get a growth of None and zero confidence.
+        
+        Args:
+            skill_names (list): Names of the skills
+            timeframe_months (int): Number of months to predict ahead
+        
+        Returns:
+            list: Predicted growth metrics per skill
+        """
+        growth, confidence = self.growth_forecaster.predict_growth(skill_names, timeframe_months)
+        return [
+            {
+                'skill': skill_name,
+                'predicted_growth': None if np.isnan(skill_growth) else float(skill_growth),
+                'confidence': float(skill_confidence),
+                'timeframe': timeframe_months
+            }
+            for skill_name, skill_growth, skill_confidence in zip(
+                skill_names, growth.tolist(), confidence.tolist()
+            )
+        ]
 
     def analyze_skill_relevance(self, skill_name, job_role):
         """
@@ -122,20 +293,133 @@ class SkillAnalyzer:
         Returns:
             dict: Relevance analysis
         """
-        # Use zero-shot classification to determine relevance
-        result = self.skill_classifier(
-            skill_name,
-            candidate_labels=[job_role, f"not_{job_role}"],
-        )
+        return self.analyze_skill_relevance_batch([(skill_name, job_role)])[0]
+
+    def analyze_skill_relevance_batch(self, pairs, batch_size=32):
+        """
+        Analyze the relevance of many (skill, job role) pairs at once.
         
-        relevance_score = result['scores'][0]
+        Pairs whose skill and role both have embeddings are scored with the
+        embedding index in one vectorized product. Out-of-vocabulary pairs
+        fall back to zero-shot classification: cached ones are answered from
+        the relevance cache and the rest are scored together in batched
+        inference and then cached.
         
-        return {
-            'skill': skill_name,
-            'job_role': job_role,
-            'relevance_score': relevance_score,
-            'is_relevant': relevance_score > 0.6
-        }
+        Args:
+            pairs (iterable): (skill_name, job_role) tuples
+            batch_size (int): Pairs per forward pass of the classifier
+        
+        Returns:
+            list: Relevance analysis for each pair, in input order
+        """
+        pairs = list(pairs)
+        scores = {}
+        uncached = []
+        
+        embedding_scores = self.embedding_index.relevance_batch(pairs)
+        for (skill_name, job_role), score in zip(pairs, embedding_scores):
+            if not np.isnan(score):
+                scores[self._relevance_key(skill_name, job_role)] = float(score)
+        
+        for skill_name, job_role in pairs:
+            key = self._relevance_key(skill_name, job_role)
+            if key in scores:
+                continue
+            score = self.relevance_cache.get(key)
+            if score is None:
+                scores[key] = None
+                uncached.append((skill_name, job_role))
+            else:
+                scores[key] = score
+        
+        if uncached:
+            for (skill_name, job_role), score in zip(
+                uncached, self._classify_relevance(uncached, batch_size)
+            ):
+                key = self._relevance_key(skill_name, job_role)
+                scores[key] = score
+                self.relevance_cache.put(key, score)
+        
+        results = []
+        for skill_name, job_role in pairs:
+            relevance_score = scores[self._relevance_key(skill_name, job_role)]
+            results.append({
+                'skill': skill_name,
+                'job_role': job_role,
+                'relevance_score': relevance_score,
+                'is_relevant': relevance_score > 0.6
+            })
+        return results
+
+    def get_relevant_skills(self, job_role, top_n=10):
+        """
+        Find the skills most relevant to a job role.
+        
+        Args:
+            job_role (str): Target job role
+            top_n (int): Number of skills to return
+        
+        Returns:
+            list: Relevance analysis of the top skills, best first; empty if
+                the role has no embedding
+        """
+        return [
+            {
+                'skill': skill_name,
+                'job_role': job_role,
+                'relevance_score': relevance_score,
+                'is_relevant': relevance_score > 0.6
+            }
+            for skill_name, relevance_score in self.embedding_index.top_skills(job_role, top_n)
+        ]
+
+    def save_relevance_cache(self, path=None):
+        """Persist the relevance cache to disk."""
+        self.relevance_cache.save(path)
+
+    def _relevance_key(self, skill_name, job_role):
+        """Cache key of a relevance score."""
+        return (skill_name.lower(), job_role.lower(), ZERO_SHOT_MODEL)
+
+    def _classify_relevance(self, pairs, batch_size):
+        """
+        Score (skill, role) pairs with the zero-shot model in batches.
+        
+        Reproduces the single-label zero-shot pipeline: each pair is scored
+        against the role and "not_<role>" hypotheses and the entailment
+        logits of the two are softmaxed. Building the NLI inputs directly
+        lets pairs with different roles share one forward pass.
+        """
+        import torch
+        
+        classifier = self.skill_classifier
+        model = classifier.model
+        tokenizer = classifier.tokenizer
+        entailment_id = classifier.entailment_id
+        
+        premises = []
+        hypotheses = []
+        for skill_name, job_role in pairs:
+            for label in (job_role, f"not_{job_role}"):
+                premises.append(skill_name)
+                hypotheses.append(RELEVANCE_HYPOTHESIS.format(label))
+        
+        entailment_logits = []
+        step = batch_size * 2
+        with torch.no_grad():
+            for start in range(0, len(premises), step):
+                inputs = tokenizer(
+                    premises[start:start + step],
+                    hypotheses[start:start + step],
+                    padding=True,
+                    truncation='only_first',
+                    return_tensors='pt'
+                ).to(model.device)
+                entailment_logits.append(model(**inputs).logits[:, entailment_id])
+        
+        # Softmax over (role, not_role) and keep the probability of the role
+        logits = torch.cat(entailment_logits).view(-1, 2)
+        return logits.softmax(dim=1)[:, 0].tolist()
 
     def get_skill_prerequisites(self, skill_name):
         """
@@ -147,12 +431,29 @@ class SkillAnalyzer:
         Returns:
             list: List of prerequisite skills
         """
-        # This would typically use a knowledge graph or skill taxonomy
-        # Here's a simplified example
-        skill_prerequisites = {
-            'React': ['JavaScript', 'HTML', 'CSS'],
-            'Machine Learning': ['Python', 'Statistics', 'Linear Algebra'],
-            'Cloud Architecture': ['Networking', 'Security', 'Operating Systems']
-        }
+        return self.prerequisite_graph.direct_prerequisites(skill_name)
+
+    def get_all_prerequisites(self, skill_name):
+        """
+        Determine every direct and transitive prerequisite of a skill.
+        
+        Args:
+            skill_name (str): Name of the skill
         
-        return skill_prerequisites.get(skill_name, []) 
\ No newline at end of file
+        Returns:
+            list: Prerequisite skills, each after its own prerequisites
+        """
+        return self.prerequisite_graph.prerequisites(skill_name)
+
+    def is_prerequisite(self, prerequisite, skill_name):
+        """
+        Check whether one skill is a direct or transitive prerequisite of another.
+        
+        Args:
+            prerequisite (str): Candidate prerequisite skill
+            skill_name (str): Skill that may require it
+        
+        Returns:
+            bool: True if skill_name requires prerequisite
+        """
+        return self.prerequisite_graph.is_prerequisite(prerequisite, skill_name)
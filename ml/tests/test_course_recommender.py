@@ -0,0 +1,68 @@
+import pytest
+
+from ml.benchmarks.course_batch import build_cohort, extend_catalog, run_reference
+from ml.course_recommender import CourseRecommender
+
+PREFERENCES = [
+    None,
+    {'max_duration': 50, 'max_price': 150, 'preferred_platforms': ['Coursera']},
+    {'priority_skills': ['Python', 'React', 'AWS'], 'max_price': 100}
+]
+
+
+@pytest.fixture(scope='module')
+def recommender():
+    recommender = CourseRecommender()
+    extend_catalog(recommender, 120, seed=0)
+    return recommender
+
+
+@pytest.mark.parametrize('preferences', PREFERENCES)
+def test_recommendations_match_scalar_reference(recommender, preferences):
+    skill_names = sorted(recommender.catalog.skill_names.tolist())
+    users, targets = build_cohort(skill_names, 50, seed=1)
+    reference = run_reference(recommender, users, targets, skill_names, preferences)
+
+    batch = recommender.recommend_courses_batch(users, targets, skill_names, preferences)
+    single = [
+        recommender.recommend_courses(
+            dict(zip(skill_names, user.tolist())),
+            dict(zip(skill_names, target.tolist())),
+            preferences
+        )
+        for user, target in zip(users, targets)
+    ]
+    assert any(reference)
+    assert batch == reference
+    assert single == reference
+
+
+def test_courses_follow_catalog(recommender):
+    assert recommender.courses is recommender.courses
+    assert sum(len(courses) for courses in recommender.courses.values()) == len(recommender.catalog)
+
+    fresh = CourseRecommender()
+    courses = fresh.courses
+    fresh.catalog = recommender.catalog
+    assert fresh.courses is not courses
+    assert 'synthetic' in fresh.courses
+
+
+def test_learning_path_follows_added_prerequisites():
+    from ml.model_registry import registry
+    from ml.utils.skill_graph import PrerequisiteGraph
+
+    original = registry.loader('skill_prerequisite_graph')
+    graph = PrerequisiteGraph({'React': ['JavaScript']})
+    registry.register('skill_prerequisite_graph', lambda: graph)
+    try:
+        recommender = CourseRecommender()
+        before = recommender.plan_learning_path(target_skills=['Node.js'])
+        graph.add_edge('Node.js', 'JavaScript')
+        after = recommender.plan_learning_path(target_skills=['Node.js'])
+    finally:
+        registry.register('skill_prerequisite_graph', original)
+
+    assert before['required_skills'] == ['Node.js']
+    assert after['required_skills'] == ['JavaScript', 'Node.js']
+    assert [course['id'] for course in after['courses']] == ['WD001', 'WD002']
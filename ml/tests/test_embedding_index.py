@@ -0,0 +1,29 @@
+import numpy as np
+
+from ml.utils.embedding_index import SkillEmbeddingIndex
+
+
+def _index(calibration=None):
+    rng = np.random.default_rng(0)
+    skills = {f'skill{i}': rng.normal(size=16) for i in range(50)}
+    return SkillEmbeddingIndex(skills, {'Role': rng.normal(size=16)}, calibration)
+
+
+def test_fit_calibration_recovers_zero_shot_scale():
+    index = _index()
+    pairs = [(skill, 'Role') for skill in index.skills]
+    cosine = index.skill_matrix @ index.role_matrix[0]
+    probabilities = 1 / (1 + np.exp(-(cosine - 0.1) / 0.2))
+
+    calibration = index.fit_calibration(pairs, probabilities)
+
+    assert np.isclose(calibration['center'], 0.1, atol=1e-4)
+    assert np.isclose(calibration['scale'], 0.2, atol=1e-4)
+    np.testing.assert_allclose(index.relevance_batch(pairs), probabilities, atol=1e-5)
+
+
+def test_calibration_center_scores_one_half():
+    index = _index({'center': 0.0, 'scale': 0.1})
+    cosine = float(index.skill_matrix[0] @ index.role_matrix[0])
+
+    assert np.isclose(index.relevance('skill0', 'Role'), 1 / (1 + np.exp(-cosine / 0.1)))
@@ -0,0 +1,36 @@
+import pytest
+
+from ml.benchmarks.import_time import IMPORT_BUDGETS, SCALE_VARIABLE, budget_scale, measure
+
+
+@pytest.fixture(scope='module')
+def measurements():
+    return {}
+
+
+def measured(measurements, statement):
+    if statement not in measurements:
+        measurements[statement] = measure(statement)
+    return measurements[statement]
+
+
+@pytest.mark.parametrize('statement', list(IMPORT_BUDGETS))
+def test_import_loads_no_heavy_modules(measurements, statement):
+    _, allowed = IMPORT_BUDGETS[statement]
+    result = measured(measurements, statement)
+
+    assert set(result['loaded']) <= set(allowed), f"{statement} imported {result['loaded']}"
+
+
+@pytest.mark.parametrize('statement', list(IMPORT_BUDGETS))
+def test_import_within_budget(measurements, statement):
+    scale = budget_scale()
+    if not scale:
+        pytest.skip(f'{SCALE_VARIABLE}=0 disables the time budgets')
+    budget = IMPORT_BUDGETS[statement][0] * scale
+    result = measured(measurements, statement)
+
+    assert result['seconds'] <= budget, (
+        f"{statement} took {result['seconds']:.3f}s, budget {budget:.3f}s; "
+        f"raise {SCALE_VARIABLE} on slow machines"
+    )
@@ -0,0 +1,38 @@
+import numpy as np
+
+from ml.job_analyzer import MARKET_ROLES_PATH, MARKET_STORE_PATH, JobAnalyzer
+from ml.utils.market_store import MarketDataStore
+
+COLUMNS = ['demand', 'growth', 'salary_min', 'salary_max']
+
+
+def assert_same_store(store, expected):
+    assert store.roles == expected.roles
+    for column in COLUMNS:
+        np.testing.assert_array_equal(getattr(store, column), getattr(expected, column))
+        assert getattr(store, column).dtype == getattr(expected, column).dtype
+
+
+def test_shipped_store_matches_csv():
+    # Regenerate with MarketDataStore.from_csv(MARKET_ROLES_PATH).save(MARKET_STORE_PATH)
+    assert_same_store(MarketDataStore.load(MARKET_STORE_PATH), MarketDataStore.from_csv(MARKET_ROLES_PATH))
+
+
+def test_job_analyzer_serves_columnar_store(monkeypatch, tmp_path):
+    from ml import job_analyzer
+
+    csv_analyzer = JobAnalyzer(MARKET_ROLES_PATH)
+    assert_same_store(JobAnalyzer().market, csv_analyzer.market)
+    assert JobAnalyzer().data_version == csv_analyzer.data_version
+
+    store = MarketDataStore.from_csv(MARKET_ROLES_PATH)
+    store.demand = store.demand + 1
+    path = str(tmp_path / 'market.npz')
+    store.save(path)
+    monkeypatch.setattr(job_analyzer, 'MARKET_STORE_PATH', path)
+    analyzer = JobAnalyzer()
+    np.testing.assert_array_equal(analyzer.market.demand, store.demand)
+    assert analyzer.data_version != csv_analyzer.data_version
+
+    monkeypatch.setattr(job_analyzer, 'MARKET_STORE_PATH', str(tmp_path / 'missing.npz'))
+    assert_same_store(JobAnalyzer().market, csv_analyzer.market)
@@ -0,0 +1,52 @@
+from ml.utils.course_catalog import CourseCatalog
+from ml.utils.path_planner import LearningPathPlanner
+
+
+def course(course_id, skills, hours):
+    return {
+        'id': course_id, 'title': course_id, 'platform': 'Udemy', 'skills': skills,
+        'level': 'Beginner', 'duration': f'{hours} hours', 'rating': 4.5,
+        'enrolled': 1000, 'price': 20.0
+    }
+
+
+CATALOG = CourseCatalog.from_courses({'web': [
+    course('REACT', ['React'], 20),
+    course('JS', ['JavaScript'], 10),
+    course('HTML', ['HTML', 'CSS'], 5)
+]})
+
+
+class Prerequisites:
+    """Mutable prerequisite table with a version counter."""
+
+    def __init__(self, table):
+        self.table = table
+        self.version = 0
+
+    def add(self, skill, prerequisite):
+        self.table.setdefault(skill, []).append(prerequisite)
+        self.version += 1
+
+    def __call__(self, skill):
+        return self.table.get(skill, [])
+
+
+def test_plan_orders_prerequisites_first():
+    planner = LearningPathPlanner(CATALOG, Prerequisites({'React': ['JavaScript'], 'JavaScript': ['HTML']}))
+    plan = planner.plan(['React'])
+
+    assert plan['required_skills'] == ['HTML', 'JavaScript', 'React']
+    assert [entry['id'] for entry in plan['courses']] == ['HTML', 'JS', 'REACT']
+    assert plan['total_hours'] == 35.0
+
+
+def test_plan_sees_added_prerequisite():
+    prerequisites = Prerequisites({'React': ['JavaScript']})
+    planner = LearningPathPlanner(CATALOG, prerequisites, version=lambda: prerequisites.version)
+    assert planner.expand(['React']) == ('JavaScript', 'React')
+
+    prerequisites.add('JavaScript', 'HTML')
+
+    assert planner.expand(['React']) == ('HTML', 'JavaScript', 'React')
+    assert [entry['id'] for entry in planner.plan(['React'])['courses']] == ['HTML', 'JS', 'REACT']
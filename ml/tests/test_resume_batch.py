@@ -0,0 +1,45 @@
+import pytest
+
+spacy = pytest.importorskip('spacy')
+
+from ml.model_registry import nlp_model_name, registry
+from ml.resume_analyzer import ResumeAnalyzer
+
+RESUMES = [
+    "Jane Doe\nPython, Docker and AWS. Team Leadership.\n"
+    "Acme Corp 2019 - present. Built machine learning services.\n"
+    "Bachelor of Science in Computer Science, 2018",
+    "John Roe\nReact and Node.js developer, AWS Certified.\n"
+    "Web Shop 2015 - 2020. JavaScript and TypeScript front ends.",
+    "Sam Poe\nCommunication and Problem Solving.\nMaster of Science, University of Somewhere",
+    ""
+] * 3
+
+
+def blank_pipeline():
+    # Module level so that it pickles into the spawned workers
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    return nlp
+
+
+@pytest.fixture
+def analyzer():
+    name = nlp_model_name('sentences_only')
+    registry.register(name, blank_pipeline)
+    yield ResumeAnalyzer()
+    registry.unload(name)
+
+
+@pytest.mark.parametrize('target_role', [None, 'software_engineer'])
+def test_parallel_batch_matches_single_analysis(analyzer, target_role):
+    expected = [analyzer.analyze_resume(text, target_role) for text in RESUMES]
+
+    results = analyzer.analyze_resumes(iter(RESUMES), target_role, batch_size=2, n_process=2)
+
+    assert list(results) == expected
+
+
+def test_serial_batch_matches_single_analysis(analyzer):
+    expected = [analyzer.analyze_resume(text) for text in RESUMES]
+    assert list(analyzer.analyze_resumes(RESUMES, batch_size=5)) == expected
@@ -0,0 +1,48 @@
+import pytest
+
+spacy = pytest.importorskip('spacy')
+
+from ml.model_registry import nlp_model_name, registry
+from ml.resume_analyzer import ResumeAnalyzer
+
+RESUME = """Jane Doe
+Worked with Python and Docker on services for natural language processing and search.
+Experience
+Acme Corp 2019 - present. Built machine learning services on AWS. Natural Language Processing for search.
+Education
+Bachelor of Science in Computer Science, 2018"""
+
+
+@pytest.fixture
+def analyzer():
+    def blank_pipeline():
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        return nlp
+
+    name = nlp_model_name('sentences_only')
+    registry.register(name, blank_pipeline)
+    yield ResumeAnalyzer()
+    registry.unload(name)
+
+
+# 60 cuts the first line inside "natural language processing"
+@pytest.mark.parametrize('max_chunk_chars', [40, 60, 200])
+def test_chunked_skills_match_one_shot_analysis(analyzer, max_chunk_chars):
+    expected = analyzer.analyze_resume(RESUME)
+    chunked = analyzer.analyze_resume_chunked(RESUME, max_chunk_chars=max_chunk_chars)
+
+    assert chunked['skills'] == expected['skills']
+
+
+def test_chunks_reuse_the_whole_text_scan(analyzer, monkeypatch):
+    scanned = []
+    index = analyzer.skill_matcher.index
+    monkeypatch.setattr(analyzer.skill_matcher, 'index', lambda text: scanned.append(text) or index(text))
+
+    chunked = analyzer.analyze_resume_chunked(RESUME, max_chunk_chars=40)
+
+    assert scanned == [RESUME]
+    expected = analyzer.analyze_resume(RESUME)
+    assert chunked['skills'] == expected['skills']
+    assert chunked['certifications'] == expected['certifications']
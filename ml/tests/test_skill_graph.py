@@ -0,0 +1,41 @@
+import pytest
+
+from ml.utils.skill_graph import PrerequisiteGraph
+
+
+def test_closure_queries():
+    graph = PrerequisiteGraph({'React': ['JavaScript'], 'JavaScript': ['HTML'], 'Redux': ['React']})
+    assert graph.prerequisites('redux') == ['HTML', 'JavaScript', 'React']
+    assert graph.dependents('HTML') == ['JavaScript', 'React', 'Redux']
+    assert graph.is_prerequisite('HTML', 'Redux')
+    assert not graph.is_prerequisite('Redux', 'HTML')
+
+
+@pytest.mark.parametrize('prerequisites', [
+    {'A': ['B'], 'B': ['A'], 'C': []},
+    {'A': ['A']},
+    {'A': ['B'], 'B': ['C'], 'C': ['A'], 'D': ['A']}
+])
+def test_cycle_in_constructor_raises(prerequisites):
+    with pytest.raises(ValueError, match='cycle'):
+        PrerequisiteGraph(prerequisites)
+
+
+def test_cyclic_edge_rejected():
+    graph = PrerequisiteGraph({'B': ['A']})
+    with pytest.raises(ValueError, match='cycle'):
+        graph.add_edge('A', 'B')
+    assert graph.prerequisites('B') == ['A']
+    assert graph.prerequisites('A') == []
+
+
+def test_version_changes_with_the_graph():
+    graph = PrerequisiteGraph({'React': ['JavaScript']})
+    version = graph.version
+
+    graph.add_edge('React', 'JavaScript')
+    assert graph.version == version
+
+    graph.add_edge('JavaScript', 'HTML')
+    assert graph.version > version
+    assert graph.prerequisites('React') == ['HTML', 'JavaScript']
@@ -0,0 +1,84 @@
+import pytest
+
+from ml.utils.skill_matcher import SkillMatch, SkillMatcher
+
+TAXONOMY = {
+    'languages': ['Go', 'C', 'C++', 'C#', 'Java', 'JavaScript'],
+    'web': ['Node.js', 'React'],
+    'ml': ['Machine Learning', 'Deep Learning', 'Learning', 'Natural Language Processing']
+}
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return SkillMatcher(TAXONOMY)
+
+
+def skills(matcher, text):
+    return [(match.skill, match.start, match.end) for match in matcher.find_all(text)]
+
+
+def test_word_boundaries(matcher):
+    assert skills(matcher, 'Google and Golang') == []
+    assert skills(matcher, 'Wrote Go at Google.') == [('Go', 6, 8)]
+
+
+def test_word_boundaries_can_be_disabled():
+    matcher = SkillMatcher(['Go'], word_boundaries=False)
+    assert [match.start for match in matcher.find_all('Google Go')] == [0, 7]
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('C++, C# and Go', [('C', 0, 1), ('C++', 0, 3), ('C', 5, 6), ('C#', 5, 7), ('Go', 12, 14)]),
+    ('(C++)', [('C', 1, 2), ('C++', 1, 4)]),
+    ('C#.', [('C', 0, 1), ('C#', 0, 2)])
+])
+def test_symbol_skills(matcher, text, expected):
+    assert skills(matcher, text) == expected
+
+
+def test_dotted_skills(matcher):
+    assert skills(matcher, 'Node.js, node.jsx and nodejs') == [('Node.js', 0, 7)]
+
+
+def test_multi_word_skills(matcher):
+    text = 'Natural Language Processing with natural  language processing'
+    assert skills(matcher, text) == [('Natural Language Processing', 0, 27)]
+
+
+def test_overlapping_and_nested_patterns(matcher):
+    # Every pattern that ends on a boundary is reported, including ones
+    # nested inside a longer skill
+    assert skills(matcher, 'Machine Learning, Deep Learning') == [
+        ('Machine Learning', 0, 16), ('Learning', 8, 16),
+        ('Deep Learning', 18, 31), ('Learning', 23, 31)
+    ]
+    assert skills(matcher, 'Java/JavaScript') == [('Java', 0, 4), ('JavaScript', 5, 15)]
+
+
+def test_case_folding_keeps_offsets(matcher):
+    text = 'İstanbul REACT and react'
+    assert skills(matcher, text) == [('React', 9, 14), ('React', 19, 24)]
+    assert text[9:14] == 'REACT'
+
+
+def test_find_all_returns_offsets_and_categories(matcher):
+    text = 'Senior React developer'
+    assert matcher.find_all(text) == [SkillMatch('React', 'web', 7, 12)]
+    assert text[7:12] == 'React'
+
+
+def test_find_skills_in_taxonomy_order(matcher):
+    assert matcher.find_skills('React, Go and Java') == [
+        ('Go', 'languages'), ('Java', 'languages'), ('React', 'web')
+    ]
+
+
+def test_mention_index(matcher):
+    text = 'React and Go. Later more React.'
+    index = matcher.index(text)
+    assert index.count('react') == 2
+    assert index.positions('React') == [(0, 5), (25, 30)]
+    assert 'go' in index and 'Java' not in index
+    assert index.skills_between(0, 13) == [('Go', 'languages'), ('React', 'web')]
+    assert index.skills_between(14, len(text)) == [('React', 'web')]
@@ -0,0 +1,29 @@
+import os
+
+from ml import model_registry
+from ml.model_registry import SKILL_TREND_FORECASTER_FILE, cache_dir, registry
+
+
+def test_cache_dir_follows_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv('SKILL_BRIDGE_CACHE_DIR', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    assert cache_dir() == os.path.join(str(tmp_path), 'skill-bridge')
+
+    monkeypatch.setenv('SKILL_BRIDGE_CACHE_DIR', str(tmp_path / 'custom'))
+    assert cache_dir() == str(tmp_path / 'custom')
+
+
+def test_forecaster_cache_written_outside_package(monkeypatch, tmp_path):
+    monkeypatch.setenv('SKILL_BRIDGE_CACHE_DIR', str(tmp_path))
+    package_dir = os.path.dirname(model_registry.__file__)
+    before = set(os.listdir(package_dir))
+
+    registry.unload('skill_trend_forecaster')
+    try:
+        forecaster = registry.get('skill_trend_forecaster')
+    finally:
+        registry.unload('skill_trend_forecaster')
+
+    assert len(forecaster) > 0
+    assert (tmp_path / SKILL_TREND_FORECASTER_FILE).exists()
+    assert set(os.listdir(package_dir)) == before
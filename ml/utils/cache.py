@@ -0,0 +1,259 @@
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+
+def _pickled_size(value):
+    """Approximate memory footprint of a value by its pickled size."""
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class LRUCache:
+    """
+    Thread-safe bounded LRU cache with hit/miss counters.
+
+    Entries are evicted least recently used first once either the entry
+    limit or, if given, the byte limit is exceeded. When a path is given the
+    cache is loaded from it on construction and can be written back with
+    save(), so warm entries survive restarts.
+    """
+
+    def __init__(self, maxsize=1024, path=None, max_bytes=None):
+        """
+        Create the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept
+            path (str, optional): Pickle file used for persistence
+            max_bytes (int, optional): Maximum total size of the values,
+                measured by their pickled size
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def get(self, key, default=None):
+        """Return a cached value and mark it as recently used."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries if full."""
+        size = _pickled_size(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self.total_bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until both limits hold."""
+        while self._data and (
+            len(self._data) > self.maxsize
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            key, _ = self._data.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(key, 0)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Report size and hit/miss counters."""
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def save(self, path=None):
+        """
+        Persist the entries to disk.
+
+        The file is written next to its destination and renamed into place,
+        so readers never see a partially written cache.
+
+        Args:
+            path (str, optional): Destination, defaults to the cache path
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError('No path given to save the cache to')
+
+        with self._lock:
+            items = list(self._data.items())
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as handle:
+            pickle.dump(items, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    def load(self, path=None):
+        """
+        Load entries from disk, keeping the most recently used ones.
+
+        Args:
+            path (str, optional): Source, defaults to the cache path
+        """
+        path = path or self.path
+        with open(path, 'rb') as handle:
+            items = pickle.load(handle)
+
+        for key, value in items[-self.maxsize:]:
+            self.put(key, value)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+class DiskCache:
+    """
+    On-disk cache with size-based LRU eviction and hit/miss counters.
+
+    Each entry is a pickle file named after its key, so keys must be safe
+    file names such as hex digests. Reads refresh the file's modification
+    time, and once the directory grows past max_bytes the least recently
+    used files are removed. Several processes may share a directory; writes
+    are atomic renames.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        """
+        Create the cache.
+
+        Args:
+            directory (str): Directory holding the cache files
+            max_bytes (int): Maximum total size of the cache files
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(size for _, _, size in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def _entries(self):
+        """(mtime, path, size) of every cache file."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def get(self, key, default=None):
+        """Return a cached value and mark it as recently used."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as handle:
+                value = pickle.load(handle)
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            with self._lock:
+                self.misses += 1
+            return default
+
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used files if full."""
+        path = self._path(key)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'wb') as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        size = os.path.getsize(temp_path)
+
+        with self._lock:
+            try:
+                self.total_bytes -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, path)
+            self.total_bytes += size
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Remove least recently used files until under the size limit."""
+        entries = sorted(self._entries())
+        self.total_bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= size
+
+    def clear(self):
+        """Remove every cache file and reset the counters."""
+        with self._lock:
+            for _, path, _ in self._entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Report size and hit/miss counters."""
+        with self._lock:
+            return {
+                'size': len(self._entries()),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def __contains__(self, key):
+        return os.path.exists(self._path(key))
+
+    def __len__(self):
+        return len(self._entries())
@@ -0,0 +1,228 @@
+import json
+import os
+
+import numpy as np
+
+# Columns stored as one .npy file each
+_ARRAY_COLUMNS = [
+    'ids', 'titles', 'durations', 'category_codes', 'platform_codes', 'level_codes',
+    'rating', 'enrolled', 'price', 'duration_hours',
+    'skill_indptr', 'skill_indices', 'skill_names', 'course_indptr', 'course_rows'
+]
+_METADATA_FILE = 'catalog.json'
+_FORMAT_VERSION = 1
+
+
+def _codes(values):
+    """Encode strings as integer codes and their distinct values in first-seen order."""
+    names = list(dict.fromkeys(values))
+    lookup = {name: code for code, name in enumerate(names)}
+    return np.array([lookup[value] for value in values], dtype=np.int32), names
+
+
+def _string_array(values):
+    return np.array(values, dtype=str) if values else np.zeros(0, dtype='<U1')
+
+
+class CourseCatalog:
+    """
+    Columnar course catalog with an id index and a CSR skill layout.
+
+    Numeric fields live in typed arrays (rating, enrolled, price, duration
+    in hours) and categorical ones as integer codes, so filters over the
+    whole catalog are array operations. Course skills are stored as skill
+    ids in CSR form (skill_indptr/skill_indices) in each course's own
+    order, with the transposed skill -> course layout kept alongside. The
+    catalog can be saved as one .npy file per column and loaded with memory
+    mapping, so worker processes share the pages instead of each building
+    their own copy. Course dicts are only built on request.
+    """
+
+    def __init__(self, columns, category_names, platform_names, level_names):
+        """
+        Wrap prepared columns; use from_courses or load to build a catalog.
+
+        Args:
+            columns (dict): Arrays named as in _ARRAY_COLUMNS
+            category_names (list): Category of each category code
+            platform_names (list): Platform of each platform code
+            level_names (list): Level of each level code
+        """
+        for name in _ARRAY_COLUMNS:
+            setattr(self, name, columns[name])
+        self.category_names = list(category_names)
+        self.platform_names = list(platform_names)
+        self.level_names = list(level_names)
+
+        self._skill_list = self.skill_names.tolist()
+        self._skill_ids = {skill: skill_id for skill_id, skill in enumerate(self._skill_list)}
+        self._rows = {course_id: row for row, course_id in enumerate(self.ids.tolist())}
+
+    @classmethod
+    def from_courses(cls, courses):
+        """
+        Build a catalog from course dicts.
+
+        Args:
+            courses (dict): Category name to a list of course dicts with
+                'id', 'title', 'platform', 'skills', 'level', 'duration'
+                ('<hours> hours'), 'rating', 'enrolled' and 'price'
+
+        Returns:
+            CourseCatalog: Catalog with courses in category order
+        """
+        records = [
+            (category, course)
+            for category, category_courses in courses.items()
+            for course in category_courses
+        ]
+        category_codes, category_names = _codes([category for category, _ in records])
+        platform_codes, platform_names = _codes([course['platform'] for _, course in records])
+        level_codes, level_names = _codes([course['level'] for _, course in records])
+
+        skill_ids = {}
+        skill_indices = []
+        skill_indptr = [0]
+        for _, course in records:
+            for skill in course['skills']:
+                skill_indices.append(skill_ids.setdefault(skill, len(skill_ids)))
+            skill_indptr.append(len(skill_indices))
+
+        columns = {
+            'ids': _string_array([course['id'] for _, course in records]),
+            'titles': _string_array([course['title'] for _, course in records]),
+            'durations': _string_array([course['duration'] for _, course in records]),
+            'category_codes': category_codes,
+            'platform_codes': platform_codes,
+            'level_codes': level_codes,
+            'rating': np.array([course['rating'] for _, course in records], dtype=np.float64),
+            'enrolled': np.array([course['enrolled'] for _, course in records], dtype=np.int64),
+            'price': np.array([course['price'] for _, course in records], dtype=np.float64),
+            'duration_hours': np.array(
+                [float(course['duration'].split()[0]) for _, course in records], dtype=np.float64
+            ),
+            'skill_indptr': np.array(skill_indptr, dtype=np.int64),
+            'skill_indices': np.array(skill_indices, dtype=np.int32),
+            'skill_names': _string_array(list(skill_ids))
+        }
+        columns['course_indptr'], columns['course_rows'] = cls._transpose(
+            columns['skill_indptr'], columns['skill_indices'], len(skill_ids)
+        )
+        return cls(columns, category_names, platform_names, level_names)
+
+    @staticmethod
+    def _transpose(skill_indptr, skill_indices, n_skills):
+        """Skill -> course CSR layout, rows ascending within each skill."""
+        rows = np.repeat(np.arange(len(skill_indptr) - 1, dtype=np.int32), np.diff(skill_indptr))
+        order = np.argsort(skill_indices, kind='stable')
+        course_indptr = np.zeros(n_skills + 1, dtype=np.int64)
+        np.cumsum(np.bincount(skill_indices, minlength=n_skills), out=course_indptr[1:])
+        return course_indptr, rows[order]
+
+    def save(self, directory):
+        """
+        Write the catalog as one .npy file per column plus a metadata file.
+
+        Args:
+            directory (str): Destination directory, created if missing
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in _ARRAY_COLUMNS:
+            np.save(os.path.join(directory, f'{name}.npy'), getattr(self, name))
+
+        metadata = {
+            'version': _FORMAT_VERSION,
+            'category_names': self.category_names,
+            'platform_names': self.platform_names,
+            'level_names': self.level_names
+        }
+        with open(os.path.join(directory, _METADATA_FILE), 'w') as handle:
+            json.dump(metadata, handle)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Load a catalog written by save.
+
+        Args:
+            directory (str): Directory holding the catalog files
+            mmap (bool): Memory-map the column files instead of reading them
+
+        Returns:
+            CourseCatalog: The loaded catalog
+        """
+        with open(os.path.join(directory, _METADATA_FILE)) as handle:
+            metadata = json.load(handle)
+        if metadata.get('version') != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported course catalog version: {metadata.get('version')}")
+
+        columns = {
+            name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r' if mmap else None)
+            for name in _ARRAY_COLUMNS
+        }
+        return cls(
+            columns, metadata['category_names'], metadata['platform_names'],
+            metadata['level_names']
+        )
+
+    def row(self, course_id):
+        """Row of a course, or None if the id is unknown."""
+        return self._rows.get(course_id)
+
+    def get(self, course_id):
+        """Course dict for an id, or None if the id is unknown."""
+        row = self._rows.get(course_id)
+        return None if row is None else self.course(row)
+
+    def skill_id(self, skill):
+        """Id of a skill, or None if no course teaches it."""
+        return self._skill_ids.get(skill)
+
+    def skills(self, row):
+        """Skills taught by the course in a row, in the course's order."""
+        start, end = self.skill_indptr[row], self.skill_indptr[row + 1]
+        return [self._skill_list[skill_id] for skill_id in self.skill_indices[start:end].tolist()]
+
+    def courses_with_skill(self, skill):
+        """Rows of the courses teaching a skill, ascending."""
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            return np.zeros(0, dtype=np.int32)
+        return self.course_rows[self.course_indptr[skill_id]:self.course_indptr[skill_id + 1]]
+
+    def category(self, row):
+        """Category name of the course in a row."""
+        return self.category_names[self.category_codes[row]]
+
+    def course(self, row):
+        """Build the course dict of a row."""
+        row = int(row)
+        return {
+            'id': str(self.ids[row]),
+            'title': str(self.titles[row]),
+            'platform': self.platform_names[self.platform_codes[row]],
+            'skills': self.skills(row),
+            'level': self.level_names[self.level_codes[row]],
+            'duration': str(self.durations[row]),
+            'rating': float(self.rating[row]),
+            'enrolled': int(self.enrolled[row]),
+            'price': float(self.price[row])
+        }
+
+    def platform_mask(self, platforms, rows=None):
+        """
+        Boolean mask of the courses offered on any of the platforms.
+
+        Args:
+            platforms (iterable): Platform names
+            rows (np.ndarray, optional): Rows to test, all if None
+        """
+        preferred = np.array([name in platforms for name in self.platform_names], dtype=bool)
+        codes = self.platform_codes if rows is None else self.platform_codes[rows]
+        return preferred[codes]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, course_id):
+        return course_id in self._rows
@@ -6,6 +6,22 @@ from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
 import re
 import logging
+from .skill_matcher import SkillMatcher
+
+# Technical and soft skills recognised by the keyword extractor
+SKILL_KEYWORDS = {
+    'technical': [
+        'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws',
+        'docker', 'kubernetes', 'git', 'machine learning', 'deep learning',
+        'artificial intelligence', 'data science', 'html5', 'css3', 'angular',
+        'vue.js', 'typescript', 'mongodb', 'postgresql'
+    ],
+    'soft': [
+        'communication', 'leadership', 'teamwork', 'problem solving',
+        'analytical', 'project management', 'time management',
+        'critical thinking', 'collaboration'
+    ]
+}
 
 class DataPreprocessor:
     def __init__(self):
@@ -13,6 +29,7 @@ class DataPreprocessor:
         self.scaler = MinMaxScaler()
         self.lemmatizer = WordNetLemmatizer()
         self.stop_words = set(stopwords.words('english'))
+        self.skill_matcher = SkillMatcher(SKILL_KEYWORDS)
         
         # Initialize logging
         logging.basicConfig(level=logging.INFO)
@@ -47,33 +64,8 @@ class DataPreprocessor:
         """
         Extract skills from text using predefined skill patterns and keywords
         """
-        # Common technical skills patterns
-        tech_patterns = [
-            r'python|java|javascript|react|node\.js|sql|aws|docker|kubernetes|git',
-            r'machine learning|deep learning|artificial intelligence|data science',
-            r'html5|css3|angular|vue\.js|typescript|mongodb|postgresql'
-        ]
-        
-        # Common soft skills patterns
-        soft_patterns = [
-            r'communication|leadership|teamwork|problem solving|analytical',
-            r'project management|time management|critical thinking|collaboration'
-        ]
-        
-        skills = []
-        text = text.lower()
-        
-        # Extract technical skills
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text)
-            skills.extend(matches)
-            
-        # Extract soft skills
-        for pattern in soft_patterns:
-            matches = re.findall(pattern, text)
-            skills.extend(matches)
-            
-        return list(set(skills))
+        skills = {match.skill for match in self.skill_matcher.iter_matches(text)}
+        return list(skills)
 
     def clean_numerical_data(self, df, columns):
         """
@@ -0,0 +1,170 @@
+import numpy as np
+
+# Logistic calibration of cosine similarity onto the zero-shot probability
+# scale: cosine `center` maps to 0.5 and every `scale` above it adds one
+# logit. Defaults place typical related-skill cosines (0.45-0.6) above the
+# 0.6 "relevant" and 0.8 "High" cut-offs tuned for zero-shot scores; fit
+# the artifact's own values with SkillEmbeddingIndex.fit_calibration.
+DEFAULT_CALIBRATION = {'center': 0.35, 'scale': 0.1}
+
+
+def _normalized_matrix(vectors):
+    """Stack vectors into a contiguous float32 matrix of unit-length rows."""
+    if not vectors:
+        return np.zeros((0, 0), dtype=np.float32)
+    matrix = np.ascontiguousarray(np.vstack(vectors), dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+class SkillEmbeddingIndex:
+    """
+    Vectorized skill relevance engine over pre-trained embeddings.
+
+    Skill and role embeddings are held as contiguous float32 matrices of
+    unit vectors, so relevance is a dot product and "most relevant skills
+    for a role" is one matrix-vector product followed by a partial sort.
+    Cosine similarity is turned into a [0, 1] relevance score by a logistic
+    calibration, so the score is on the zero-shot classifier's probability
+    scale and callers' thresholds mean the same on both paths.
+    """
+
+    def __init__(self, skill_vectors, role_vectors=None, calibration=None):
+        """
+        Build the index.
+
+        Args:
+            skill_vectors (dict): Skill name to embedding vector
+            role_vectors (dict, optional): Role name to embedding vector;
+                roles missing here fall back to the skill table
+            calibration (dict, optional): 'center' and 'scale' of the
+                cosine-to-probability mapping, DEFAULT_CALIBRATION if None
+        """
+        self.calibration = dict(calibration or DEFAULT_CALIBRATION)
+        self.skills = list(skill_vectors)
+        self.skill_matrix = _normalized_matrix([skill_vectors[name] for name in self.skills])
+        self._skill_rows = {name.lower(): row for row, name in enumerate(self.skills)}
+
+        role_vectors = role_vectors or {}
+        self.roles = list(role_vectors)
+        self.role_matrix = _normalized_matrix([role_vectors[name] for name in self.roles])
+        self._role_rows = {name.lower(): row for row, name in enumerate(self.roles)}
+
+    @classmethod
+    def from_artifact(cls, artifact):
+        """
+        Build the index from the skill_embeddings artifact.
+
+        Accepts either {'skills': {...}, 'roles': {...}, 'calibration':
+        {...}} or a flat mapping of names to vectors; anything else yields
+        an empty index.
+        """
+        if not isinstance(artifact, dict):
+            return cls({})
+        if 'skills' in artifact and isinstance(artifact['skills'], dict):
+            return cls(artifact['skills'], artifact.get('roles'), artifact.get('calibration'))
+        return cls(artifact)
+
+    def _calibrate(self, cosine):
+        """Map cosine similarities onto the zero-shot probability scale."""
+        logits = (np.asarray(cosine, dtype=np.float64) - self.calibration['center']) / self.calibration['scale']
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def fit_calibration(self, pairs, probabilities):
+        """
+        Fit the calibration to zero-shot scores of the same pairs.
+
+        Least squares of the zero-shot logits on cosine similarity.
+
+        Args:
+            pairs (list): (skill_name, job_role) tuples with embeddings
+            probabilities (list): Zero-shot relevance of each pair
+
+        Returns:
+            dict: The fitted calibration, also stored on the index
+        """
+        skill_rows = [self._skill_rows[skill_name.lower()] for skill_name, _ in pairs]
+        role_vectors = np.vstack([self._role_vector(job_role) for _, job_role in pairs])
+        cosine = np.einsum('ij,ij->i', self.skill_matrix[skill_rows], role_vectors).astype(np.float64)
+        probabilities = np.clip(np.asarray(probabilities, dtype=np.float64), 1e-4, 1 - 1e-4)
+        slope, intercept = np.polyfit(cosine, np.log(probabilities / (1 - probabilities)), 1)
+        if slope <= 0:
+            raise ValueError('Zero-shot scores do not increase with embedding similarity')
+        self.calibration = {'center': float(-intercept / slope), 'scale': float(1 / slope)}
+        return self.calibration
+
+    def has_skill(self, skill_name):
+        """Check whether a skill has an embedding."""
+        return skill_name.lower() in self._skill_rows
+
+    def has_role(self, job_role):
+        """Check whether a role has an embedding, in either table."""
+        key = job_role.lower()
+        return key in self._role_rows or key in self._skill_rows
+
+    def _role_vector(self, job_role):
+        key = job_role.lower()
+        if key in self._role_rows:
+            return self.role_matrix[self._role_rows[key]]
+        return self.skill_matrix[self._skill_rows[key]]
+
+    def relevance(self, skill_name, job_role):
+        """
+        Relevance of a skill to a role.
+
+        Returns:
+            float: Score in [0, 1], or None if either name has no embedding
+        """
+        if not (self.has_skill(skill_name) and self.has_role(job_role)):
+            return None
+        skill_vector = self.skill_matrix[self._skill_rows[skill_name.lower()]]
+        return float(self._calibrate(skill_vector @ self._role_vector(job_role)))
+
+    def relevance_batch(self, pairs):
+        """
+        Relevance of many (skill, role) pairs with one vectorized product.
+
+        Args:
+            pairs (list): (skill_name, job_role) tuples
+
+        Returns:
+            np.ndarray: float32 scores in [0, 1], NaN where a name is unknown
+        """
+        scores = np.full(len(pairs), np.nan, dtype=np.float32)
+        known = [
+            position for position, (skill_name, job_role) in enumerate(pairs)
+            if self.has_skill(skill_name) and self.has_role(job_role)
+        ]
+        if not known:
+            return scores
+
+        skill_rows = [self._skill_rows[pairs[position][0].lower()] for position in known]
+        role_vectors = np.vstack([self._role_vector(pairs[position][1]) for position in known])
+        cosine = np.einsum('ij,ij->i', self.skill_matrix[skill_rows], role_vectors)
+        scores[known] = self._calibrate(cosine)
+        return scores
+
+    def top_skills(self, job_role, top_n=10):
+        """
+        Most relevant skills for a role.
+
+        Args:
+            job_role (str): Target job role
+            top_n (int): Number of skills to return
+
+        Returns:
+            list: (skill_name, relevance_score) tuples, best first
+        """
+        if not self.has_role(job_role) or not self.skills:
+            return []
+
+        scores = self._calibrate(self.skill_matrix @ self._role_vector(job_role))
+        top_n = min(top_n, len(scores))
+        top = np.argpartition(-scores, top_n - 1)[:top_n]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.skills[row], float(scores[row])) for row in top]
+
+    def __len__(self):
+        return len(self.skills)
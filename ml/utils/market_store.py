@@ -0,0 +1,142 @@
+import csv
+
+import numpy as np
+
+# Market health status per score band, lowest first
+HEALTH_STATUSES = ['Challenging', 'Moderate', 'Good', 'Excellent']
+HEALTH_THRESHOLDS = (0.4, 0.6, 0.8)
+
+HEALTH_WEIGHTS = {'demand': 0.4, 'growth': 0.3, 'salary': 0.3}
+# Normalization: growth of 20% and a top salary of 200k score 1
+MAX_GROWTH = 20
+SALARY_FLOOR = 80000
+SALARY_SPAN = 120000
+
+_COLUMNS = ['demand', 'growth', 'salary_min', 'salary_max']
+
+
+def _numeric(values):
+    """Integer array if every value is an integer literal, float array otherwise."""
+    try:
+        return np.array([int(value) for value in values], dtype=np.int64)
+    except ValueError:
+        return np.array([float(value) for value in values], dtype=np.float64)
+
+
+class MarketDataStore:
+    """
+    Role market metrics held as columns, with analytics for all roles at once.
+
+    Demand, growth and salary bounds are NumPy arrays indexed by role row.
+    Health scores, statuses and the six- and twelve-month demand
+    projections are computed for every role in one vectorized pass when
+    the store is built, so analyzing a single role is an indexed read.
+    Per-role reads round with Python's round, so they match the values the
+    scalar formulas produced.
+    """
+
+    def __init__(self, roles, demand, growth, salary_min, salary_max):
+        """
+        Build the store and its analytics table.
+
+        Args:
+            roles (list): Role names; rows follow this order
+            demand (np.ndarray): Current demand score per role
+            growth (np.ndarray): Yearly demand growth in percent per role
+            salary_min (np.ndarray): Lower salary bound per role
+            salary_max (np.ndarray): Upper salary bound per role
+        """
+        self.roles = list(roles)
+        self._rows = {role: row for row, role in enumerate(self.roles)}
+        self.demand = np.asarray(demand)
+        self.growth = np.asarray(growth)
+        self.salary_min = np.asarray(salary_min)
+        self.salary_max = np.asarray(salary_max)
+        self.table = self.analyze()
+
+    @classmethod
+    def from_csv(cls, path):
+        """
+        Load a store from a CSV file with one column per metric.
+
+        Args:
+            path (str): CSV with 'role', 'demand', 'growth', 'salary_min'
+                and 'salary_max' columns
+
+        Returns:
+            MarketDataStore: The loaded store
+        """
+        with open(path, newline='') as handle:
+            records = list(csv.DictReader(handle))
+        return cls(
+            [record['role'] for record in records],
+            *(_numeric([record[column] for record in records]) for column in _COLUMNS)
+        )
+
+    def save(self, path):
+        """Write the metric columns to an .npz file."""
+        np.savez(path, roles=np.array(self.roles, dtype=str),
+                 **{column: getattr(self, column) for column in _COLUMNS})
+
+    @classmethod
+    def load(cls, path):
+        """Load a store written by save."""
+        with np.load(path) as data:
+            return cls(data['roles'].tolist(), *(data[column] for column in _COLUMNS))
+
+    def analyze(self):
+        """
+        Health and demand projections of every role.
+
+        Returns:
+            dict: Arrays over roles: 'health' (weighted score in [0, 1]),
+                'status' (index into HEALTH_STATUSES), 'six_month_demand'
+                and 'one_year_demand' (linear growth projections), unrounded
+        """
+        health = (
+            self.demand / 100 * HEALTH_WEIGHTS['demand']
+            + self.growth / MAX_GROWTH * HEALTH_WEIGHTS['growth']
+            + (self.salary_max - SALARY_FLOOR) / SALARY_SPAN * HEALTH_WEIGHTS['salary']
+        )
+        return {
+            'health': health,
+            'status': np.searchsorted(HEALTH_THRESHOLDS, health, side='right').astype(np.int8),
+            'six_month_demand': self.demand * (1 + (self.growth / 100 / 2)),
+            'one_year_demand': self.demand * (1 + (self.growth / 100))
+        }
+
+    def row(self, role):
+        """Row of a role, or None if the role is unknown."""
+        return self._rows.get(role)
+
+    def metrics(self, row):
+        """Demand, growth and salary range of the role in a row."""
+        return {
+            'demand': self.demand[row].item(),
+            'growth': self.growth[row].item(),
+            'salary_range': self.salary_range(row)
+        }
+
+    def salary_range(self, row):
+        """(min, max) salary of the role in a row."""
+        return (self.salary_min[row].item(), self.salary_max[row].item())
+
+    def health(self, row):
+        """Market health score in percent and status of the role in a row."""
+        return {
+            'score': round(float(self.table['health'][row]) * 100, 2),
+            'status': HEALTH_STATUSES[self.table['status'][row]]
+        }
+
+    def projections(self, row):
+        """Six- and twelve-month projected demand of the role in a row."""
+        return (
+            round(float(self.table['six_month_demand'][row]), 2),
+            round(float(self.table['one_year_demand'][row]), 2)
+        )
+
+    def __len__(self):
+        return len(self.roles)
+
+    def __contains__(self, role):
+        return role in self._rows
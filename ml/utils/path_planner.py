@@ -0,0 +1,239 @@
+import heapq
+
+import numpy as np
+
+from .cache import LRUCache
+
+
+class LearningPathPlanner:
+    """
+    Prerequisite-aware course selection and ordering over a CourseCatalog.
+
+    Target skills are expanded with their transitive prerequisites, skipping
+    skills the learner has mastered and anything only needed for them. A
+    greedy weighted set cover then picks courses by new skills covered per
+    hour of study, evaluated lazily from a heap so only courses teaching a
+    required skill are ever scored. The chosen courses are ordered so that
+    courses teaching prerequisites come first. Direct prerequisites and
+    expansions are memoized until the prerequisite relation reports a new
+    version.
+    """
+
+    def __init__(self, catalog, prerequisites, cache_size=4096, version=None):
+        """
+        Create the planner.
+
+        Args:
+            catalog (CourseCatalog): Courses to plan with
+            prerequisites (callable): Skill name -> list of direct
+                prerequisite skill names
+            cache_size (int): Memoized prerequisite expansions
+            version (callable, optional): Returns a value that changes
+                whenever the prerequisites change; without it the
+                prerequisites are assumed fixed
+        """
+        self.catalog = catalog
+        self.prerequisites = prerequisites
+        self.version = version
+        self._version = version() if version else None
+        self._direct = {}
+        self.expansion_cache = LRUCache(cache_size)
+
+    def _refresh(self):
+        """Drop memoized prerequisites if the relation has changed since."""
+        if self.version is None:
+            return
+        current = self.version()
+        if current != self._version:
+            self._direct = {}
+            self.expansion_cache.clear()
+            self._version = current
+
+    def _direct_prerequisites(self, skill):
+        if skill not in self._direct:
+            self._direct[skill] = list(self.prerequisites(skill))
+        return self._direct[skill]
+
+    def expand(self, target_skills, mastered=()):
+        """
+        Skills to learn for the targets, prerequisites first.
+
+        Args:
+            target_skills (list): Skills to reach
+            mastered (iterable): Skills already mastered; neither they nor
+                prerequisites needed only for them are included
+
+        Returns:
+            tuple: Required skills in topological order
+        """
+        self._refresh()
+        key = (tuple(target_skills), frozenset(mastered))
+        required = self.expansion_cache.get(key)
+        if required is not None:
+            return required
+
+        mastered = key[1]
+        order = []
+        state = {}  # skill -> False while on the DFS stack, True once done
+        for target in target_skills:
+            if target in mastered or target in state:
+                continue
+            # Iterative post-order DFS; a cycle edge is simply ignored
+            state[target] = False
+            stack = [(target, iter(self._direct_prerequisites(target)))]
+            while stack:
+                skill, prerequisites = stack[-1]
+                for prerequisite in prerequisites:
+                    if prerequisite not in mastered and prerequisite not in state:
+                        state[prerequisite] = False
+                        stack.append((prerequisite, iter(self._direct_prerequisites(prerequisite))))
+                        break
+                else:
+                    stack.pop()
+                    state[skill] = True
+                    order.append(skill)
+
+        required = tuple(order)
+        self.expansion_cache.put(key, required)
+        return required
+
+    def select_courses(self, required_skills):
+        """
+        Near-minimal set of courses covering the required skills.
+
+        Greedy weighted set cover: repeatedly take the course with the most
+        still-uncovered skills per hour, ties in catalog order.
+
+        Args:
+            required_skills (list): Skills to cover
+
+        Returns:
+            tuple: (list of (row, covered skills) in selection order,
+                list of skills no course teaches)
+        """
+        catalog = self.catalog
+        skill_ids = {}
+        uncovered_skills = []
+        for skill in required_skills:
+            skill_id = catalog.skill_id(skill)
+            if skill_id is None:
+                uncovered_skills.append(skill)
+            else:
+                skill_ids[skill_id] = skill
+        if not skill_ids:
+            return [], uncovered_skills
+
+        # Initial gain of every course teaching a required skill
+        rows = np.concatenate([
+            np.unique(catalog.course_rows[catalog.course_indptr[skill_id]:catalog.course_indptr[skill_id + 1]])
+            for skill_id in skill_ids
+        ])
+        candidates, gains = np.unique(rows, return_counts=True)
+        costs = np.maximum(catalog.duration_hours[candidates], 1e-9)
+        heap = list(zip((-gains / costs).tolist(), candidates.tolist()))
+        heapq.heapify(heap)
+
+        remaining = set(skill_ids)
+        selected = []
+        while remaining and heap:
+            ratio, row = heapq.heappop(heap)
+            start, end = catalog.skill_indptr[row], catalog.skill_indptr[row + 1]
+            covered = list(dict.fromkeys(
+                skill_id for skill_id in catalog.skill_indices[start:end].tolist()
+                if skill_id in remaining
+            ))
+            if not covered:
+                continue
+            current = -len(covered) / max(float(catalog.duration_hours[row]), 1e-9)
+            # Gains only shrink, so a still-current ratio is the best one
+            if heap and current > ratio and (current, row) > heap[0]:
+                heapq.heappush(heap, (current, row))
+                continue
+            remaining.difference_update(covered)
+            selected.append((row, [skill_ids[skill_id] for skill_id in covered]))
+
+        return selected, uncovered_skills
+
+    def order_courses(self, selected, required_skills):
+        """
+        Order selected courses so prerequisites are taught first.
+
+        A course must come after every course that teaches a prerequisite of
+        a skill it covers. Among available courses the one covering the
+        earliest skill goes first; on a prerequisite cycle the earliest
+        remaining course is taken.
+
+        Args:
+            selected (list): (row, covered skills) from select_courses
+            required_skills (tuple): Skills in topological order
+
+        Returns:
+            list: The selected entries in study order
+        """
+        self._refresh()
+        position = {skill: index for index, skill in enumerate(required_skills)}
+        owner = {}
+        for index, (_, covered) in enumerate(selected):
+            for skill in covered:
+                owner[skill] = index
+
+        after = [set() for _ in selected]
+        pending = [0] * len(selected)
+        for index, (_, covered) in enumerate(selected):
+            for skill in covered:
+                for prerequisite in self._direct_prerequisites(skill):
+                    source = owner.get(prerequisite)
+                    if source is not None and source != index and index not in after[source]:
+                        after[source].add(index)
+                        pending[index] += 1
+
+        keys = [
+            (min(position.get(skill, len(position)) for skill in covered), index)
+            for index, (_, covered) in enumerate(selected)
+        ]
+        ready = [keys[index] for index in range(len(selected)) if pending[index] == 0]
+        heapq.heapify(ready)
+        done = [False] * len(selected)
+        ordered = []
+        while len(ordered) < len(selected):
+            if not ready:
+                # Prerequisite cycle: release the earliest remaining course
+                heapq.heappush(ready, min(keys[index] for index in range(len(selected)) if not done[index]))
+            _, index = heapq.heappop(ready)
+            if done[index]:
+                continue
+            done[index] = True
+            ordered.append(selected[index])
+            for successor in after[index]:
+                pending[successor] -= 1
+                if pending[successor] == 0 and not done[successor]:
+                    heapq.heappush(ready, keys[successor])
+        return ordered
+
+    def plan(self, target_skills, mastered=()):
+        """
+        Plan the courses to reach the target skills.
+
+        Args:
+            target_skills (list): Skills to reach
+            mastered (iterable): Skills already mastered
+
+        Returns:
+            dict: Required skills, ordered courses with the skills each
+                covers, total hours and skills no course teaches
+        """
+        required_skills = self.expand(target_skills, mastered)
+        selected, uncovered_skills = self.select_courses(required_skills)
+        ordered = self.order_courses(selected, required_skills)
+
+        courses = [
+            {**self.catalog.course(row), 'covers': covered}
+            for row, covered in ordered
+        ]
+        return {
+            'target_skills': list(target_skills),
+            'required_skills': list(required_skills),
+            'courses': courses,
+            'total_hours': float(sum(self.catalog.duration_hours[row] for row, _ in ordered)),
+            'uncovered_skills': uncovered_skills
+        }
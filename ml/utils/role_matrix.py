@@ -0,0 +1,146 @@
+import numpy as np
+from scipy import sparse
+
+
+class RoleSkillMatrix:
+    """
+    Sparse role x skill weight matrix for scoring every role at once.
+
+    Each role's required and preferred skills become entries of a CSR
+    matrix, so a resume's multi-hot skill vector scores all roles with a
+    single sparse matrix-vector product instead of a Python loop with list
+    membership tests per role. Skill names are matched case-insensitively.
+    """
+
+    def __init__(self, roles, required_weight=1.0, preferred_weight=0.5):
+        """
+        Build the matrices.
+
+        Args:
+            roles (dict): Role name to a dict with 'required_skills' and
+                'preferred_skills' lists
+            required_weight (float): Score of each matched required skill
+            preferred_weight (float): Score of each matched preferred skill
+        """
+        self.roles = list(roles)
+        self._rows = {role: row for row, role in enumerate(self.roles)}
+        self.skills = []
+        self._columns = {}
+
+        required = ([], [])
+        preferred = ([], [])
+        for row, role in enumerate(self.roles):
+            requirements = roles[role]
+            for entries, key in ((required, 'required_skills'), (preferred, 'preferred_skills')):
+                for skill in requirements.get(key, []):
+                    entries[0].append(row)
+                    entries[1].append(self._column(skill))
+
+        # Repeated (row, column) entries are summed, so a skill listed twice
+        # counts twice, as it did with list-based scoring
+        shape = (len(self.roles), len(self.skills))
+        self.required = self._matrix(required, shape)
+        self.preferred = self._matrix(preferred, shape)
+        self.weights = (
+            self.required * required_weight + self.preferred * preferred_weight
+        ).tocsr()
+
+        self.required_totals = np.asarray(self.required.sum(axis=1)).ravel()
+        self.preferred_totals = np.asarray(self.preferred.sum(axis=1)).ravel()
+        self.max_scores = (
+            self.required_totals * required_weight + self.preferred_totals * preferred_weight
+        )
+
+    def _column(self, skill):
+        key = skill.lower()
+        if key not in self._columns:
+            self._columns[key] = len(self.skills)
+            self.skills.append(key)
+        return self._columns[key]
+
+    @staticmethod
+    def _matrix(entries, shape):
+        rows, columns = entries
+        data = np.ones(len(rows), dtype=np.float64)
+        return sparse.csr_matrix((data, (rows, columns)), shape=shape)
+
+    def skill_vector(self, skills):
+        """
+        Multi-hot vector of the given skills over the matrix columns.
+
+        Args:
+            skills (iterable): Skill names; unknown skills are ignored
+        """
+        vector = np.zeros(len(self.skills), dtype=np.float64)
+        columns = [self._columns[key] for key in map(str.lower, skills) if key in self._columns]
+        vector[columns] = 1.0
+        return vector
+
+    def match_percentages(self, skills):
+        """
+        Weighted match percentage of every role.
+
+        Returns:
+            np.ndarray: One percentage in [0, 100] per role, 0 for roles
+                without any listed skills
+        """
+        scores = self.weights @ self.skill_vector(skills)
+        percentages = np.zeros(len(self.roles), dtype=np.float64)
+        listed = self.max_scores > 0
+        percentages[listed] = scores[listed] / self.max_scores[listed] * 100
+        return percentages
+
+    def coverage(self, skills):
+        """
+        Fraction of required and of preferred skills covered, per role.
+
+        Returns:
+            tuple: (required fractions, preferred fractions) arrays, 0 for
+                roles with an empty list
+        """
+        vector = self.skill_vector(skills)
+        return (
+            self._fractions(self.required @ vector, self.required_totals),
+            self._fractions(self.preferred @ vector, self.preferred_totals)
+        )
+
+    @staticmethod
+    def _fractions(matched, totals):
+        fractions = np.zeros(len(totals), dtype=np.float64)
+        listed = totals > 0
+        fractions[listed] = matched[listed] / totals[listed]
+        return fractions
+
+    def role_index(self, role):
+        """Row of a role, or None if the role is unknown."""
+        return self._rows.get(role)
+
+    def top_k(self, skills, k=None, min_percentage=0.0):
+        """
+        Best matching roles for a set of skills.
+
+        Ties keep the order in which roles were given.
+
+        Args:
+            skills (iterable): Skill names
+            k (int, optional): Number of roles to return, all if None
+            min_percentage (float): Roles below this match are left out
+
+        Returns:
+            list: (role, match_percentage) tuples, best first
+        """
+        percentages = self.match_percentages(skills)
+        candidates = np.flatnonzero(percentages >= min_percentage)
+        if k is not None and k < len(candidates):
+            if k <= 0:
+                return []
+            # Keep every role tied with the k-th best so the stable order holds
+            threshold = np.partition(percentages[candidates], len(candidates) - k)[len(candidates) - k]
+            candidates = candidates[percentages[candidates] >= threshold]
+
+        order = np.lexsort((candidates, -percentages[candidates]))
+        ranked = candidates[order][:k]
+        return [(self.roles[row], float(percentages[row])) for row in ranked]
+
+    def __len__(self):
+        return len(self.roles)
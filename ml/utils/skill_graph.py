@@ -0,0 +1,223 @@
+import json
+
+
+def _bits(mask):
+    """Ids of the set bits of a bitset, ascending."""
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+class PrerequisiteGraph:
+    """
+    Skill prerequisite DAG with a precomputed transitive closure.
+
+    Skills get integer ids in insertion order. For every skill the graph
+    keeps its direct prerequisites and two bitsets (Python ints with bit i
+    set for skill i): all transitive prerequisites and all transitive
+    dependents. "Is A a prerequisite of B" is a single bit test, and the
+    full prerequisite set of a skill is read off its bitset, so queries
+    cost O(words) instead of a graph walk. Adding an edge updates the
+    closure of only the affected skills, and every change bumps version
+    so that callers caching anything derived from the graph can tell it
+    is stale. Skill names are matched case-insensitively.
+    """
+
+    def __init__(self, prerequisites=None):
+        """
+        Build the graph.
+
+        Args:
+            prerequisites (dict, optional): Skill name to a list of its
+                direct prerequisite skill names
+
+        Raises:
+            ValueError: If the prerequisites contain a cycle
+        """
+        self.skills = []
+        self._ids = {}
+        self._direct = []
+        self._ancestors = []
+        self._descendants = []
+        self._order = None
+        self.version = 0
+        for skill, skill_prerequisites in (prerequisites or {}).items():
+            skill_id = self.add_skill(skill)
+            for prerequisite in skill_prerequisites:
+                prerequisite_id = self.add_skill(prerequisite)
+                if prerequisite_id not in self._direct[skill_id]:
+                    self._direct[skill_id].append(prerequisite_id)
+        self._build_closure()
+
+    def _build_closure(self):
+        """Compute both bitsets of every skill in one pass per direction."""
+        order = self.topological_order
+        for skill_id in order:
+            ancestors = 0
+            for prerequisite in self._direct[skill_id]:
+                ancestors |= self._ancestors[prerequisite] | 1 << prerequisite
+            self._ancestors[skill_id] = ancestors
+        for skill_id in reversed(order):
+            for prerequisite in self._direct[skill_id]:
+                self._descendants[prerequisite] |= self._descendants[skill_id] | 1 << skill_id
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a graph from a JSON file mapping skills to direct prerequisites.
+
+        Args:
+            path (str): Path to the JSON file
+
+        Returns:
+            PrerequisiteGraph: The loaded graph
+        """
+        with open(path) as handle:
+            return cls(json.load(handle))
+
+    def save(self, path):
+        """Write the direct prerequisites as JSON, readable by from_file."""
+        with open(path, 'w') as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+
+    def to_dict(self):
+        """Skill name to direct prerequisite names, for skills that have any."""
+        return {
+            self.skills[skill_id]: [self.skills[prerequisite] for prerequisite in direct]
+            for skill_id, direct in enumerate(self._direct) if direct
+        }
+
+    def skill_id(self, skill):
+        """Id of a skill, or None if the skill is unknown."""
+        return self._ids.get(skill.lower())
+
+    def add_skill(self, skill):
+        """
+        Add a skill without prerequisites if it is not in the graph yet.
+
+        Returns:
+            int: Id of the skill
+        """
+        key = skill.lower()
+        if key not in self._ids:
+            self._ids[key] = len(self.skills)
+            self.skills.append(skill)
+            self._direct.append([])
+            self._ancestors.append(0)
+            self._descendants.append(0)
+            self._order = None
+            self.version += 1
+        return self._ids[key]
+
+    def add_edge(self, skill, prerequisite):
+        """
+        Record that prerequisite must be learned before skill.
+
+        Args:
+            skill (str): Dependent skill
+            prerequisite (str): Skill it requires
+
+        Raises:
+            ValueError: If the edge would create a cycle
+        """
+        skill_id = self.add_skill(skill)
+        prerequisite_id = self.add_skill(prerequisite)
+        if prerequisite_id in self._direct[skill_id]:
+            return
+        if skill_id == prerequisite_id or self._ancestors[prerequisite_id] >> skill_id & 1:
+            raise ValueError(f"Prerequisite '{prerequisite}' of '{skill}' would create a cycle")
+
+        self._direct[skill_id].append(prerequisite_id)
+        # Everything at or below skill gains everything at or above prerequisite
+        gained_ancestors = self._ancestors[prerequisite_id] | 1 << prerequisite_id
+        gained_descendants = self._descendants[skill_id] | 1 << skill_id
+        for dependent in _bits(gained_descendants):
+            self._ancestors[dependent] |= gained_ancestors
+        for ancestor in _bits(gained_ancestors):
+            self._descendants[ancestor] |= gained_descendants
+        self._order = None
+        self.version += 1
+
+    def direct_prerequisites(self, skill):
+        """Direct prerequisites of a skill in the order they were added."""
+        skill_id = self.skill_id(skill)
+        if skill_id is None:
+            return []
+        return [self.skills[prerequisite] for prerequisite in self._direct[skill_id]]
+
+    def prerequisites(self, skill):
+        """All transitive prerequisites of a skill, in topological order."""
+        skill_id = self.skill_id(skill)
+        return [] if skill_id is None else self._names(self._ancestors[skill_id])
+
+    def dependents(self, skill):
+        """All skills that transitively require a skill, in topological order."""
+        skill_id = self.skill_id(skill)
+        return [] if skill_id is None else self._names(self._descendants[skill_id])
+
+    def is_prerequisite(self, prerequisite, skill):
+        """Whether prerequisite is a direct or transitive prerequisite of skill."""
+        prerequisite_id = self.skill_id(prerequisite)
+        skill_id = self.skill_id(skill)
+        if prerequisite_id is None or skill_id is None:
+            return False
+        return bool(self._ancestors[skill_id] >> prerequisite_id & 1)
+
+    def prerequisite_mask(self, skills):
+        """Bitset of the skills and all their transitive prerequisites."""
+        mask = 0
+        for skill in skills:
+            skill_id = self.skill_id(skill)
+            if skill_id is not None:
+                mask |= self._ancestors[skill_id] | 1 << skill_id
+        return mask
+
+    @property
+    def topological_order(self):
+        """Skill ids with every prerequisite before its dependents."""
+        return self._topological_positions()[0]
+
+    def _topological_positions(self):
+        """
+        Topological order and each skill's position in it, rebuilt after edits.
+
+        Raises:
+            ValueError: If the prerequisites contain a cycle
+        """
+        if self._order is None:
+            # Kahn's algorithm; ties keep id order
+            pending = [len(direct) for direct in self._direct]
+            dependents = [[] for _ in self.skills]
+            for skill_id, direct in enumerate(self._direct):
+                for prerequisite in direct:
+                    dependents[prerequisite].append(skill_id)
+            order = [skill_id for skill_id, count in enumerate(pending) if count == 0]
+            for skill_id in order:
+                for dependent in dependents[skill_id]:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        order.append(dependent)
+            if len(order) < len(self.skills):
+                # Skills on or behind a cycle never become ready
+                cyclic = sorted(set(range(len(self.skills))) - set(order))
+                raise ValueError(
+                    f"Prerequisite cycle among: {', '.join(self.skills[skill_id] for skill_id in cyclic)}"
+                )
+            positions = [0] * len(order)
+            for position, skill_id in enumerate(order):
+                positions[skill_id] = position
+            self._order = (order, positions)
+        return self._order
+
+    def _names(self, mask):
+        positions = self._topological_positions()[1]
+        return [self.skills[skill_id] for skill_id in sorted(_bits(mask), key=positions.__getitem__)]
+
+    def __len__(self):
+        return len(self.skills)
+
+    def __contains__(self, skill):
+        return skill.lower() in self._ids
@@ -0,0 +1,268 @@
+from bisect import bisect_left
+from collections import deque, namedtuple
+
+SkillMatch = namedtuple('SkillMatch', ['skill', 'category', 'start', 'end'])
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """
+    Multi-pattern skill matcher built on an Aho-Corasick automaton.
+
+    The automaton is compiled once from a skill taxonomy and then finds every
+    skill, with its character offsets, in a single left-to-right scan of the
+    text. Matching is case-insensitive and, by default, respects word
+    boundaries so that 'Go' does not match inside 'Google' while 'C++' and
+    'Node.js' still match next to punctuation.
+    """
+
+    def __init__(self, taxonomy, word_boundaries=True):
+        """
+        Build the matcher.
+
+        Args:
+            taxonomy (dict or iterable): Either a mapping of category to a list
+                of skills, or a flat iterable of skills (category is None)
+            word_boundaries (bool): Only report matches that start and end on
+                a word boundary
+        """
+        self.word_boundaries = word_boundaries
+        self.patterns = []
+
+        # Trie nodes: goto transitions, failure links and pattern outputs
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        items = taxonomy.items() if isinstance(taxonomy, dict) else [(None, taxonomy)]
+        for category, skills in items:
+            for skill in skills:
+                self._add_pattern(skill, category)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, skill, category):
+        """Insert a skill into the trie."""
+        keyword = self._normalize(skill)
+        if not keyword:
+            return
+
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+
+        self._output[node].append(len(self.patterns))
+        self.patterns.append((skill, category, len(keyword)))
+
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    @staticmethod
+    def _normalize(text):
+        """Lowercase text without changing its length so offsets stay valid."""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return ''.join(
+            char.lower() if len(char.lower()) == 1 else char
+            for char in text
+        )
+
+    def _on_boundary(self, text, start, end):
+        """Check that a match is not glued to surrounding word characters."""
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def _scan(self, text):
+        """Yield (pattern_id, start, end) for every occurrence in one pass."""
+        lowered = self._normalize(text)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+        node = 0
+
+        for position, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            for pattern_id in output[node]:
+                end = position + 1
+                start = end - patterns[pattern_id][2]
+                if self.word_boundaries and not self._on_boundary(lowered, start, end):
+                    continue
+                yield pattern_id, start, end
+
+    def iter_matches(self, text):
+        """
+        Scan text once and yield every skill occurrence.
+
+        Args:
+            text (str): Text to scan
+
+        Yields:
+            SkillMatch: Matches in order of their end offset
+        """
+        for pattern_id, start, end in self._scan(text):
+            skill, category, _ = self.patterns[pattern_id]
+            yield SkillMatch(skill, category, start, end)
+
+    def find_all(self, text):
+        """
+        Find every skill occurrence in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            list: SkillMatch tuples sorted by start offset
+        """
+        return sorted(self.iter_matches(text), key=lambda match: (match.start, match.end))
+
+    def find_skills(self, text):
+        """
+        Find the distinct skills present in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            list: (skill, category) tuples in taxonomy order
+        """
+        pattern_ids = sorted({pattern_id for pattern_id, _, _ in self._scan(text)})
+        return [self.patterns[pattern_id][:2] for pattern_id in pattern_ids]
+
+    def index(self, text):
+        """
+        Scan the text once and build a mention index over it.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            SkillMentionIndex: Counts and offsets of every skill found
+        """
+        return SkillMentionIndex(self.patterns, self._scan(text))
+
+    def __len__(self):
+        return len(self.patterns)
+
+
+class SkillMentionIndex:
+    """
+    Per-document index of skill mentions.
+
+    Maps each normalized skill name, single- or multi-token, to its mention
+    offsets so that counts and positions are dictionary lookups, and keeps
+    the mentions sorted by offset so that the skills inside any character
+    range can be found with a binary search instead of a rescan.
+    """
+
+    def __init__(self, patterns, occurrences):
+        """
+        Build the index.
+
+        Args:
+            patterns (list): Pattern table of the matcher that produced the
+                occurrences
+            occurrences (iterable): (pattern_id, start, end) tuples
+        """
+        self._patterns = patterns
+        self._positions = {}
+        self._mentions = sorted(
+            (start, end, pattern_id) for pattern_id, start, end in occurrences
+        )
+        self._starts = [start for start, _, _ in self._mentions]
+
+        for start, end, pattern_id in self._mentions:
+            positions = self._positions.setdefault(patterns[pattern_id][0].lower(), [])
+            # The same keyword listed under several categories matches once
+            if not positions or positions[-1] != (start, end):
+                positions.append((start, end))
+
+    @classmethod
+    def merge(cls, patterns, parts):
+        """
+        Combine the indexes of consecutive blocks of one document.
+
+        Args:
+            patterns (list): Pattern table shared by the block indexes
+            parts (list): (SkillMentionIndex, character offset of the block)
+
+        Returns:
+            SkillMentionIndex: Index over the whole document
+        """
+        return cls(patterns, (
+            (pattern_id, start + offset, end + offset)
+            for index, offset in parts
+            for start, end, pattern_id in index._mentions
+        ))
+
+    def count(self, skill):
+        """Number of times a skill is mentioned."""
+        return len(self._positions.get(skill.lower(), ()))
+
+    def positions(self, skill):
+        """Character offsets of every mention of a skill."""
+        return list(self._positions.get(skill.lower(), ()))
+
+    def skills(self):
+        """
+        Distinct skills mentioned in the document.
+
+        Returns:
+            list: (skill, category) tuples in taxonomy order
+        """
+        pattern_ids = sorted({pattern_id for _, _, pattern_id in self._mentions})
+        return [self._patterns[pattern_id][:2] for pattern_id in pattern_ids]
+
+    def skills_between(self, start, end):
+        """
+        Distinct skills mentioned entirely within a character range.
+
+        Args:
+            start (int): Range start offset
+            end (int): Range end offset (exclusive)
+
+        Returns:
+            list: (skill, category) tuples in taxonomy order
+        """
+        pattern_ids = set()
+        position = bisect_left(self._starts, start)
+        while position < len(self._mentions) and self._mentions[position][0] < end:
+            _, mention_end, pattern_id = self._mentions[position]
+            if mention_end <= end:
+                pattern_ids.add(pattern_id)
+            position += 1
+        return [self._patterns[pattern_id][:2] for pattern_id in sorted(pattern_ids)]
+
+    def __contains__(self, skill):
+        return skill.lower() in self._positions
+
+    def __len__(self):
+        return len(self._mentions)
@@ -0,0 +1,301 @@
+import csv
+import glob
+import hashlib
+import os
+
+import numpy as np
+
+# Grid searched per skill: level smoothing, trend smoothing, trend damping
+ALPHAS = np.linspace(0.1, 0.9, 9)
+BETAS = np.array([0.05, 0.1, 0.2, 0.3, 0.5])
+PHIS = np.array([0.8, 0.9, 0.98])
+
+# Parameters of skills with too little history to fit
+DEFAULT_PARAMETERS = (0.5, 0.1, 0.9)
+
+_STATE_ARRAYS = ['alpha', 'beta', 'phi', 'level', 'trend', 'sse', 'n_errors', 'n_obs']
+
+
+def read_trend_files(paths):
+    """
+    Read wide skill trend CSVs into one month x skill matrix.
+
+    Each file has a 'month' column followed by one demand column per skill;
+    empty cells are missing values. Months are merged across files in the
+    order they first appear.
+
+    Returns:
+        tuple: (months, skills, float64 matrix with NaN for missing values)
+    """
+    months = {}
+    skills = {}
+    cells = []
+    for path in paths:
+        with open(path, newline='') as handle:
+            for record in csv.DictReader(handle):
+                month = months.setdefault(record.pop('month'), len(months))
+                for skill, value in record.items():
+                    if value not in (None, ''):
+                        cells.append((month, skills.setdefault(skill, len(skills)), float(value)))
+
+    history = np.full((len(months), len(skills)), np.nan)
+    for month, skill, value in cells:
+        history[month, skill] = value
+    return list(months), list(skills), history
+
+
+class SkillTrendForecaster:
+    """
+    Damped-trend exponential smoothing fitted for every skill at once.
+
+    Each skill's demand series follows Holt's linear method with a damped
+    trend. The smoothing parameters are chosen per skill from a grid, with
+    every grid point and skill evaluated together as arrays, so fitting
+    costs one pass over the months. Only the fitted parameters and the
+    current level and trend are needed to forecast, which makes a
+    prediction O(1) per skill. New months advance the state with the
+    cached parameters instead of refitting; refit re-estimates the
+    parameters of selected skills from the kept history.
+    """
+
+    def __init__(self, months, skills, history):
+        """
+        Fit the models.
+
+        Args:
+            months (list): Label of each history row, oldest first
+            skills (list): Skill of each history column
+            history (np.ndarray): months x skills demand, NaN where missing
+        """
+        self.months = list(months)
+        self.skills = list(skills)
+        self.history = np.asarray(history, dtype=np.float64).reshape(len(self.months), len(self.skills))
+        self._columns = {skill.lower(): column for column, skill in enumerate(self.skills)}
+        self.digest = None
+        self._set_state(self._fit(self.history))
+
+    @classmethod
+    def from_directory(cls, directory, cache_path=None, pattern='*trends.csv'):
+        """
+        Fit on the trend CSVs of a directory, reusing cached parameters.
+
+        Args:
+            directory (str): Directory holding the trend files
+            cache_path (str, optional): .npz file with fitted parameters;
+                used if it was fitted on the same files, rewritten otherwise
+            pattern (str): File name pattern of the trend files
+
+        Returns:
+            SkillTrendForecaster: The fitted forecaster
+        """
+        paths = sorted(glob.glob(os.path.join(directory, pattern)))
+        digest = hashlib.sha256()
+        for path in paths:
+            with open(path, 'rb') as handle:
+                digest.update(handle.read())
+        digest = digest.hexdigest()
+
+        if cache_path and os.path.exists(cache_path):
+            forecaster = cls.load(cache_path)
+            if forecaster.digest == digest:
+                return forecaster
+
+        forecaster = cls(*read_trend_files(paths))
+        forecaster.digest = digest
+        if cache_path:
+            try:
+                forecaster.save(cache_path)
+            except OSError:
+                pass
+        return forecaster
+
+    def _fit(self, history):
+        """
+        Choose parameters per skill and run the series to their last state.
+
+        Returns:
+            dict: Per-skill arrays named as in _STATE_ARRAYS
+        """
+        grid = np.array([
+            (alpha, beta, phi) for alpha in ALPHAS for beta in BETAS for phi in PHIS
+        ])
+        # Grid points x skills, plus the default parameters as the last row
+        parameters = np.vstack([grid, DEFAULT_PARAMETERS])
+        shape = (len(parameters), history.shape[1])
+        alpha, beta, phi = (np.broadcast_to(parameters[:, [index]], shape) for index in range(3))
+        state = {
+            'alpha': alpha, 'beta': beta, 'phi': phi,
+            'level': np.zeros(shape), 'trend': np.zeros(shape), 'sse': np.zeros(shape),
+            'n_errors': np.zeros(shape, dtype=np.int64), 'n_obs': np.zeros(shape, dtype=np.int64)
+        }
+        for values in history:
+            self._step(state, np.broadcast_to(values, shape))
+
+        # Best grid point per skill; skills without errors to compare keep the defaults
+        best = np.argmin(state['sse'][:-1], axis=0)
+        best = np.where(state['n_errors'][-1] > 0, best, len(parameters) - 1)
+        columns = np.arange(history.shape[1])
+        return {name: np.array(state[name][best, columns]) for name in _STATE_ARRAYS}
+
+    @staticmethod
+    def _step(state, values):
+        """Advance the smoothing state by one month, in place."""
+        observed = ~np.isnan(values)
+        values = np.where(observed, values, 0.0)
+        level, trend, phi = state['level'], state['trend'], state['phi']
+
+        first = observed & (state['n_obs'] == 0)
+        second = observed & (state['n_obs'] == 1)
+        later = observed & (state['n_obs'] >= 2)
+
+        forecast = level + phi * trend
+        error = np.where(later, values - forecast, 0.0)
+        new_level = np.where(later, forecast + state['alpha'] * error, forecast)
+        new_trend = np.where(later, phi * trend + state['alpha'] * state['beta'] * error, phi * trend)
+
+        # The first two observations initialize the level and the trend
+        new_trend = np.where(second, values - level, new_trend)
+        new_level = np.where(first | second, values, new_level)
+        # Skills without any observation yet stay empty
+        empty = state['n_obs'] == 0
+        state['level'] = np.where(empty & ~observed, 0.0, new_level)
+        state['trend'] = np.where(empty & ~observed, 0.0, new_trend)
+
+        state['sse'] = state['sse'] + error ** 2
+        state['n_errors'] = state['n_errors'] + later
+        state['n_obs'] = state['n_obs'] + observed
+
+    def _set_state(self, state):
+        for name in _STATE_ARRAYS:
+            setattr(self, name, np.array(state[name]))
+
+    def update(self, month, values):
+        """
+        Add a month of data, advancing every skill with its cached parameters.
+
+        Skills missing from values advance on their trend alone; new skills
+        start a series with the default parameters.
+
+        Args:
+            month (str): Label of the new month
+            values (dict): Skill name to demand value
+        """
+        for skill in values:
+            if skill.lower() not in self._columns:
+                self._add_skill(skill)
+
+        row = np.full(len(self.skills), np.nan)
+        for skill, value in values.items():
+            row[self._columns[skill.lower()]] = value
+
+        state = {name: getattr(self, name) for name in _STATE_ARRAYS}
+        self._step(state, row)
+        self._set_state(state)
+        self.months.append(month)
+        self.history = np.vstack([self.history, row])
+        self.digest = None
+
+    def _add_skill(self, skill):
+        self._columns[skill.lower()] = len(self.skills)
+        self.skills.append(skill)
+        self.history = np.hstack([self.history, np.full((len(self.months), 1), np.nan)])
+        defaults = dict(zip(('alpha', 'beta', 'phi'), DEFAULT_PARAMETERS))
+        for name in _STATE_ARRAYS:
+            value = defaults.get(name, 0)
+            setattr(self, name, np.append(getattr(self, name), value))
+
+    def refit(self, skills=None):
+        """
+        Re-estimate the parameters of some skills from their history.
+
+        Args:
+            skills (list, optional): Skills to refit, all if None
+        """
+        if skills is None:
+            columns = np.arange(len(self.skills))
+        else:
+            columns = np.array([self._columns[skill.lower()] for skill in skills], dtype=np.intp)
+        fitted = self._fit(self.history[:, columns])
+        for name in _STATE_ARRAYS:
+            getattr(self, name)[columns] = fitted[name]
+
+    def forecast(self, skills, horizon):
+        """
+        Forecast demand several months ahead.
+
+        Args:
+            skills (list): Skill names
+            horizon (int): Months ahead
+
+        Returns:
+            np.ndarray: Forecast per skill, NaN for unknown skills
+        """
+        columns, known = self._lookup(skills)
+        forecasts = np.full(len(columns), np.nan)
+        phi = self.phi[columns[known]]
+        damping = phi * (1 - phi ** horizon) / (1 - phi)
+        forecasts[known] = self.level[columns[known]] + self.trend[columns[known]] * damping
+        return forecasts
+
+    def predict_growth(self, skills, horizon):
+        """
+        Expected demand growth and a confidence score per skill.
+
+        Growth is the forecast change in percent of the current level.
+        Confidence falls with the in-sample one-step error relative to the
+        level, widened by the square root of the horizon.
+
+        Returns:
+            tuple: (growth percentages, confidences in [0, 1]); NaN growth
+                and zero confidence for unknown skills
+        """
+        columns, known = self._lookup(skills)
+        level = np.abs(self.level[columns])
+        forecasts = self.forecast(skills, horizon)
+
+        growth = np.full(len(columns), np.nan)
+        nonzero = known & (level > 0)
+        growth[nonzero] = (forecasts[nonzero] - self.level[columns[nonzero]]) / level[nonzero] * 100
+
+        n_errors = self.n_errors[columns]
+        rmse = np.sqrt(self.sse[columns] / np.maximum(n_errors, 1))
+        confidence = np.zeros(len(columns))
+        fitted = nonzero & (n_errors > 0)
+        confidence[fitted] = np.clip(
+            1 - rmse[fitted] * np.sqrt(horizon) / level[fitted], 0.0, 1.0
+        )
+        return growth, confidence
+
+    def _lookup(self, skills):
+        columns = np.array([self._columns.get(skill.lower(), -1) for skill in skills], dtype=np.intp)
+        known = columns >= 0
+        return np.where(known, columns, 0), known
+
+    def save(self, path):
+        """Write the history and fitted state to an .npz file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        np.savez(
+            path,
+            months=np.array(self.months, dtype=str),
+            skills=np.array(self.skills, dtype=str),
+            history=self.history,
+            digest=np.array(self.digest or ''),
+            **{name: getattr(self, name) for name in _STATE_ARRAYS}
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Load a forecaster written by save without refitting."""
+        with np.load(path) as data:
+            forecaster = cls.__new__(cls)
+            forecaster.months = data['months'].tolist()
+            forecaster.skills = data['skills'].tolist()
+            forecaster.history = data['history'].reshape(len(forecaster.months), len(forecaster.skills))
+            forecaster._columns = {skill.lower(): column for column, skill in enumerate(forecaster.skills)}
+            forecaster.digest = str(data['digest']) or None
+            forecaster._set_state({name: data[name] for name in _STATE_ARRAYS})
+        return forecaster
+
+    def __len__(self):
+        return len(self.skills)
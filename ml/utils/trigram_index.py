@@ -0,0 +1,149 @@
+import math
+import re
+
+import numpy as np
+
+# Title abbreviations expanded before indexing and lookup
+ABBREVIATIONS = {
+    'sr': 'senior',
+    'jr': 'junior',
+    'eng': 'engineer',
+    'engr': 'engineer',
+    'dev': 'developer',
+    'mgr': 'manager',
+    'sw': 'software'
+}
+
+_NON_WORD = re.compile(r'[^a-z0-9+#]+')
+
+
+def normalize_title(title):
+    """Lowercase a title, drop punctuation and expand common abbreviations."""
+    words = _NON_WORD.sub(' ', title.lower()).split()
+    return ' '.join(ABBREVIATIONS.get(word, word) for word in words)
+
+
+def trigrams(text):
+    """
+    Distinct character trigrams of a normalized text.
+
+    Each word is padded with two leading blanks and one trailing blank, so
+    short words and word starts still produce trigrams.
+    """
+    grams = set()
+    for word in text.split():
+        padded = f'  {word} '
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """
+    Character-trigram inverted index for fuzzy title lookup.
+
+    Titles are normalized and split into character trigrams. Each trigram
+    maps to the ids of the titles containing it, stored in CSR form, so a
+    fuzzy query only touches the postings of its own trigrams and counts
+    the shared trigrams of every title with a single bincount. Similarity
+    is the Dice coefficient of the trigram sets, which tolerates typos and
+    extra words such as "Sr. Data Sceintist" against "Data Scientist".
+    Exact matches after normalization are answered from a dict.
+    """
+
+    def __init__(self, titles):
+        """
+        Build the index.
+
+        Args:
+            titles (iterable): Titles to index; ids follow this order
+        """
+        self.titles = list(titles)
+        self._exact = {}
+        vocabulary = {}
+        entries = ([], [])
+        counts = []
+        for title_id, title in enumerate(self.titles):
+            normalized = normalize_title(title)
+            self._exact.setdefault(normalized, title_id)
+            grams = trigrams(normalized)
+            counts.append(len(grams))
+            for gram in grams:
+                entries[0].append(vocabulary.setdefault(gram, len(vocabulary)))
+                entries[1].append(title_id)
+
+        self._vocabulary = vocabulary
+        self.trigram_counts = np.array(counts, dtype=np.int32)
+        grams = np.array(entries[0], dtype=np.int32)
+        order = np.argsort(grams, kind='stable')
+        self.postings = np.array(entries[1], dtype=np.int32)[order]
+        self.indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(grams, minlength=len(vocabulary)), out=self.indptr[1:])
+
+    def lookup(self, title):
+        """
+        Indexed title equal to a title after normalization.
+
+        Returns:
+            str: The indexed title, or None if there is no exact match
+        """
+        title_id = self._exact.get(normalize_title(title))
+        return None if title_id is None else self.titles[title_id]
+
+    def scores(self, title, min_similarity=0.0):
+        """
+        Dice similarity of a title to the indexed titles that can reach a threshold.
+
+        The postings of the query's trigrams are counted with one bincount.
+        A title sharing s of the query's q trigrams has a Dice similarity of
+        at most 2s / (q + s), so titles with too few shared trigrams are
+        dropped on the integer counts before any similarity is computed.
+
+        Args:
+            title (str): Title to look up
+            min_similarity (float): Titles below this similarity may be left
+                out; titles sharing no trigram always are
+
+        Returns:
+            tuple: (title ids ascending, their similarities)
+        """
+        query = trigrams(normalize_title(title))
+        gram_ids = [self._vocabulary[gram] for gram in query if gram in self._vocabulary]
+        if not gram_ids:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float64)
+
+        postings = np.concatenate([self.postings[self.indptr[gram]:self.indptr[gram + 1]] for gram in gram_ids])
+        shared = np.bincount(postings, minlength=len(self.titles))
+        min_shared = max(1, math.ceil(min_similarity * len(query) / (2 - min_similarity) - 1e-9))
+        candidates = np.flatnonzero(shared >= min_shared)
+        return candidates, 2.0 * shared[candidates] / (len(query) + self.trigram_counts[candidates])
+
+    def search(self, title, limit=10, min_similarity=0.3):
+        """
+        Indexed titles most similar to a title.
+
+        Titles equal after normalization have similarity 1. Ties keep the
+        order in which titles were indexed.
+
+        Args:
+            title (str): Title to look up
+            limit (int): Maximum number of results
+            min_similarity (float): Titles below this similarity are left out
+
+        Returns:
+            list: (title, similarity) tuples, most similar first
+        """
+        if limit <= 0:
+            return []
+        candidates, scores = self.scores(title, min_similarity)
+        keep = scores >= min_similarity
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > limit:
+            # Keep every title tied with the limit-th best so the stable order holds
+            threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            keep = scores >= threshold
+            candidates, scores = candidates[keep], scores[keep]
+        order = np.lexsort((candidates, -scores))[:limit]
+        return [(self.titles[title_id], float(score)) for title_id, score in zip(candidates[order], scores[order])]
+
+    def __len__(self):
+        return len(self.titles)
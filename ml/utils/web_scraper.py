@@ -7,6 +7,23 @@ import logging
 from datetime import datetime
 from urllib.parse import urljoin
 import json
+from .skill_matcher import SkillMatcher
+
+# Technical skills by category and soft skills to look for in descriptions
+TECH_SKILLS = {
+    'languages': ['python', 'java', 'javascript', 'c++', 'ruby', 'php'],
+    'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring'],
+    'databases': ['sql', 'mongodb', 'postgresql', 'mysql', 'oracle'],
+    'tools': ['git', 'docker', 'kubernetes', 'jenkins', 'aws', 'azure']
+}
+
+SOFT_SKILLS = [
+    'communication',
+    'leadership',
+    'problem solving',
+    'teamwork',
+    'time management'
+]
 
 class JobSkillScraper:
     def __init__(self):
@@ -29,6 +46,9 @@ class JobSkillScraper:
         self.jobs_data = []
         self.skills_data = []
 
+        # Compile the skill keywords once for all descriptions
+        self.skill_matcher = SkillMatcher({**TECH_SKILLS, 'soft': SOFT_SKILLS})
+
     def scrape_linkedin_jobs(self, keywords, locations, max_pages=10):
         """
         Scrape job listings from LinkedIn
@@ -171,47 +191,18 @@ class JobSkillScraper:
         Extract skills from job description using keyword matching and NLP
         """
         try:
-            # Common technical skills to look for
-            tech_skills = {
-                'languages': ['python', 'java', 'javascript', 'c++', 'ruby', 'php'],
-                'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring'],
-                'databases': ['sql', 'mongodb', 'postgresql', 'mysql', 'oracle'],
-                'tools': ['git', 'docker', 'kubernetes', 'jenkins', 'aws', 'azure']
-            }
-
-            # Common soft skills to look for
-            soft_skills = [
-                'communication',
-                'leadership',
-                'problem solving',
-                'teamwork',
-                'time management'
-            ]
-
             found_skills = {
                 'technical': [],
                 'soft': []
             }
 
-            # Convert description to lowercase for matching
-            desc_lower = description.lower()
-
-            # Extract technical skills
-            for category, skills in tech_skills.items():
-                for skill in skills:
-                    if skill in desc_lower:
-                        found_skills['technical'].append({
-                            'skill': skill,
-                            'category': category
-                        })
-
-            # Extract soft skills
-            for skill in soft_skills:
-                if skill in desc_lower:
-                    found_skills['soft'].append({
-                        'skill': skill,
-                        'category': 'soft'
-                    })
+            # Extract technical and soft skills in a single scan
+            for skill, category in self.skill_matcher.find_skills(description):
+                group = 'soft' if category == 'soft' else 'technical'
+                found_skills[group].append({
+                    'skill': skill,
+                    'category': category
+                })
 
             return found_skills
 